@@ -0,0 +1,305 @@
+"""On-disk caches used to skip repeated work across runs."""
+
+import os
+import json
+import uuid
+import pickle
+import hashlib
+import logging
+import pandas as pd
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class LoadCache:
+    """
+    Persistent cache of loaded, dtype-optimized DataFrames stored as Parquet
+
+    Entries are keyed by the source file's resolved path, size, modification
+    time and content hash, plus the load options. The directory is bounded
+    in size; the least recently used entries are evicted first.
+    """
+
+    SUFFIX = '.parquet'
+
+    def __init__(self, cache_dir: Union[str, Path], max_bytes: int = 2 * 1024**3):
+        """
+        Initialize load cache
+
+        Args:
+            cache_dir: Directory holding the cached Parquet files
+            max_bytes: Maximum total size of the cache directory
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def key(self, file_path: Union[str, Path], options: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build the cache key for a source file and load options
+
+        Args:
+            file_path: Path to the source file
+            options: Load options that change the resulting DataFrame
+
+        Returns:
+            Hex digest identifying the cache entry
+        """
+        file_path = Path(file_path).resolve()
+        stat = file_path.stat()
+
+        content_hash = hashlib.blake2b(digest_size=16)
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                content_hash.update(block)
+
+        payload = json.dumps({
+            'path': str(file_path),
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+            'content': content_hash.hexdigest(),
+            'options': options or {}
+        }, sort_keys=True, default=repr)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str, dtype_backend: str = 'numpy') -> Optional[pd.DataFrame]:
+        """Return the cached DataFrame for `key`, or None on a miss"""
+        entry = self._entry_path(key)
+        if not entry.exists():
+            return None
+        try:
+            if dtype_backend == 'pyarrow':
+                df = pd.read_parquet(entry, dtype_backend='pyarrow')
+            else:
+                df = pd.read_parquet(entry)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {entry}: {e}")
+            entry.unlink(missing_ok=True)
+            return None
+        # Touch the entry so eviction sees it as recently used
+        os.utime(entry)
+        return df
+
+    def put(self, key: str, df: pd.DataFrame) -> bool:
+        """
+        Store a DataFrame under `key` and evict old entries if needed
+
+        Returns:
+            True if the DataFrame was cached, False if it could not be
+            written as Parquet (e.g. mixed-type object columns)
+        """
+        entry = self._entry_path(key)
+        tmp_path = entry.with_name(f".{entry.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            df.to_parquet(tmp_path)
+            # Atomic so concurrent loaders never see a partial file
+            os.replace(tmp_path, entry)
+        except Exception as e:
+            logger.warning(f"Could not cache DataFrame: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return False
+
+        self._evict()
+        return True
+
+    def clear(self):
+        """Remove all cache entries"""
+        for entry in self.cache_dir.glob(f"*{self.SUFFIX}"):
+            entry.unlink(missing_ok=True)
+
+    def _entry_path(self, key: str) -> Path:
+        """Path of the cache file for `key`"""
+        return self.cache_dir / f"{key}{self.SUFFIX}"
+
+    def _evict(self):
+        """Delete least recently used entries until the cache fits max_bytes"""
+        _evict_lru(self.cache_dir, self.SUFFIX, self.max_bytes)
+
+
+class ResultCache:
+    """
+    Persistent cache of test results and figures, stored as pickles
+
+    Entries are keyed by the content hashes of the columns a result was
+    computed from (see ColumnStore.content_hash), so a rerun recomputes only
+    the results involving changed data. The directory is bounded in size;
+    the least recently used entries are evicted first. Entries are pickles,
+    so only point this at a directory you trust.
+    """
+
+    SUFFIX = '.pkl'
+
+    def __init__(self, cache_dir: Union[str, Path], max_bytes: int = 512 * 1024**2):
+        """
+        Initialize result cache
+
+        Args:
+            cache_dir: Directory holding the pickled entries
+            max_bytes: Maximum total size of the cache directory
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def key(self, *parts: Any) -> str:
+        """
+        Build the cache key for a result
+
+        Args:
+            *parts: JSON-serializable description of the result and the
+                content hashes of its inputs
+
+        Returns:
+            Hex digest identifying the cache entry
+        """
+        payload = json.dumps(parts, sort_keys=True, default=repr)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Any:
+        """Return the result stored under `key`, or None on a miss"""
+        entry = self._entry_path(key)
+        try:
+            with open(entry, 'rb') as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable result cache entry {entry}: {e}")
+            entry.unlink(missing_ok=True)
+            return None
+        # Touch the entry so eviction sees it as recently used
+        os.utime(entry)
+        return value
+
+    def put(self, key: str, value: Any):
+        """Store a result under `key` and evict old entries if needed"""
+        entry = self._entry_path(key)
+        tmp_path = entry.with_name(f".{entry.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            # Atomic so concurrent jobs never see a partial file
+            os.replace(tmp_path, entry)
+        except Exception as e:
+            logger.warning(f"Could not cache result: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        _evict_lru(self.cache_dir, self.SUFFIX, self.max_bytes)
+
+    def clear(self):
+        """Remove all cache entries"""
+        for entry in self.cache_dir.glob(f"*{self.SUFFIX}"):
+            entry.unlink(missing_ok=True)
+
+    def _entry_path(self, key: str) -> Path:
+        """Path of the cache file for `key`"""
+        return self.cache_dir / f"{key}{self.SUFFIX}"
+
+
+class MappingCache:
+    """
+    Persistent cache of resolved schema mappings stored as JSON
+
+    Entries are keyed by a hash of a column list and the fingerprint of the
+    schema mapping config, so editing the FieldMapping config invalidates
+    them. Each entry is a readable JSON file recording the rename map, which
+    renames came from fuzzy matching and the data type inferred per field,
+    so operators can audit the decisions.
+    """
+
+    SUFFIX = '.json'
+
+    def __init__(self, cache_dir: Union[str, Path]):
+        """
+        Initialize mapping cache
+
+        Args:
+            cache_dir: Directory holding the JSON entries
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def key(self, columns: List[str], config_fingerprint: str) -> str:
+        """
+        Build the cache key for a column list and mapping config
+
+        Args:
+            columns: Column names in order
+            config_fingerprint: Fingerprint of the mapping config
+
+        Returns:
+            Hex digest identifying the cache entry
+        """
+        payload = json.dumps({'columns': [str(col) for col in columns], 'config': config_fingerprint})
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the entry for `key`, or None on a miss"""
+        entry = self._entry_path(key)
+        try:
+            with open(entry) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable mapping cache entry {entry}: {e}")
+            entry.unlink(missing_ok=True)
+            return None
+
+    def put(self, key: str, entry: Dict[str, Any]):
+        """Store an entry under `key`"""
+        path = self._entry_path(key)
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(entry, f, indent=2, sort_keys=True)
+            # Atomic so concurrent jobs never see a partial file
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not cache schema mapping: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def update(self, key: str, **fields):
+        """Merge fields into an existing entry (no-op if it is missing)"""
+        entry = self.get(key)
+        if entry is not None:
+            entry.update(fields)
+            self.put(key, entry)
+
+    def entries(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over all entries, e.g. to audit fuzzy matches"""
+        for path in sorted(self.cache_dir.glob(f"*{self.SUFFIX}")):
+            entry = self.get(path.stem)
+            if entry is not None:
+                yield entry
+
+    def clear(self):
+        """Remove all cache entries"""
+        for entry in self.cache_dir.glob(f"*{self.SUFFIX}"):
+            entry.unlink(missing_ok=True)
+
+    def _entry_path(self, key: str) -> Path:
+        """Path of the cache file for `key`"""
+        return self.cache_dir / f"{key}{self.SUFFIX}"
+
+
+def _evict_lru(cache_dir: Path, suffix: str, max_bytes: int):
+    """Delete the least recently used entries of a cache directory until it fits max_bytes"""
+    entries = []
+    for entry in cache_dir.glob(f"*{suffix}"):
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, entry))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry in sorted(entries, key=lambda e: e[0]):
+        if total <= max_bytes:
+            break
+        entry.unlink(missing_ok=True)
+        total -= size
+        logger.debug(f"Evicted cache entry {entry}")
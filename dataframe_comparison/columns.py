@@ -0,0 +1,187 @@
+"""Per-comparison store of cleaned column arrays."""
+
+import hashlib
+import logging
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, Hashable, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class ColumnStore:
+    """
+    Cleaned column arrays of the datasets in one comparison
+
+    Each column is materialized at most once per dataset, on first use, as
+    a contiguous NaN-free array together with its null count. Tests, plots,
+    summary cards and the missing-data heatmap read from the store instead
+    of extracting and cleaning the columns themselves. Arrays are read-only
+    since they are shared between consumers.
+    """
+
+    # Rows hashed at a time when fingerprinting a column
+    HASH_CHUNK_ROWS = 1 << 20
+
+    # Evenly spaced rows compared before fingerprinting columns in full
+    PROBE_ROWS = 1000
+
+    def __init__(self, datasets: Dict[str, pd.DataFrame]):
+        """
+        Initialize column store
+
+        Args:
+            datasets: Dictionary mapping dataset names to DataFrames
+        """
+        self.datasets = datasets
+        self._numeric: Dict[Tuple[str, str], np.ndarray] = {}
+        self._values: Dict[Tuple[str, str], np.ndarray] = {}
+        self._null_counts: Dict[str, Dict[str, int]] = {name: {} for name in datasets}
+        self._hashes: Dict[Tuple[str, str], str] = {}
+
+    def numeric(self, name: str, column: str) -> np.ndarray:
+        """
+        Non-null values of a column as a float64 array
+
+        Columns read as text are parsed; values that are not numbers are
+        dropped with a warning.
+
+        Args:
+            name: Dataset name
+            column: Column name
+
+        Returns:
+            Contiguous, NaN-free float64 array
+        """
+        key = (name, column)
+        if key not in self._numeric:
+            series = self.datasets[name][column]
+            if not pd.api.types.is_numeric_dtype(series):
+                logger.warning(f"Field '{column}' is declared numeric but has dtype {series.dtype}; "
+                               f"non-numeric values are ignored")
+                series = pd.to_numeric(series, errors='coerce')
+            # Zero-copy for float64 columns; converts other dtypes once
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            missing = np.isnan(values)
+            n_missing = int(missing.sum())
+            values = values[~missing] if n_missing else np.ascontiguousarray(values)
+            values.flags.writeable = False
+            self._numeric[key] = values
+            if column not in self._null_counts[name] and pd.api.types.is_numeric_dtype(series.dtype):
+                self._null_counts[name][column] = n_missing
+        return self._numeric[key]
+
+    def values(self, name: str, column: str) -> np.ndarray:
+        """
+        Non-null values of a column in their own type (e.g. for categorical fields)
+
+        Args:
+            name: Dataset name
+            column: Column name
+
+        Returns:
+            Array of the non-null values
+        """
+        key = (name, column)
+        if key not in self._values:
+            series = self.datasets[name][column]
+            values = series.dropna().to_numpy()
+            values.flags.writeable = False
+            self._values[key] = values
+            self._null_counts[name].setdefault(column, len(series) - len(values))
+        return self._values[key]
+
+    def field(self, column: str, numeric: bool) -> Dict[str, np.ndarray]:
+        """Non-null values of a column in every dataset (see numeric and values)"""
+        read = self.numeric if numeric else self.values
+        return {name: read(name, column) for name in self.datasets}
+
+    def content_hash(self, name: str, column: str) -> str:
+        """
+        Hash of a column's dtype, values and nulls, in row order
+
+        Rows are hashed vectorized (pandas.util.hash_pandas_object) one
+        chunk of HASH_CHUNK_ROWS at a time and the chunk hashes digested,
+        so equal hashes mean identical columns, across datasets or across
+        runs. Used to key cached results (see ResultCache) and to skip
+        testing identical columns.
+
+        Args:
+            name: Dataset name
+            column: Column name
+
+        Returns:
+            Hex digest of the column content
+        """
+        key = (name, column)
+        if key not in self._hashes:
+            series = self.datasets[name][column]
+            digest = hashlib.blake2b(str(series.dtype).encode(), digest_size=16)
+            for start in range(0, len(series), self.HASH_CHUNK_ROWS):
+                chunk = series.iloc[start:start + self.HASH_CHUNK_ROWS]
+                try:
+                    row_hashes = pd.util.hash_pandas_object(chunk, index=False)
+                except TypeError:
+                    # Unhashable values such as lists from nested JSON
+                    row_hashes = pd.util.hash_pandas_object(chunk.astype(str), index=False)
+                digest.update(row_hashes.to_numpy().tobytes())
+            self._hashes[key] = digest.hexdigest()
+        return self._hashes[key]
+
+    def identical_groups(self, names: List[str], columns: List[str]) -> List[List[str]]:
+        """
+        Groups of two or more datasets whose columns have identical contents
+
+        Datasets are grouped by length and dtypes, then by a few evenly
+        spaced rows of each column, and only datasets still sharing a group
+        are fingerprinted in full (see content_hash), column by column. Most
+        differing datasets are told apart without reading whole columns.
+
+        Args:
+            names: Datasets to group, all having the columns
+            columns: Columns compared
+
+        Returns:
+            Groups of dataset names, in the order of names
+        """
+        groups = _split([list(names)], lambda name: (
+            len(self.datasets[name]), tuple(str(self.datasets[name][column].dtype) for column in columns)
+        ))
+        for fingerprint in (self._probe_hash, self.content_hash):
+            for column in columns:
+                groups = _split(groups, lambda name: fingerprint(name, column))
+        return groups
+
+    def _probe_hash(self, name: str, column: str) -> int:
+        """Hash of PROBE_ROWS evenly spaced values of a column"""
+        series = self.datasets[name][column]
+        positions = np.unique(np.linspace(0, len(series) - 1, min(len(series), self.PROBE_ROWS)).astype(np.int64))
+        probe = series.iloc[positions]
+        try:
+            row_hashes = pd.util.hash_pandas_object(probe, index=False)
+        except TypeError:
+            row_hashes = pd.util.hash_pandas_object(probe.astype(str), index=False)
+        return hash(row_hashes.to_numpy().tobytes())
+
+    def null_count(self, name: str, column: str) -> int:
+        """Number of missing values of a column in a dataset"""
+        counts = self._null_counts[name]
+        if column not in counts:
+            series = self.datasets[name][column]
+            counts[column] = len(series) - int(series.count())
+        return counts[column]
+
+    def null_counts(self, name: str) -> Dict[str, int]:
+        """Number of missing values of every column of a dataset"""
+        return {column: self.null_count(name, column) for column in self.datasets[name].columns}
+
+
+def _split(groups: List[List[str]], key: Callable[[str], Hashable]) -> List[List[str]]:
+    """Split groups by a key of their members, keeping groups of two or more"""
+    split = []
+    for group in groups:
+        by_key: Dict[Hashable, List[str]] = {}
+        for name in group:
+            by_key.setdefault(key(name), []).append(name)
+        split += [members for members in by_key.values() if len(members) > 1]
+    return split
@@ -0,0 +1,263 @@
+"""Transparent decompression of gzip, zstd and bzip2 inputs."""
+
+import io
+import bz2
+import gzip
+import mmap
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Compression suffixes recognized after a format suffix, e.g. events.csv.gz
+COMPRESSION_SUFFIXES = {'.gz': 'gzip', '.zst': 'zstd', '.bz2': 'bz2'}
+
+# Leading bytes identifying each compression format
+MAGIC_BYTES = {
+    b'\x1f\x8b': 'gzip',
+    b'\x28\xb5\x2f\xfd': 'zstd',
+    b'BZh': 'bz2'
+}
+
+ZSTD_FRAME_MAGIC = b'\x28\xb5\x2f\xfd'
+
+
+def detect_compression(file_path: Union[str, Path]) -> Optional[str]:
+    """
+    Detect the compression of a file from its suffix or magic bytes
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        'gzip', 'zstd', 'bz2' or None for uncompressed files
+    """
+    file_path = Path(file_path)
+    compression = COMPRESSION_SUFFIXES.get(file_path.suffix.lower())
+    if compression is not None:
+        return compression
+
+    if not file_path.is_file():
+        return None
+    with open(file_path, 'rb') as f:
+        header = f.read(4)
+    for magic, compression in MAGIC_BYTES.items():
+        if header.startswith(magic):
+            return compression
+    return None
+
+
+def strip_compression_suffix(file_path: Union[str, Path]) -> Path:
+    """Path without its compression suffix (events.csv.gz -> events.csv)"""
+    file_path = Path(file_path)
+    if file_path.suffix.lower() in COMPRESSION_SUFFIXES:
+        return file_path.with_suffix('')
+    return file_path
+
+
+def open_decompressed(file_path: Union[str, Path],
+                      compression: str,
+                      max_workers: int = 1) -> io.BufferedIOBase:
+    """
+    Open a compressed file as a binary stream of its decompressed content
+
+    Nothing is written to disk. zstd files made of several frames (as
+    written by pzstd or by concatenating .zst files) are decompressed
+    frame-parallel when max_workers > 1.
+
+    Args:
+        file_path: Path to the compressed file
+        compression: 'gzip', 'zstd' or 'bz2'
+        max_workers: Threads decompressing zstd frames concurrently
+
+    Returns:
+        Readable binary file object; the caller closes it
+    """
+    if compression == 'gzip':
+        return gzip.open(file_path, 'rb')
+    elif compression == 'bz2':
+        return bz2.open(file_path, 'rb')
+    elif compression == 'zstd':
+        return _open_zstd(Path(file_path), max_workers)
+    raise ValueError(f"Unsupported compression: {compression}")
+
+
+@contextmanager
+def open_source(file_path: Union[str, Path],
+                compression: Optional[str] = None,
+                seekable: bool = False,
+                text: bool = False,
+                max_workers: int = 1):
+    """
+    Context manager yielding something a reader can parse
+
+    Uncompressed files are yielded as their path so readers keep their own
+    fast paths; compressed files are yielded as a decompressing stream.
+
+    Args:
+        file_path: Path to the file
+        compression: Compression from detect_compression (None = uncompressed)
+        seekable: Decompress fully into memory for readers that need random
+            access (Parquet footers, Excel archives)
+        text: Yield a UTF-8 text stream instead of a binary one
+        max_workers: Threads decompressing zstd frames concurrently
+
+    Yields:
+        Path or file object
+    """
+    if compression is None:
+        if text:
+            with open(file_path, 'r') as f:
+                yield f
+        else:
+            yield file_path
+        return
+
+    with open_decompressed(file_path, compression, max_workers) as stream:
+        if seekable:
+            stream = io.BytesIO(stream.read())
+        if text:
+            stream = io.TextIOWrapper(stream, encoding='utf-8')
+        yield stream
+
+
+def _open_zstd(file_path: Path, max_workers: int) -> io.BufferedIOBase:
+    """Open a zstd file, decompressing independent frames in parallel if possible"""
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("Reading .zst files requires the zstandard package: pip install zstandard")
+
+    if max_workers > 1:
+        with open(file_path, 'rb') as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty file
+                mapped = None
+        if mapped is not None:
+            try:
+                frames = _zstd_frames(mapped)
+            except ValueError as e:
+                logger.debug(f"Falling back to sequential zstd decompression of {file_path}: {e}")
+                frames = []
+            if len(frames) > 1:
+                logger.debug(f"Decompressing {len(frames)} zstd frames of {file_path} "
+                             f"with {max_workers} threads")
+                return io.BufferedReader(_ParallelZstdReader(mapped, frames, max_workers))
+            mapped.close()
+
+    return zstandard.ZstdDecompressor().stream_reader(open(file_path, 'rb'), read_across_frames=True,
+                                                      closefd=True)
+
+
+def _zstd_frames(data) -> List[Tuple[int, int]]:
+    """
+    Locate the zstd frames in a buffer by walking frame and block headers
+
+    Only headers are parsed, so this is cheap compared to decompression.
+    Skippable frames are left out.
+
+    Returns:
+        List of (start, end) offsets of each data frame
+
+    Raises:
+        ValueError: If the buffer is not a well-formed sequence of frames
+    """
+    frames = []
+    pos = 0
+    size = len(data)
+    while pos < size:
+        magic = data[pos:pos + 4]
+        if len(magic) == 4 and magic[1:] == b'\x2a\x4d\x18' and magic[0] & 0xF0 == 0x50:
+            # Skippable frame: magic + 4-byte little-endian length
+            pos += 8 + int.from_bytes(data[pos + 4:pos + 8], 'little')
+            continue
+        if magic != ZSTD_FRAME_MAGIC:
+            raise ValueError(f"no zstd frame at offset {pos}")
+
+        start = pos
+        descriptor = data[pos + 4]
+        single_segment = descriptor & 0x20
+        content_size_flag = descriptor >> 6
+        pos += 5
+        pos += 0 if single_segment else 1  # window descriptor
+        pos += (0, 1, 2, 4)[descriptor & 0x03]  # dictionary ID
+        pos += (1 if single_segment else 0, 2, 4, 8)[content_size_flag]
+
+        while True:
+            if pos + 3 > size:
+                raise ValueError(f"truncated zstd frame at offset {start}")
+            header = int.from_bytes(data[pos:pos + 3], 'little')
+            last_block = header & 1
+            block_type = (header >> 1) & 0x03
+            block_size = header >> 3
+            if block_type == 3:
+                raise ValueError(f"reserved zstd block type at offset {pos}")
+            # RLE blocks store a single byte repeated block_size times
+            pos += 3 + (1 if block_type == 1 else block_size)
+            if last_block:
+                break
+
+        if descriptor & 0x04:
+            pos += 4  # content checksum
+        if pos > size:
+            raise ValueError(f"truncated zstd frame at offset {start}")
+        frames.append((start, pos))
+    return frames
+
+
+class _ParallelZstdReader(io.RawIOBase):
+    """Raw stream over zstd frames decompressed concurrently, in order"""
+
+    def __init__(self, mapped: mmap.mmap, frames: List[Tuple[int, int]], max_workers: int):
+        self._mapped = mapped
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._blocks = self._decompress(frames, max_workers)
+        self._buffer = memoryview(b'')
+
+    def _decompress(self, frames: List[Tuple[int, int]], max_workers: int) -> Iterator[bytes]:
+        """Yield decompressed frames in order, keeping a bounded number in flight"""
+        import zstandard
+
+        def decompress(start: int, end: int) -> bytes:
+            # zstandard releases the GIL while decompressing
+            return zstandard.ZstdDecompressor().decompressobj().decompress(self._mapped[start:end])
+
+        pending = deque()
+        frames = iter(frames)
+        for start, end in frames:
+            pending.append(self._executor.submit(decompress, start, end))
+            if len(pending) >= 2 * max_workers:
+                break
+        while pending:
+            block = pending.popleft().result()
+            for start, end in frames:
+                pending.append(self._executor.submit(decompress, start, end))
+                break
+            yield block
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._buffer:
+            block = next(self._blocks, None)
+            if block is None:
+                return 0
+            self._buffer = memoryview(block)
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+    def close(self):
+        if not self.closed:
+            self._blocks.close()
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._buffer = memoryview(b'')
+            self._mapped.close()
+        super().close()
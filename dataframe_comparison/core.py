@@ -3,10 +3,16 @@
 import logging
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Tuple, Union
+from .cache import ResultCache
+from .columns import ColumnStore
+from .data_loader import DataLoader, Shard
+from .profiling import DatasetProfile, ProfileConfig
 from .schema import DataType, FieldMapping, SchemaMapper
-from .statistics import StatisticalTester
-from .visualization import VisualizationEngine
+from .sharding import LocalShardExecutor, ShardExecutor, ShardTask, merge_profiles
+from .statistics import StatisticalTester, TestResult
+from .visualization import VisualizationEngine, numeric_columns
 from .reporting import HTMLReportGenerator
 
 # Configure logging
@@ -17,30 +23,62 @@ logger = logging.getLogger(__name__)
 class DataFrameComparison:
     """Main class for comparing multiple dataframes."""
     
-    def __init__(self, schema_config: Optional[List[FieldMapping]] = None):
+    def __init__(self,
+                 schema_config: Optional[List[FieldMapping]] = None,
+                 cache_dir: Optional[str] = None,
+                 max_workers: int = 1,
+                 executor: str = 'process',
+                 result_cache_dir: Optional[str] = None,
+                 fingerprint_columns: bool = True):
         """
         Initialize dataframe comparison engine.
         
         Args:
             schema_config: Optional list of FieldMapping objects for column standardization
+            cache_dir: Optional directory persisting resolved column mappings
+                and inferred field types across runs (see SchemaMapper)
+            max_workers: Number of fields analyzed concurrently (1 = serially)
+            executor: 'process' to analyze fields in worker processes, with
+                numeric columns handed over through shared memory, or
+                'thread' to use a thread pool
+            result_cache_dir: Optional directory caching test results and
+                figures by the content of their input columns, so reruns
+                only recompute what involves changed datasets (see
+                ResultCache)
+            fingerprint_columns: Hash each compared column so fields that
+                are identical in every dataset skip the comparison tests
+                and identical datasets are reported up front
         """
+        if executor not in ('process', 'thread'):
+            raise ValueError(f"Unsupported executor: {executor}")
+        self.max_workers = max_workers
+        self.executor = executor
         self.schema_config = schema_config or []
         self.schema_dict = {fm.standard_name: fm for fm in self.schema_config}
         
-        self.schema_mapper = SchemaMapper(self.schema_config)
+        self.schema_mapper = SchemaMapper(self.schema_config, cache_dir=cache_dir)
         self.statistical_tester = StatisticalTester()
         self.visualization_engine = VisualizationEngine()
         self.report_generator = HTMLReportGenerator()
+        self.result_cache = ResultCache(result_cache_dir) if result_cache_dir is not None else None
+        self.fingerprint_columns = fingerprint_columns
         
     def compare_datasets(self,
-                        datasets: Dict[str, pd.DataFrame],
+                        datasets: Dict[str, Union[pd.DataFrame, DatasetProfile]],
                         output_path: str = "comparison_report.html",
                         title: str = None) -> Dict[str, Any]:
         """
         Compare multiple datasets and generate report.
         
+        Datasets may also be given as DatasetProfiles, e.g. a baseline
+        snapshot from DatasetProfile.load. The DataFrames are then profiled
+        like the first snapshot and all datasets are compared by their
+        profiles (see compare_profiles), so the baseline's rows are never
+        loaded.
+        
         Args:
-            datasets: Dictionary mapping dataset names to DataFrames
+            datasets: Dictionary mapping dataset names to DataFrames or
+                DatasetProfiles
             output_path: Path to save the HTML report
             title: Optional title for the report
             
@@ -50,21 +88,27 @@ class DataFrameComparison:
         if not datasets:
             raise ValueError("No datasets provided for comparison")
             
+        if any(isinstance(df, DatasetProfile) for df in datasets.values()):
+            return self.compare_streams({
+                name: df if isinstance(df, DatasetProfile) else [df] for name, df in datasets.items()
+            }, output_path, title)
+            
         if title is None:
             title = f"Comparison of {len(datasets)} Datasets"
             
         logger.info(f"Starting comparison of {len(datasets)} datasets")
         
-        # Standardize datasets using schema mapper
+        # Standardize datasets using schema mapper; renamed datasets share
+        # their data with the originals (also in results['datasets']), so
+        # they are only read from here on
         standardized_datasets = {}
+        column_mappings = {}
         for name, df in datasets.items():
             logger.info(f"Standardizing dataset: {name}")
-            standardized_df = self.schema_mapper.standardize_dataframe(df)
+            standardized_df, rename_map = self.schema_mapper.standardize_with_mapping(df)
             # If no columns were renamed, use original dataframe
-            if set(standardized_df.columns) == set(df.columns):
-                standardized_datasets[name] = df
-            else:
-                standardized_datasets[name] = standardized_df
+            standardized_datasets[name] = standardized_df if rename_map else df
+            column_mappings[name] = rename_map
             
         # Identify common fields across all datasets
         common_fields = self._identify_common_fields(standardized_datasets)
@@ -75,6 +119,11 @@ class DataFrameComparison:
             'title': title,
             'datasets': standardized_datasets,
             'common_fields': common_fields,
+            'column_mappings': column_mappings,
+            'sampling': {
+                name: df.attrs['sampling']
+                for name, df in standardized_datasets.items() if 'sampling' in df.attrs
+            },
             'summary_cards': [],
             'key_insights': [],
             'test_results': [],
@@ -82,63 +131,310 @@ class DataFrameComparison:
             'correlation_plots': []
         }
         
+        # Each column is extracted and cleaned once, then shared by the
+        # summary, tests and plots
+        column_store = ColumnStore(standardized_datasets)
+        
+        # Datasets with identical fingerprints (e.g. replicas) are reported
+        # up front; all their fields then share one set of results
+        if self.fingerprint_columns and len(standardized_datasets) > 1:
+            results['identical_datasets'] = self._identical_datasets(column_store)
+        
         # Generate summary statistics
-        results['summary_cards'] = self._generate_summary_cards(standardized_datasets, common_fields)
+        results['summary_cards'] = self._generate_summary_cards(standardized_datasets, common_fields, column_store)
         
-        # Perform statistical tests and generate visualizations
-        # Compare each common field
+        # Declared field types are authoritative. Other fields are inferred
+        # from the first dataset; types recorded for its header by an
+        # earlier run are reused
+        declared_types = self._declared_types()
+        first_columns = list(datasets[next(iter(datasets))].columns)
+        cached_types = self.schema_mapper.cached_data_types(first_columns)
+        inferred_types = {}
+        
+        # Resolve the type of each common field
+        field_types = {}
         for field in common_fields:
-            # Infer data type from first dataset
-            data_type = self._infer_data_type(
-                standardized_datasets[list(standardized_datasets.keys())[0]][field]
-            )
+            data_type = declared_types.get(field) or cached_types.get(field)
+            if data_type is None:
+                # Infer data type from first dataset
+                data_type = self._infer_data_type(
+                    standardized_datasets[list(standardized_datasets.keys())[0]][field]
+                )
+                inferred_types[field] = data_type
             logger.debug(f"Field '{field}' detected as {data_type}")
+            if data_type in (DataType.NUMERIC, DataType.CATEGORICAL):
+                field_types[field] = data_type
+                
+        if inferred_types:
+            self.schema_mapper.record_data_types(first_columns, {**cached_types, **inferred_types})
             
-            if data_type == DataType.NUMERIC:
-                # Statistical tests for numeric data
-                field_data = [df[field].dropna() for df in standardized_datasets.values()]
-                if all(len(d) > 0 for d in field_data):
-                    test_results = self.statistical_tester.compare_numeric_distributions(*field_data)
-                    results['test_results'].append({
-                        'field': field,
-                        'tests': test_results
-                    })
-                    
-                    # Generate distribution plot
-                    field_data_dict = {name: df[field].dropna() for name, df in standardized_datasets.items()}
-                    plot = self.visualization_engine.create_distribution_overlay(
-                        field_data_dict,
-                        field,
-                        DataType.NUMERIC
-                    )
-                    results['distribution_plots'].append(plot)
-                    
-            elif data_type == DataType.CATEGORICAL:
-                # Statistical tests for categorical data
-                field_data = [df[field].dropna() for df in standardized_datasets.values()]
-                if all(len(d) > 0 for d in field_data):
-                    test_results = self.statistical_tester.compare_categorical_distributions(*field_data)
-                    results['test_results'].append({
-                        'field': field,
-                        'tests': test_results
-                    })
-                    
-                    # Generate distribution plot
-                    field_data_dict = {name: df[field].dropna() for name, df in standardized_datasets.items()}
-                    plot = self.visualization_engine.create_distribution_overlay(
-                        field_data_dict,
-                        field,
-                        DataType.CATEGORICAL
-                    )
-                    results['distribution_plots'].append(plot)
-                    
-        # Generate correlation heatmaps
+        # Perform statistical tests and generate visualizations, one
+        # independent task per field; outcomes come back in field order.
+        # Fields whose columns are unchanged in every dataset are taken
+        # from the result cache; fields identical in every dataset are not
+        # tested
+        cached_outcomes = self._cached_field_outcomes(column_store, field_types)
+        identical_fields = self._identical_fields(column_store, [f for f in field_types if f not in cached_outcomes])
+        pending_types = {
+            f: t for f, t in field_types.items() if f not in cached_outcomes and f not in identical_fields
+        }
+        normality = self._cached_normality(column_store, pending_types)
+        computed = iter(self._analyze_fields(column_store, pending_types, normality))
+        for field, data_type in field_types.items():
+            if field in cached_outcomes:
+                outcome = cached_outcomes[field]
+            else:
+                if field in identical_fields:
+                    outcome = _analyze_field(field, data_type,
+                                             column_store.field(field, numeric=data_type == DataType.NUMERIC),
+                                             self.statistical_tester, self.visualization_engine, identical=True)
+                else:
+                    outcome = next(computed)
+                self._cache_field_outcome(column_store, field, data_type, outcome)
+            if outcome is None:
+                continue
+            test_results, plot, _ = outcome
+            results['test_results'].append({
+                'field': field,
+                'tests': test_results
+            })
+            results['distribution_plots'].append(plot)
+        
+        # Generate correlation heatmaps (cached per dataset; identical
+        # datasets share one)
+        replicas = {
+            name: group[0] for group in results.get('identical_datasets', []) for name in group[1:]
+        }
+        heatmaps = {}
         for name, df in standardized_datasets.items():
-            corr_plot = self.visualization_engine.create_correlation_heatmap(
-                df,
-                f"Correlation Matrix: {name}"
+            title = f"Correlation Matrix: {name}"
+            if name in replicas:
+                import plotly.graph_objects as go
+                
+                heatmaps[name] = go.Figure(heatmaps[replicas[name]])
+                if heatmaps[name].layout.title.text:
+                    heatmaps[name].update_layout(title=title)
+            else:
+                heatmaps[name] = self._correlation_heatmap(column_store, name, title)
+            results['correlation_plots'].append(heatmaps[name])
+            
+        # Generate key insights
+        results['key_insights'] = self._generate_insights(results)
+        
+        # Generate HTML report
+        self.report_generator.generate_report(results, output_path)
+        logger.info(f"Report saved to {output_path}")
+        
+        return results
+        
+    def compare_streams(self,
+                        streams: Dict[str, Union[Iterable[pd.DataFrame], DatasetProfile]],
+                        output_path: str = "comparison_report.html",
+                        title: str = None,
+                        profile_config: Optional[ProfileConfig] = None) -> Dict[str, Any]:
+        """
+        Compare datasets read as chunks, without holding any of them in memory.
+        
+        Each chunk is standardized and folded into a bounded-memory
+        DatasetProfile of its dataset (see compare_profiles), so memory
+        depends on the number of columns, not rows. Datasets given as
+        DatasetProfiles (e.g. baseline snapshots) are compared as they are,
+        and the streams are profiled like the first of them.
+        
+        Args:
+            streams: Dictionary mapping dataset names to iterables of
+                DataFrame chunks (e.g. from DataLoader.iter_multiple) or
+                to DatasetProfiles
+            output_path: Path to save the HTML report
+            title: Optional title for the report
+            profile_config: Accuracy and memory settings of the profiles
+            
+        Returns:
+            Dictionary containing comparison results
+        """
+        if not streams:
+            raise ValueError("No datasets provided for comparison")
+            
+        baseline = next((s for s in streams.values() if isinstance(s, DatasetProfile)), None)
+        profiles = {}
+        column_mappings = {}
+        for name, chunks in streams.items():
+            column_mappings[name] = {}
+            if isinstance(chunks, DatasetProfile):
+                profiles[name] = chunks
+                continue
+            logger.info(f"Profiling dataset: {name}")
+            profiles[name] = self._profile_chunks(name, chunks, column_mappings[name], profile_config, baseline)
+        return self.compare_profiles(profiles, output_path, title, column_mappings)
+        
+    def create_profile(self,
+                       name: str,
+                       data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+                       profile_config: Optional[ProfileConfig] = None) -> DatasetProfile:
+        """
+        Profile a dataset with standardized column names, e.g. to save a
+        baseline snapshot that later comparisons test new batches against.
+        
+        Args:
+            name: Dataset name
+            data: DataFrame, or iterable of DataFrame chunks
+            profile_config: Accuracy and memory settings of the profile
+            
+        Returns:
+            DatasetProfile (see DatasetProfile.save)
+        """
+        chunks = [data] if isinstance(data, pd.DataFrame) else data
+        return self._profile_chunks(name, chunks, {}, profile_config)
+        
+    def compare_shards(self,
+                       shards: Dict[str, Union[List[Shard], DatasetProfile]],
+                       loader: DataLoader,
+                       output_path: str = "comparison_report.html",
+                       title: str = None,
+                       profile_config: Optional[ProfileConfig] = None,
+                       shard_executor: Optional[ShardExecutor] = None) -> Dict[str, Any]:
+        """
+        Compare datasets split into shards, profiling the shards in parallel.
+        
+        Each shard is profiled by the executor into a partial DatasetProfile
+        (in another process, or on another node); the partials of a dataset
+        are merged into its profile and compared as by compare_profiles.
+        Fields are typed from the first chunk of each dataset's first shard
+        so every partial profiles them alike; fields without values there
+        are typed by the first values each shard reads.
+        
+        Args:
+            shards: Dictionary mapping dataset names to their shards (e.g.
+                from DataLoader.plan_multiple), or to DatasetProfiles such as
+                baseline snapshots, which are compared as they are
+            loader: DataLoader reading the shards in the workers
+            output_path: Path to save the HTML report
+            title: Optional title for the report
+            profile_config: Accuracy and memory settings of the profiles
+            shard_executor: Where shards are profiled; defaults to a
+                LocalShardExecutor with max_workers processes
+        
+        Returns:
+            Dictionary containing comparison results
+        """
+        if not shards:
+            raise ValueError("No datasets provided for comparison")
+        
+        shard_executor = shard_executor or LocalShardExecutor(self.max_workers)
+        profile_config = profile_config or ProfileConfig()
+        declared_types = self._declared_types()
+        profiles = {}
+        column_mappings = {}
+        for name, dataset_shards in shards.items():
+            column_mappings[name] = {}
+            if isinstance(dataset_shards, DatasetProfile):
+                profiles[name] = dataset_shards
+                continue
+            # Profiling the first chunk types the columns with values in it;
+            # shards type the others
+            template = DatasetProfile(name, declared_types, profile_config)
+            chunks = self._standardized_chunks(loader.iter_shard(dataset_shards[0]), column_mappings[name])
+            first_chunk = next(chunks, None)
+            chunks.close()
+            if first_chunk is not None:
+                template.update(first_chunk)
+            
+            tasks = [
+                ShardTask(name, shard, loader,
+                          rename_map=column_mappings[name],
+                          field_types={**template.typed_fields(), **declared_types},
+                          boolean_columns=set(template.boolean_columns),
+                          config=profile_config)
+                for shard in dataset_shards
+            ]
+            logger.info(f"Profiling dataset {name} in {len(tasks)} shards")
+            merged = merge_profiles(shard_executor.map(tasks))
+            profiles[name] = merged if merged is not None else DatasetProfile(name, declared_types, profile_config)
+            logger.info(f"Profiled {name}: {profiles[name].row_count:,} rows × {len(profiles[name].fields)} fields")
+        return self.compare_profiles(profiles, output_path, title, column_mappings)
+        
+    def compare_profiles(self,
+                         profiles: Dict[str, DatasetProfile],
+                         output_path: str = "comparison_report.html",
+                         title: str = None,
+                         column_mappings: Optional[Dict[str, Dict[str, str]]] = None) -> Dict[str, Any]:
+        """
+        Compare datasets by their profiles and generate report.
+        
+        Tests and plots are computed from the profiles' sketches, histograms
+        and category counts, so test statistics are approximate (see
+        StatisticalTester.compare_numeric_profiles).
+        
+        Args:
+            profiles: Dictionary mapping dataset names to DatasetProfiles
+                with standardized column names
+            output_path: Path to save the HTML report
+            title: Optional title for the report
+            column_mappings: Optional renamed columns per dataset
+            
+        Returns:
+            Dictionary containing comparison results
+        """
+        if not profiles:
+            raise ValueError("No datasets provided for comparison")
+            
+        if title is None:
+            title = f"Comparison of {len(profiles)} Datasets"
+            
+        logger.info(f"Starting comparison of {len(profiles)} dataset profiles")
+        
+        common_fields = self._identify_common_fields(profiles)
+        logger.info(f"Found {len(common_fields)} common fields for comparison")
+        
+        null_counts = {name: profile.null_counts() for name, profile in profiles.items()}
+        results = {
+            'title': title,
+            'datasets': profiles,
+            'common_fields': common_fields,
+            'column_mappings': column_mappings or {name: {} for name in profiles},
+            'sampling': {},
+            'summary_cards': self._generate_summary_cards(profiles, common_fields, null_counts=null_counts),
+            'key_insights': [],
+            'test_results': [],
+            'distribution_plots': [],
+            'correlation_plots': []
+        }
+        
+        # Declared types were applied while profiling; other fields are
+        # typed from the first dataset's profile
+        first = profiles[next(iter(profiles))]
+        for field in common_fields:
+            field_profiles = {name: profile.fields[field] for name, profile in profiles.items()}
+            data_type = first.fields[field].inferred_type()
+            if data_type not in (DataType.NUMERIC, DataType.CATEGORICAL):
+                continue
+            if len({p.data_type for p in field_profiles.values()}) > 1:
+                logger.warning(f"Field '{field}' has different types across datasets; declare its type "
+                               f"in the schema config to compare it")
+                continue
+            if not all(p.count > 0 for p in field_profiles.values()):
+                continue
+                
+            if len(field_profiles) < 2:
+                # A single dataset, e.g. profiled to save a baseline snapshot
+                test_results = []
+            elif data_type == DataType.NUMERIC:
+                test_results = self.statistical_tester.compare_numeric_profiles(*field_profiles.values())
+            else:
+                test_results = self.statistical_tester.compare_categorical_profiles(*field_profiles.values())
+            results['test_results'].append({
+                'field': field,
+                'tests': test_results
+            })
+            results['distribution_plots'].append(
+                self.visualization_engine.create_profile_distribution_overlay(field_profiles, field, data_type)
+            )
+            
+        # Generate correlation heatmaps
+        for name, profile in profiles.items():
+            results['correlation_plots'].append(
+                self.visualization_engine.create_profile_correlation_heatmap(profile, f"Correlation Matrix: {name}")
             )
-            results['correlation_plots'].append(corr_plot)
             
         # Generate key insights
         results['key_insights'] = self._generate_insights(results)
@@ -149,7 +445,52 @@ class DataFrameComparison:
         
         return results
         
-    def _identify_common_fields(self, datasets: Dict[str, pd.DataFrame]) -> List[str]:
+    def _declared_types(self) -> Dict[str, DataType]:
+        """Data types declared in the schema config, by standard name"""
+        return {
+            fm.standard_name: fm.data_type for fm in self.schema_config
+            if fm.data_type != DataType.UNKNOWN
+        }
+        
+    def _profile_chunks(self,
+                        name: str,
+                        chunks: Iterable[pd.DataFrame],
+                        column_mapping: Dict[str, str],
+                        profile_config: Optional[ProfileConfig] = None,
+                        reference: Optional[DatasetProfile] = None) -> DatasetProfile:
+        """Profile standardized chunks, typing fields like a reference profile if one is given"""
+        standardized = self._standardized_chunks(chunks, column_mapping)
+        if reference is None:
+            return DatasetProfile.from_chunks(name, standardized, field_types=self._declared_types(),
+                                              config=profile_config)
+        profile = DatasetProfile.like(name, reference, self._declared_types())
+        for chunk in standardized:
+            profile.update(chunk)
+        logger.info(f"Profiled {name}: {profile.row_count:,} rows × {len(profile.fields)} fields")
+        return profile
+        
+    def _standardized_chunks(self,
+                             chunks: Iterable[pd.DataFrame],
+                             column_mapping: Dict[str, str]) -> Iterator[pd.DataFrame]:
+        """
+        Standardize the column names of a stream of chunks
+        
+        Columns are resolved once per distinct header; renamed columns are
+        added to column_mapping.
+        """
+        resolved = {}
+        for chunk in chunks:
+            header = tuple(chunk.columns)
+            if header not in resolved:
+                resolved[header] = self.schema_mapper.resolve_columns(header)
+                column_mapping.update(resolved[header])
+            rename_map = resolved[header]
+            if rename_map:
+                chunk = chunk.copy(deep=False)
+                chunk.columns = [rename_map.get(col, col) for col in header]
+            yield chunk
+            
+    def _identify_common_fields(self, datasets: Dict[str, Any]) -> List[str]:
         """Identify fields present in all datasets."""
         if not datasets:
             return []
@@ -159,6 +500,188 @@ class DataFrameComparison:
             common_fields &= set(df.columns)
         return sorted(list(common_fields))
         
+    def _analyze_fields(self,
+                        column_store: ColumnStore,
+                        field_types: Dict[str, DataType],
+                        normality: Optional[Dict[str, Dict[int, TestResult]]] = None) -> List[Optional[Tuple]]:
+        """
+        Run the statistical tests and build the distribution plot of each field
+        
+        Fields are analyzed serially, or on a process or thread pool when
+        max_workers > 1. Process workers read numeric columns from shared
+        memory instead of receiving pickled copies; at most 2 * max_workers
+        fields are in flight so only their columns are shared at a time.
+        
+        Args:
+            column_store: Cleaned columns of the standardized datasets
+            field_types: Numeric or categorical type of each field to analyze
+            normality: Cached Anderson-Darling results per field, by
+                dataset position (see _analyze_field)
+            
+        Returns:
+            Outcome of _analyze_field for each field, in field order
+        """
+        normality = normality or {}
+        tasks = (
+            (field, data_type, column_store.field(field, numeric=data_type == DataType.NUMERIC))
+            for field, data_type in field_types.items()
+        )
+        args = (self.statistical_tester, self.visualization_engine)
+        
+        if self.max_workers <= 1 or len(field_types) <= 1:
+            return [_analyze_field(field, data_type, values, *args, normality.get(field))
+                    for field, data_type, values in tasks]
+            
+        if self.executor == 'thread':
+            from concurrent.futures import ThreadPoolExecutor
+            
+            # NumPy and SciPy release the GIL in the heavy parts of the tests
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = [pool.submit(_analyze_field, field, data_type, values, *args, normality.get(field))
+                           for field, data_type, values in tasks]
+                return [future.result() for future in futures]
+                
+        from concurrent.futures import ProcessPoolExecutor
+        from multiprocessing import resource_tracker
+        
+        # Forked workers must share the parent's tracker; otherwise each
+        # starts its own and reports the blocks it mapped as leaked
+        resource_tracker.ensure_running()
+        
+        outcomes = []
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            try:
+                for field, data_type, values in tasks:
+                    shared = _SharedColumns(values) if data_type == DataType.NUMERIC else None
+                    future = pool.submit(_analyze_in_worker, field, data_type, shared or values, *args,
+                                         normality.get(field))
+                    pending.append((future, shared))
+                    if len(pending) >= 2 * self.max_workers:
+                        outcomes.append(_collect(*pending.popleft()))
+                while pending:
+                    outcomes.append(_collect(*pending.popleft()))
+            finally:
+                for future, shared in pending:
+                    future.cancel()
+                    if shared is not None:
+                        shared.release()
+        return outcomes
+        
+    def _identical_datasets(self, column_store: ColumnStore) -> List[List[str]]:
+        """Groups of two or more datasets with identical columns and contents, in dataset order"""
+        by_columns = {}
+        for name, df in column_store.datasets.items():
+            by_columns.setdefault(tuple(df.columns), []).append(name)
+        order = list(column_store.datasets)
+        identical = sorted(
+            (group for columns, names in by_columns.items() if len(names) > 1
+             for group in column_store.identical_groups(names, list(columns))),
+            key=lambda names: order.index(names[0])
+        )
+        for names in identical:
+            logger.info(f"Datasets {', '.join(names)} are identical")
+        return identical
+        
+    def _identical_fields(self, column_store: ColumnStore, fields: List[str]) -> List[str]:
+        """Fields whose column has the same fingerprint in every dataset"""
+        if not self.fingerprint_columns or len(column_store.datasets) < 2:
+            return []
+        names = list(column_store.datasets)
+        identical = [field for field in fields if column_store.identical_groups(names, [field]) == [names]]
+        if identical:
+            logger.info(f"Skipping tests of {len(identical)} fields identical in every dataset")
+        return identical
+        
+    def _field_key(self, column_store: ColumnStore, field: str, data_type: DataType) -> str:
+        """Result cache key of a field's tests and plot across all datasets"""
+        return self.result_cache.key(
+            'field', field, data_type.value, self.statistical_tester.alpha,
+            [(name, column_store.content_hash(name, field)) for name in column_store.datasets]
+        )
+        
+    def _normality_key(self, column_store: ColumnStore, name: str, field: str, index: int) -> str:
+        """Result cache key of the Anderson-Darling test of one dataset's field"""
+        return self.result_cache.key(
+            'normality', index, self.statistical_tester.alpha, column_store.content_hash(name, field)
+        )
+        
+    def _cached_field_outcomes(self,
+                               column_store: ColumnStore,
+                               field_types: Dict[str, DataType]) -> Dict[str, Optional[Tuple]]:
+        """Cached outcomes of fields whose columns are unchanged in every dataset"""
+        if self.result_cache is None:
+            return {}
+        import plotly.graph_objects as go
+        
+        outcomes = {}
+        for field, data_type in field_types.items():
+            entry = self.result_cache.get(self._field_key(column_store, field, data_type))
+            if entry is None:
+                continue
+            if entry['outcome'] is None:
+                # The field has no values in some dataset
+                outcomes[field] = None
+            else:
+                test_results, plot_json = entry['outcome']
+                outcomes[field] = (test_results, go.Figure(plot_json, _validate=False), {})
+        if outcomes:
+            logger.info(f"Reused cached results of {len(outcomes)} of {len(field_types)} fields")
+        return outcomes
+        
+    def _cached_normality(self,
+                          column_store: ColumnStore,
+                          field_types: Dict[str, DataType]) -> Dict[str, Dict[int, TestResult]]:
+        """Cached Anderson-Darling results of unchanged columns of the fields to analyze"""
+        if self.result_cache is None:
+            return {}
+        normality = {}
+        for field, data_type in field_types.items():
+            if data_type != DataType.NUMERIC:
+                continue
+            for i, name in enumerate(column_store.datasets):
+                result = self.result_cache.get(self._normality_key(column_store, name, field, i))
+                if result is not None:
+                    normality.setdefault(field, {})[i] = result
+        return normality
+        
+    def _cache_field_outcome(self,
+                             column_store: ColumnStore,
+                             field: str,
+                             data_type: DataType,
+                             outcome: Optional[Tuple]):
+        """Store a freshly computed field outcome and its per-dataset normality tests"""
+        if self.result_cache is None:
+            return
+        if outcome is None:
+            self.result_cache.put(self._field_key(column_store, field, data_type), {'outcome': None})
+            return
+        test_results, plot, normality = outcome
+        self.result_cache.put(self._field_key(column_store, field, data_type),
+                              {'outcome': (test_results, plot.to_plotly_json())})
+        names = list(column_store.datasets)
+        for i, result in normality.items():
+            if result is not None:
+                self.result_cache.put(self._normality_key(column_store, names[i], field, i), result)
+                
+    def _correlation_heatmap(self, column_store: ColumnStore, name: str, title: str) -> Any:
+        """Correlation heatmap of a dataset, reused from the result cache when its numeric columns are unchanged"""
+        df = column_store.datasets[name]
+        if self.result_cache is None:
+            return self.visualization_engine.create_correlation_heatmap(df, title)
+        import plotly.graph_objects as go
+        
+        key = self.result_cache.key(
+            'correlation', title,
+            [(col, column_store.content_hash(name, col)) for col in numeric_columns(df)]
+        )
+        plot_json = self.result_cache.get(key)
+        if plot_json is not None:
+            return go.Figure(plot_json, _validate=False)
+        plot = self.visualization_engine.create_correlation_heatmap(df, title)
+        self.result_cache.put(key, plot.to_plotly_json())
+        return plot
+        
     def _infer_data_type(self, series: pd.Series) -> DataType:
         """Infer data type from pandas series."""
         if pd.api.types.is_numeric_dtype(series):
@@ -173,9 +696,11 @@ class DataFrameComparison:
             else:
                 return DataType.TEXT
                 
-    def _generate_summary_cards(self, datasets: Dict[str, pd.DataFrame], 
-                               common_fields: List[str]) -> List[Dict]:
-        """Generate summary cards for report."""
+    def _generate_summary_cards(self, datasets: Dict[str, Any], 
+                               common_fields: List[str],
+                               column_store: Optional[ColumnStore] = None,
+                               null_counts: Optional[Dict[str, Dict[str, int]]] = None) -> List[Dict]:
+        """Generate summary cards for report from DataFrames or DatasetProfiles."""
         cards = []
         
         # Total records card
@@ -194,8 +719,11 @@ class DataFrameComparison:
         })
         
         # Average missing data card
-        total_missing = sum(df.isnull().sum().sum() for df in datasets.values())
-        total_cells = sum(df.size for df in datasets.values())
+        if null_counts is None:
+            column_store = column_store or ColumnStore(datasets)
+            null_counts = {name: column_store.null_counts(name) for name in datasets}
+        total_missing = sum(sum(counts.values()) for counts in null_counts.values())
+        total_cells = sum(len(df) * len(df.columns) for df in datasets.values())
         missing_pct = (total_missing / total_cells * 100) if total_cells > 0 else 0
         cards.append({
             'title': 'Missing Data',
@@ -211,6 +739,18 @@ class DataFrameComparison:
             'description': 'Min to max records'
         })
         
+        # Sampling card, when datasets were sampled at load time
+        sampled = [df.attrs['sampling'] for df in datasets.values() if 'sampling' in getattr(df, 'attrs', {})]
+        if sampled:
+            sample_rows = sum(info['sample_size'] for info in sampled)
+            rows_read = sum(info['rows_read'] for info in sampled)
+            methods = ', '.join(sorted({info['method'] for info in sampled}))
+            cards.append({
+                'title': 'Sampled Records',
+                'value': f'{sample_rows:,}',
+                'description': f'Of {rows_read:,} rows read ({methods} sampling)'
+            })
+        
         return cards
         
     def _generate_insights(self, results: Dict) -> List[str]:
@@ -238,6 +778,21 @@ class DataFrameComparison:
             if max_size > min_size * 2:
                 insights.append(f"Large size variation detected: {min(sizes, key=sizes.get)} ({min_size:,} records) vs {max(sizes, key=sizes.get)} ({max_size:,} records)")
                 
+        # Load-time sampling
+        for name, info in results.get('sampling', {}).items():
+            insights.append(f"{name} was sampled at load time: {info['sample_size']:,} of {info['rows_read']:,} rows "
+                            f"({info['method']} sampling, seed {info['seed']})")
+                
+        # Identical datasets and fields, detected by content fingerprint
+        for names in results.get('identical_datasets', []):
+            insights.append(f"Datasets {', '.join(names)} are identical (same columns and values)")
+        identical_fields = [
+            test_result['field'] for test_result in results['test_results']
+            if any((test.metadata or {}).get('identical') for test in test_result['tests'])
+        ]
+        if identical_fields:
+            insights.append(f"Identical in all datasets (tests skipped): {', '.join(identical_fields)}")
+                
         # Common fields coverage
         common_fields = results['common_fields']
         if datasets and common_fields:
@@ -248,3 +803,136 @@ class DataFrameComparison:
             insights.append(f"Common field coverage: {coverage:.1f}% ({len(common_fields)} out of {len(total_fields)} total unique fields)")
             
         return insights
+
+
+def _analyze_field(field: str,
+                   data_type: DataType,
+                   values: Dict[str, Any],
+                   statistical_tester: StatisticalTester,
+                   visualization_engine: VisualizationEngine,
+                   normality: Optional[Dict[int, TestResult]] = None,
+                   identical: bool = False) -> Optional[Tuple[List[TestResult], Any, Dict]]:
+    """
+    Test and plot one field; runs in the comparing process or in a worker
+    
+    Anderson-Darling tests found in `normality` (by dataset position) are
+    reused instead of rerun. Fields whose column is `identical` in every
+    dataset are not tested (see StatisticalTester.compare_identical).
+    
+    Returns:
+        Tuple of (test results, distribution plot, Anderson-Darling results
+        by dataset position), or None if the field has no values in some
+        dataset
+    """
+    if not all(len(v) > 0 for v in values.values()):
+        return None
+        
+    if identical:
+        first = next(iter(values.values()))
+        test_results = statistical_tester.compare_identical(
+            len(values), first if data_type == DataType.NUMERIC else None
+        )
+        normality = {}
+    elif data_type == DataType.NUMERIC:
+        arrays = list(values.values())
+        test_results = statistical_tester.compare_numeric_samples(*arrays)
+        normality = dict(normality or {})
+        for i, arr in enumerate(arrays):
+            if i not in normality:
+                normality[i] = statistical_tester.normality_test(i, arr)
+        test_results += [normality[i] for i in range(len(arrays)) if normality[i] is not None]
+    else:
+        test_results = statistical_tester.compare_categorical_distributions(*values.values())
+        normality = {}
+    plot = visualization_engine.create_distribution_overlay(values, field, data_type)
+    return test_results, plot, normality
+
+
+def _analyze_in_worker(field: str,
+                       data_type: DataType,
+                       values: Any,
+                       statistical_tester: StatisticalTester,
+                       visualization_engine: VisualizationEngine,
+                       normality: Optional[Dict[int, TestResult]] = None) -> Optional[Tuple[List[TestResult], Dict, Dict]]:
+    """
+    Process pool entry point for _analyze_field
+    
+    Numeric fields arrive as _SharedColumns and are read from shared
+    memory. The plot is returned as its JSON so the parent can rebuild it
+    without validating every value again.
+    """
+    if isinstance(values, _SharedColumns):
+        from multiprocessing import shared_memory
+        
+        shm = shared_memory.SharedMemory(name=values.shm_name)
+        try:
+            outcome = _analyze_field(field, data_type, values.arrays(shm.buf),
+                                     statistical_tester, visualization_engine, normality)
+        finally:
+            try:
+                shm.close()
+            except BufferError:
+                # Views are still referenced by a propagating exception
+                pass
+    else:
+        outcome = _analyze_field(field, data_type, values, statistical_tester, visualization_engine, normality)
+        
+    if outcome is None:
+        return None
+    test_results, plot, normality = outcome
+    return test_results, plot.to_plotly_json(), normality
+
+
+def _collect(future, shared: Optional['_SharedColumns']) -> Optional[Tuple[List[TestResult], Any, Dict]]:
+    """Wait for a worker's outcome, free its shared columns and rebuild the plot"""
+    import plotly.graph_objects as go
+    
+    try:
+        outcome = future.result()
+    finally:
+        if shared is not None:
+            shared.release()
+    if outcome is None:
+        return None
+    test_results, plot_json, normality = outcome
+    # Validated in the worker already
+    return test_results, go.Figure(plot_json, _validate=False), normality
+
+
+class _SharedColumns:
+    """
+    Float64 columns of several datasets packed into one shared memory block
+    
+    Pickling sends only the block name and offsets, so workers map the
+    parent's data instead of receiving copies. The creating process
+    releases the block once the worker is done.
+    """
+    
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        from multiprocessing import shared_memory
+        
+        self.names = list(columns)
+        self.offsets = np.cumsum([0] + [len(arr) for arr in columns.values()]).tolist()
+        self._shm = shared_memory.SharedMemory(create=True, size=max(self.offsets[-1], 1) * 8)
+        self.shm_name = self._shm.name
+        
+        data = np.ndarray(self.offsets[-1], dtype=np.float64, buffer=self._shm.buf)
+        for start, arr in zip(self.offsets, columns.values()):
+            data[start:start + len(arr)] = arr
+        del data
+        
+    def __getstate__(self):
+        return {'names': self.names, 'offsets': self.offsets, 'shm_name': self.shm_name}
+        
+    def arrays(self, buffer) -> Dict[str, np.ndarray]:
+        """Views of each dataset's column in a mapped block"""
+        data = np.ndarray(self.offsets[-1], dtype=np.float64, buffer=buffer)
+        return {
+            name: data[start:stop]
+            for name, start, stop in zip(self.names, self.offsets, self.offsets[1:])
+        }
+        
+    def release(self):
+        """Close and remove the block (creating process only)"""
+        self._shm.close()
+        self._shm.unlink()
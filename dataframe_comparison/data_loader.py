@@ -2,16 +2,77 @@
 Simplified data loader with automatic format detection for multiple file types
 """
 
+import io
 import os
+import csv
 import json
+import numpy as np
 import pandas as pd
-from typing import Union, Optional, List, Dict, Any, Tuple
+from dataclasses import dataclass, replace
+from typing import Union, Optional, List, Dict, Any, Tuple, Iterator, TextIO, BinaryIO
 from pathlib import Path
 import logging
 
+from .cache import LoadCache
+from .database import ConnectionPool, SQLSource, build_query
+from .compression import detect_compression, open_decompressed, open_source, strip_compression_suffix
+from .schema import DataType, SchemaMapper
+
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class SamplingConfig:
+    """
+    Load-time sampling settings
+    
+    Exactly one of `size` (fixed-size reservoir) or `fraction` (Bernoulli
+    sample) must be set. With `stratify_by`, a reservoir of `size` rows is
+    kept per value of that column. Samples are deterministic for a seed.
+    """
+    size: Optional[int] = None
+    fraction: Optional[float] = None
+    stratify_by: Optional[str] = None
+    seed: int = 0
+    
+    def __post_init__(self):
+        if (self.size is None) == (self.fraction is None):
+            raise ValueError("SamplingConfig needs exactly one of size or fraction")
+        if self.size is not None and self.size < 1:
+            raise ValueError("Sample size must be positive")
+        if self.fraction is not None and not 0 < self.fraction <= 1:
+            raise ValueError("Sample fraction must be in (0, 1]")
+    
+    @property
+    def method(self) -> str:
+        """Name of the sampling method, as recorded in reports"""
+        if self.fraction is not None:
+            return 'bernoulli'
+        return 'stratified' if self.stratify_by else 'reservoir'
+
+
+@dataclass
+class Shard:
+    """
+    Contiguous part of one input, read independently of the other shards
+    (see DataLoader.plan_shards and DataLoader.iter_shard)
+    
+    At most one of `row_groups` (Parquet), `batches` (record batches of an
+    Arrow IPC file) and `byte_range` (line-aligned range of a CSV/TSV/JSONL
+    file) is set; a shard with none of them covers the whole input.
+    """
+    source: Union[str, SQLSource]
+    index: int = 0
+    count: int = 1
+    row_groups: Optional[List[int]] = None
+    batches: Optional[List[int]] = None
+    byte_range: Optional[Tuple[int, int]] = None
+    header: Optional[List[str]] = None
+    columns: Optional[List[str]] = None
+    chunksize: Optional[int] = None
+    read_kwargs: Optional[Dict[str, Any]] = None
+
+
 class DataLoader:
     """
     Data loader with automatic format detection
@@ -20,85 +81,1010 @@ class DataLoader:
     - Auto-detects file format (CSV, TSV, JSON, JSONL, Parquet, Excel)
     - Handles nested JSON structures
     - Schema inference and validation
-    - Automatic type optimization
+    - Automatic single-pass type optimization (numeric/datetime strings, categories)
+    - Header-first column projection onto the fields common to all files
+    - Concurrent multi-file loading
+    - Optional on-disk cache of parsed slow formats
+    - Chunked reading with bounded memory
+    - Optional Arrow-backed dtypes via the pyarrow readers
+    - Row filters pushed down into the Parquet reader
+    - Hive-partitioned directories loaded as one dataset
+    - Streaming reservoir / Bernoulli / stratified sampling at load time
+    - Metadata-only probing of columns, dtypes and row counts
+    - Transparent streaming decompression of .gz / .zst / .bz2 inputs
+    - DB-API / SQLite tables and queries with projection and filter pushdown
+    - Memory-mapped Arrow IPC / Feather files read without copying
+    - Declared field types parsed at read time (category, float32, datetime)
+    - Row-range sharding of single inputs for parallel, multi-node reads
     """
     
-    SUPPORTED_FORMATS = {'.csv', '.tsv', '.json', '.jsonl', '.parquet', '.xlsx', '.xls'}
+    SUPPORTED_FORMATS = {'.csv', '.tsv', '.json', '.jsonl', '.parquet', '.xlsx', '.xls',
+                         '.arrow', '.feather', '.ipc'}
+    
+    # Number of records/rows sampled by probe()
+    HEADER_SAMPLE_RECORDS = 1000
+    
+    # Formats whose readers run in Arrow and release the GIL; these are loaded
+    # on threads, everything else on worker processes
+    GIL_RELEASING_FORMATS = {'.parquet', '.arrow', '.feather', '.ipc'}
     
-    def __init__(self, optimize_dtypes: bool = True):
+    # pyarrow.dataset formats for partitioned directories; other formats are
+    # read file by file
+    PARTITIONED_FORMATS = {'.parquet': 'parquet', '.csv': 'csv', '.tsv': 'tsv', '.jsonl': 'json',
+                           '.arrow': 'ipc', '.feather': 'ipc', '.ipc': 'ipc'}
+    
+    # Arrow IPC formats; memory-mapped and exposed as Arrow-backed columns
+    # without copying, so dtype optimization is skipped for them
+    MEMORY_MAPPED_FORMATS = {'.arrow', '.feather', '.ipc'}
+    
+    # Bytes read by probe() to estimate line counts; smaller files are
+    # counted exactly
+    PROBE_SAMPLE_BYTES = 4 * 1024 * 1024
+    
+    # Rows sampled to estimate string column cardinality in _optimize_dtypes
+    CARDINALITY_SAMPLE_SIZE = 10000
+    
+    # Rows per chunk streamed through the sampler when no chunksize is set
+    SAMPLING_CHUNKSIZE = 100000
+    
+    # JSON arrays larger than this are parsed record by record instead of
+    # by pd.read_json, which holds the whole document in memory
+    JSON_READ_MAX_BYTES = 64 * 1024 * 1024
+    
+    # Formats read by multithreaded pyarrow parsers when dtype_backend='pyarrow'
+    ARROW_READER_FORMATS = {'.csv', '.tsv', '.jsonl', '.parquet'}
+    
+    # Read dtypes for declared FieldMapping types; numeric fields are read
+    # as float32 (about 7 significant digits)
+    DECLARED_DTYPES = {
+        DataType.NUMERIC: 'float32',
+        DataType.CATEGORICAL: 'category',
+        DataType.DATETIME: 'datetime'
+    }
+    
+    # Rows fetched per round trip from database sources when no chunksize is set
+    SQL_FETCH_SIZE = 100000
+    
+    # Formats whose readers need random access; compressed files in these
+    # formats are decompressed into memory instead of streamed
+    SEEKABLE_FORMATS = {'.parquet', '.xlsx', '.xls', '.arrow', '.feather', '.ipc'}
+    
+    # Line-delimited formats split into byte ranges at line boundaries when
+    # sharded; line breaks inside quoted CSV values are skipped
+    LINE_SPLITTABLE_FORMATS = {'.csv', '.tsv', '.jsonl'}
+    
+    # Formats slow enough to parse that loads are worth caching as Parquet
+    CACHEABLE_FORMATS = {'.csv', '.tsv', '.json', '.jsonl', '.xlsx', '.xls'}
+    
+    def __init__(self,
+                 optimize_dtypes: bool = True,
+                 max_workers: int = 1,
+                 cache_dir: Optional[Union[str, Path]] = None,
+                 cache_max_bytes: int = 2 * 1024**3,
+                 json_batch_size: int = 10000,
+                 max_list_items: Optional[int] = 10,
+                 chunksize: Optional[int] = None,
+                 dtype_backend: str = 'numpy',
+                 sampling: Optional[SamplingConfig] = None,
+                 decompress_workers: int = 4):
         """
         Initialize DataLoader
         
         Args:
             optimize_dtypes: Automatically optimize data types for memory efficiency
+            max_workers: Number of files loaded concurrently by load_multiple
+                (1 loads files one after another)
+            cache_dir: Optional directory for caching parsed CSV/JSON/Excel
+                files as Parquet across runs
+            cache_max_bytes: Size limit of the cache directory
+            json_batch_size: Records flattened per batch when streaming nested JSON
+            max_list_items: Maximum number of items expanded from lists of
+                objects in nested JSON (None expands all items)
+            chunksize: If set, files are read in chunks of this many rows,
+                each optimized before the next is parsed
+            dtype_backend: 'numpy' for NumPy-backed columns or 'pyarrow' to
+                parse with the pyarrow readers into Arrow-backed dtypes
+            sampling: Optional SamplingConfig applied to every load; files
+                are streamed through the sampler and never fully materialized
+            decompress_workers: Threads decompressing the frames of
+                multi-frame .zst files concurrently
         """
+        if dtype_backend not in ('numpy', 'pyarrow'):
+            raise ValueError(f"Unsupported dtype_backend: {dtype_backend}")
+        
         self.optimize_dtypes = optimize_dtypes
+        self.max_workers = max_workers
+        self.json_batch_size = json_batch_size
+        self.max_list_items = max_list_items
+        self.chunksize = chunksize
+        self.dtype_backend = dtype_backend
+        self.sampling = sampling
+        self.decompress_workers = decompress_workers
+        self.cache = LoadCache(cache_dir, cache_max_bytes) if cache_dir is not None else None
+        self.connection_pool = ConnectionPool()
+        self.load_errors: Dict[str, str] = {}
         self.logger = logger
         
     def load(self, 
-             file_path: Union[str, Path],
+             file_path: Union[str, Path, SQLSource],
              optimize_dtypes: Optional[bool] = None,
+             columns: Optional[List[str]] = None,
+             chunksize: Optional[int] = None,
+             filters: Optional[List] = None,
+             sampling: Optional[SamplingConfig] = None,
+             dtypes: Optional[Dict[str, str]] = None,
              **kwargs) -> pd.DataFrame:
         """
         Load data from file with automatic format detection
         
         Args:
-            file_path: Path to the file
+            file_path: Path to the file (or to a Hive-partitioned directory,
+                see load_partitioned), or a SQLSource (see load_sql)
             optimize_dtypes: Optimize data types for memory efficiency
+            columns: Optional subset of columns to read
+            chunksize: Read in chunks of this many rows (defaults to the
+                loader's chunksize; None reads the file in one shot)
+            filters: Optional row filters in pyarrow DNF form, e.g.
+                [('date', '>=', '2024-01-01'), ('segment', '==', 'A')] or a
+                list of such lists OR-ed together. Parquet skips row groups
+                using footer statistics; other formats filter after parsing.
+            sampling: Optional SamplingConfig (defaults to the loader's);
+                the sample is described in the result's attrs['sampling']
+            dtypes: Optional read dtypes per column ('category', 'float32' or
+                'datetime'), e.g. from declared field types. CSV/TSV readers
+                parse them directly; other formats convert right after reading.
             **kwargs: Additional arguments for read functions
             
         Returns:
             DataFrame
         """
+        if isinstance(file_path, SQLSource):
+            return self.load_sql(file_path, columns=columns, filters=filters, chunksize=chunksize,
+                                 optimize_dtypes=optimize_dtypes, sampling=sampling, dtypes=dtypes)
+        
         file_path = Path(file_path)
         
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
         
+        sampling = sampling or self.sampling
+        
+        if file_path.is_dir():
+            return self.load_partitioned(file_path, columns=columns, filters=filters,
+                                         optimize_dtypes=optimize_dtypes, sampling=sampling,
+                                         dtypes=dtypes, **kwargs)
+        
         # Detect format
         file_format = self._detect_format(file_path)
+        optimize = optimize_dtypes if optimize_dtypes is not None else self.optimize_dtypes
+        chunksize = chunksize or self.chunksize
         
-        # Load data
-        df = self._load_file(file_path, file_format, **kwargs)
+        cache_key = None
+        if self.cache is not None and file_format in self.CACHEABLE_FORMATS:
+            cache_key = self.cache.key(file_path, {
+                'format': file_format,
+                'columns': columns,
+                'filters': filters,
+                'sampling': sampling,
+                'dtypes': dtypes,
+                'optimize_dtypes': optimize,
+                'dtype_backend': self.dtype_backend,
+                'kwargs': kwargs
+            })
+            df = self.cache.get(cache_key, dtype_backend=self.dtype_backend)
+            if df is not None:
+                logger.info(f"Loaded {file_path} from cache")
+                return df
         
-        # Optimize dtypes if enabled
-        if optimize_dtypes if optimize_dtypes is not None else self.optimize_dtypes:
-            df = self._optimize_dtypes(df)
+        if sampling is not None:
+            # Stream the file through the sampler; only the sample is kept
+            read_columns = self._with_extra_columns(columns, [sampling.stratify_by])
+            df = self._sample_chunks(self.iter_chunks(
+                file_path, chunksize or self.SAMPLING_CHUNKSIZE, columns=read_columns,
+                optimize_dtypes=optimize, filters=filters, dtypes=dtypes, **kwargs
+            ), sampling)
+            df = self._select_columns(df, columns)
+        elif chunksize:
+            # Optimize each chunk before parsing the next to bound peak memory
+            df = self._concat_chunks(self.iter_chunks(
+                file_path, chunksize, columns=columns, optimize_dtypes=optimize,
+                filters=filters, dtypes=dtypes, **kwargs
+            ))
+        else:
+            # Load data
+            df = self._load_file(file_path, file_format, columns=columns, filters=filters,
+                                 dtypes=dtypes, **kwargs)
+            
+            # Optimize dtypes if enabled (casting would copy memory-mapped data)
+            if optimize and file_format not in self.MEMORY_MAPPED_FORMATS:
+                df = self._optimize_dtypes(df)
+        
+        if cache_key is not None:
+            self.cache.put(cache_key, df)
             
         return df
     
+    def iter_chunks(self,
+                    file_path: Union[str, Path],
+                    chunksize: Optional[int] = None,
+                    columns: Optional[List[str]] = None,
+                    optimize_dtypes: Optional[bool] = None,
+                    filters: Optional[List] = None,
+                    dtypes: Optional[Dict[str, str]] = None,
+                    **kwargs) -> Iterator[pd.DataFrame]:
+        """
+        Read a file as a sequence of DataFrame chunks
+        
+        CSV/TSV and JSONL use the pandas chunked readers, Parquet streams
+        record batches, nested JSON is streamed record by record and Excel
+        (which cannot be read incrementally) is yielded as a single chunk.
+        
+        Args:
+            file_path: Path to the file
+            chunksize: Rows per chunk (defaults to the loader's chunksize,
+                then to json_batch_size)
+            columns: Optional subset of columns to read
+            optimize_dtypes: Optimize each chunk's data types
+            filters: Optional row filters (see load)
+            dtypes: Optional read dtypes per column (see load)
+            **kwargs: Additional arguments for read functions
+            
+        Yields:
+            DataFrame chunks
+        """
+        file_path = Path(file_path)
+        
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        
+        file_format = self._detect_format(file_path)
+        chunksize = chunksize or self.chunksize or self.json_batch_size
+        optimize = optimize_dtypes if optimize_dtypes is not None else self.optimize_dtypes
+        
+        if file_format == '.parquet':
+            chunks = self._iter_parquet_chunks(file_path, chunksize, columns, filters)
+        elif file_format in self.MEMORY_MAPPED_FORMATS:
+            optimize = False
+            table = self._read_ipc(file_path, columns, filters)
+            chunks = (
+                table.slice(offset, chunksize).to_pandas(types_mapper=pd.ArrowDtype)
+                for offset in range(0, max(table.num_rows, 1), chunksize)
+            )
+        else:
+            read_columns = self._with_filter_columns(columns, filters)
+            chunks = (
+                self._select_columns(self._apply_filters(chunk, filters), columns)
+                for chunk in self._iter_file_chunks(file_path, file_format, chunksize, read_columns, **kwargs)
+            )
+        
+        for i, chunk in enumerate(chunks):
+            chunk = self._apply_dtypes(chunk, dtypes)
+            if optimize:
+                chunk = self._optimize_dtypes(chunk)
+            logger.debug(f"Chunk {i} of {file_path}: {len(chunk)} rows, "
+                         f"{chunk.memory_usage(deep=True).sum() / 1024**2:.1f} MB")
+            yield chunk
+    
+    def _iter_file_chunks(self,
+                          file_path: Path,
+                          file_format: str,
+                          chunksize: int,
+                          columns: Optional[List[str]] = None,
+                          **kwargs) -> Iterator[pd.DataFrame]:
+        """Yield raw chunks based on file format"""
+        arrow = self.dtype_backend == 'pyarrow'
+        
+        if file_format in ['.csv', '.tsv'] and arrow:
+            # The pandas pyarrow engine cannot chunk; stream the Arrow CSV reader
+            with self._open_source(file_path, file_format) as source:
+                yield from self._iter_arrow_csv(source, chunksize, columns,
+                                                '\t' if file_format == '.tsv' else ',')
+        elif file_format in ['.csv', '.tsv']:
+            if file_format == '.tsv':
+                kwargs.setdefault('sep', '\t')
+            with self._open_source(file_path, file_format) as source, \
+                    pd.read_csv(source, usecols=columns, chunksize=chunksize, **kwargs) as reader:
+                yield from reader
+        elif file_format == '.jsonl':
+            if arrow:
+                kwargs.setdefault('dtype_backend', 'pyarrow')
+            with self._open_source(file_path, file_format) as source, \
+                    pd.read_json(source, lines=True, chunksize=chunksize, **kwargs) as reader:
+                for chunk in reader:
+                    yield self._select_columns(chunk, columns)
+        elif file_format == '.json':
+            for chunk in self.iter_nested_json(file_path, batch_size=chunksize):
+                if arrow:
+                    chunk = chunk.convert_dtypes(dtype_backend='pyarrow')
+                yield self._select_columns(chunk, columns)
+        else:
+            yield self._load_file(file_path, file_format, columns=columns, **kwargs)
+    
+    def _iter_parquet_chunks(self,
+                             file_path: Path,
+                             chunksize: int,
+                             columns: Optional[List[str]] = None,
+                             filters: Optional[List] = None,
+                             row_groups: Optional[List[int]] = None) -> Iterator[pd.DataFrame]:
+        """Stream Parquet record batches (of the given row groups only), skipping row groups excluded by filters"""
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+        
+        if detect_compression(file_path) is None:
+            dataset = ds.dataset(file_path, format='parquet')
+        else:
+            # Parquet needs random access to its footer; decompress in memory
+            with self._open_source(file_path, '.parquet') as source:
+                dataset = ds.dataset(pq.read_table(source, columns=self._with_filter_columns(columns, filters)))
+        
+        expression = None
+        if filters:
+            expression = pq.filters_to_expression(self._coerce_arrow_filters(dataset.schema, filters))
+        
+        source = dataset
+        if row_groups is not None:
+            source = next(iter(dataset.get_fragments())).subset(row_group_ids=row_groups)
+        
+        types_mapper = pd.ArrowDtype if self.dtype_backend == 'pyarrow' else None
+        for batch in source.to_batches(columns=columns, filter=expression, batch_size=chunksize):
+            if batch.num_rows:
+                yield batch.to_pandas(types_mapper=types_mapper)
+    
+    def _iter_arrow_csv(self,
+                        source: Union[Path, BinaryIO],
+                        chunksize: int,
+                        columns: Optional[List[str]],
+                        delimiter: str) -> Iterator[pd.DataFrame]:
+        """Stream a CSV through pyarrow, regrouping record batches into chunks"""
+        import pyarrow.csv as pv
+        
+        reader = pv.open_csv(
+            source,
+            parse_options=pv.ParseOptions(delimiter=delimiter),
+            convert_options=pv.ConvertOptions(include_columns=columns)
+        )
+        yield from _regroup_batches(reader, chunksize, pd.ArrowDtype)
+    
+    def load_sql(self,
+                 source: SQLSource,
+                 columns: Optional[List[str]] = None,
+                 filters: Optional[List] = None,
+                 chunksize: Optional[int] = None,
+                 optimize_dtypes: Optional[bool] = None,
+                 sampling: Optional[SamplingConfig] = None,
+                 dtypes: Optional[Dict[str, str]] = None) -> pd.DataFrame:
+        """
+        Load a database table or query
+        
+        The column projection and filters become the SELECT list and WHERE
+        clause, so only matching rows and columns leave the database. Rows
+        are fetched in chunks and optimized chunk by chunk; connections
+        opened from URLs are pooled and reused by later loads.
+        
+        Args:
+            source: SQLSource naming the connection and table or query
+            columns: Optional subset of columns to select
+            filters: Optional row filters in pyarrow DNF form (see load)
+            chunksize: Rows fetched per round trip (defaults to the loader's
+                chunksize, then SQL_FETCH_SIZE)
+            optimize_dtypes: Optimize data types for memory efficiency
+            sampling: Optional SamplingConfig (defaults to the loader's)
+            dtypes: Optional read dtypes per column (see load)
+            
+        Returns:
+            DataFrame
+        """
+        sampling = sampling or self.sampling
+        
+        if sampling is not None:
+            read_columns = self._with_extra_columns(columns, [sampling.stratify_by])
+            df = self._sample_chunks(self.iter_sql(
+                source, chunksize, columns=read_columns, optimize_dtypes=optimize_dtypes,
+                filters=filters, dtypes=dtypes
+            ), sampling)
+            return self._select_columns(df, columns)
+        
+        return self._concat_chunks(self.iter_sql(
+            source, chunksize, columns=columns, optimize_dtypes=optimize_dtypes,
+            filters=filters, dtypes=dtypes
+        ))
+    
+    def iter_sql(self,
+                 source: SQLSource,
+                 chunksize: Optional[int] = None,
+                 columns: Optional[List[str]] = None,
+                 optimize_dtypes: Optional[bool] = None,
+                 filters: Optional[List] = None,
+                 dtypes: Optional[Dict[str, str]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Read a database table or query as a sequence of DataFrame chunks
+        
+        Drivers exposing Arrow record batches (ADBC's fetch_record_batch)
+        are read as Arrow; others through DB-API fetchmany.
+        
+        Args:
+            source: SQLSource naming the connection and table or query
+            chunksize: Rows per chunk (see load_sql)
+            columns: Optional subset of columns to select
+            optimize_dtypes: Optimize each chunk's data types
+            filters: Optional row filters in pyarrow DNF form (see load)
+            dtypes: Optional read dtypes per column (see load)
+            
+        Yields:
+            DataFrame chunks (a single empty one if no rows match)
+        """
+        chunksize = chunksize or self.chunksize or self.SQL_FETCH_SIZE
+        optimize = optimize_dtypes if optimize_dtypes is not None else self.optimize_dtypes
+        
+        with self.connection_pool.connection(source) as (conn, paramstyle):
+            sql, params = build_query(source, columns, filters, paramstyle)
+            logger.debug(f"Querying {source.name}: {sql}")
+            cursor = conn.cursor()
+            try:
+                cursor.execute(sql, params)
+                if hasattr(cursor, 'fetch_record_batch'):
+                    types_mapper = pd.ArrowDtype if self.dtype_backend == 'pyarrow' else None
+                    chunks = _regroup_batches(cursor.fetch_record_batch(), chunksize, types_mapper)
+                else:
+                    chunks = self._iter_fetchmany(cursor, chunksize)
+                
+                for i, chunk in enumerate(chunks):
+                    chunk = self._apply_dtypes(chunk, dtypes)
+                    if optimize:
+                        chunk = self._optimize_dtypes(chunk)
+                    logger.debug(f"Chunk {i} of {source.name}: {len(chunk)} rows")
+                    yield chunk
+            finally:
+                cursor.close()
+    
+    def _iter_fetchmany(self, cursor, chunksize: int) -> Iterator[pd.DataFrame]:
+        """Yield DB-API result rows as DataFrames of up to chunksize rows"""
+        names = [description[0] for description in cursor.description]
+        n_chunks = 0
+        while True:
+            rows = cursor.fetchmany(chunksize)
+            if not rows:
+                break
+            chunk = pd.DataFrame.from_records(rows, columns=names)
+            if self.dtype_backend == 'pyarrow':
+                chunk = chunk.convert_dtypes(dtype_backend='pyarrow')
+            n_chunks += 1
+            yield chunk
+        
+        if n_chunks == 0:
+            yield pd.DataFrame(columns=names)
+    
+    def _read_sql_columns(self, source: SQLSource) -> List[str]:
+        """Column names of a table or query, without fetching rows"""
+        with self.connection_pool.connection(source) as (conn, paramstyle):
+            sql, params = build_query(source, paramstyle=paramstyle)
+            cursor = conn.cursor()
+            try:
+                cursor.execute(f"{sql} WHERE 1 = 0", params)
+                return [description[0] for description in cursor.description]
+            finally:
+                cursor.close()
+    
+    def close(self):
+        """Close pooled database connections"""
+        self.connection_pool.close()
+    
+    def _concat_chunks(self, chunks: Iterator[pd.DataFrame]) -> pd.DataFrame:
+        """
+        Concatenate optimized chunks, keeping category columns categorical
+        
+        Chunks see different category sets, which pd.concat would otherwise
+        widen to object; categories are unioned first. Columns typed
+        differently by different chunks (e.g. codes parsed as numbers in
+        early chunks and kept as text once letters appear) are converted to
+        text in every chunk, so no column mixes numbers and strings.
+        """
+        chunks = list(chunks)
+        if not chunks:
+            return pd.DataFrame()
+        if len(chunks) == 1:
+            return chunks[0]
+        
+        for col in chunks[0].columns:
+            # Chunks without values for a column do not type it
+            kinds = {_dtype_kind(chunk[col]) for chunk in chunks
+                     if col in chunk.columns and chunk[col].notna().any()}
+            if len(kinds) > 1:
+                logger.debug(f"Column '{col}' is typed differently across chunks ({', '.join(sorted(kinds))}); "
+                             f"reading it as text")
+                for chunk in chunks:
+                    if col in chunk.columns:
+                        chunk[col] = _as_text(chunk[col])
+                continue
+            if not all(col in chunk.columns and isinstance(chunk[col].dtype, pd.CategoricalDtype)
+                       for chunk in chunks):
+                continue
+            categories = pd.api.types.union_categoricals(
+                [pd.Categorical([], categories=chunk[col].cat.categories) for chunk in chunks]
+            ).categories
+            for chunk in chunks:
+                chunk[col] = chunk[col].cat.set_categories(categories)
+        
+        return pd.concat(chunks, ignore_index=True)
+    
+    def _sample_chunks(self, chunks: Iterator[pd.DataFrame], sampling: SamplingConfig) -> pd.DataFrame:
+        """
+        Sample a stream of chunks without holding more than the sample
+        
+        Every row gets a uniform random key from a seeded generator. Bernoulli
+        sampling keeps rows whose key is below the fraction; reservoir
+        sampling keeps the `size` smallest keys seen so far (per stratum when
+        stratified), which is a uniform sample of the rows read. Kept rows
+        are returned in file order.
+        """
+        rng = np.random.default_rng(sampling.seed)
+        sample = None
+        # Rows kept by Bernoulli sampling, concatenated once at the end
+        kept = []
+        rows_read = 0
+        
+        for chunk in chunks:
+            chunk = chunk.reset_index(drop=True)
+            keys = rng.random(len(chunk))
+            chunk['__sample_key'] = keys
+            chunk['__sample_row'] = np.arange(rows_read, rows_read + len(chunk))
+            rows_read += len(chunk)
+            
+            if sampling.fraction is not None:
+                kept.append(chunk[keys < sampling.fraction])
+                continue
+            
+            candidates = chunk if sample is None else self._concat_chunks([sample, chunk])
+            if sampling.stratify_by:
+                ranks = candidates.groupby(sampling.stratify_by, observed=True, dropna=False)['__sample_key'].rank(method='first')
+                sample = candidates[(ranks <= sampling.size).to_numpy()]
+            elif len(candidates) > sampling.size:
+                keep = np.argpartition(candidates['__sample_key'].to_numpy(), sampling.size - 1)[:sampling.size]
+                sample = candidates.iloc[np.sort(keep)]
+            else:
+                sample = candidates
+        
+        if kept:
+            sample = self._concat_chunks(kept)
+        if sample is None:
+            return pd.DataFrame()
+        
+        sample = sample.sort_values('__sample_row').drop(columns=['__sample_key', '__sample_row'])
+        sample = sample.reset_index(drop=True)
+        sample.attrs['sampling'] = {
+            'method': sampling.method,
+            'rows_read': rows_read,
+            'sample_size': len(sample),
+            'size': sampling.size,
+            'fraction': sampling.fraction,
+            'stratify_by': sampling.stratify_by,
+            'seed': sampling.seed
+        }
+        logger.info(f"Sampled {len(sample):,} of {rows_read:,} rows ({sampling.method})")
+        return sample
+    
     def load_multiple(self, 
                      file_paths: List[Union[str, Path]],
                      names: Optional[List[str]] = None,
+                     schema_mapper: Optional[SchemaMapper] = None,
+                     max_workers: Optional[int] = None,
                      **kwargs) -> Dict[str, pd.DataFrame]:
         """
         Load multiple files
         
+        Files that fail to load are logged and skipped; their errors are kept
+        in `load_errors` keyed by dataset name.
+        
         Args:
-            file_paths: List of file paths
+            file_paths: List of file paths and/or SQLSource objects
             names: Optional names for the datasets
+            schema_mapper: Optional SchemaMapper; when given, only the columns
+                that map to fields common to all files are read, `filters`
+                may refer to standardized field names, and fields with a
+                declared data type are parsed to it (see DECLARED_DTYPES)
+            max_workers: Number of files loaded concurrently (defaults to the
+                loader's max_workers)
             **kwargs: Additional arguments for read functions
             
         Returns:
-            Dictionary mapping names to DataFrames
+            Dictionary mapping names to DataFrames, in the order of file_paths
         """
         datasets = {}
+        self.load_errors = {}
+        names, projections, file_kwargs = self._read_plan(file_paths, names, schema_mapper, kwargs)
         
-        if names is None:
-            names = [Path(fp).stem for fp in file_paths]
+        max_workers = self.max_workers if max_workers is None else max_workers
+        if max_workers > 1 and len(file_paths) > 1:
+            outcomes = self._load_concurrently(file_paths, projections, max_workers, file_kwargs)
+        else:
+            outcomes = (self._try_load(fp, cols, kw) for fp, cols, kw in zip(file_paths, projections, file_kwargs))
         
-        for name, file_path in zip(names, file_paths):
-            try:
-                datasets[name] = self.load(file_path, **kwargs)
+        for name, file_path, (df, error) in zip(names, file_paths, outcomes):
+            if error is None:
+                datasets[name] = df
                 logger.info(f"Successfully loaded: {name} from {file_path}")
-            except Exception as e:
-                logger.error(f"Failed to load {file_path}: {e}")
+            else:
+                self.load_errors[name] = error
+                logger.error(f"Failed to load {file_path}: {error}")
                 
         return datasets
     
+    def iter_multiple(self,
+                      file_paths: List[Union[str, Path]],
+                      names: Optional[List[str]] = None,
+                      schema_mapper: Optional[SchemaMapper] = None,
+                      chunksize: Optional[int] = None,
+                      **kwargs) -> Dict[str, Iterator[pd.DataFrame]]:
+        """
+        Open multiple files as streams of chunks, e.g. for
+        DataFrameComparison.compare_streams
+        
+        Columns are projected and filters and declared dtypes translated as
+        in load_multiple; nothing is read until a stream is iterated.
+        Sampling does not apply. Files that cannot be streamed are logged
+        and skipped, with their errors kept in `load_errors`.
+        
+        Args:
+            file_paths: List of file paths and/or SQLSource objects
+            names: Optional names for the datasets
+            schema_mapper: Optional SchemaMapper (see load_multiple)
+            chunksize: Rows per chunk (see iter_chunks)
+            **kwargs: Additional arguments for iter_chunks
+            
+        Returns:
+            Dictionary mapping names to chunk iterators, in the order of file_paths
+        """
+        streams = {}
+        self.load_errors = {}
+        kwargs.pop('sampling', None)
+        names, projections, file_kwargs = self._read_plan(file_paths, names, schema_mapper, kwargs)
+        
+        for name, file_path, columns, kw in zip(names, file_paths, projections, file_kwargs):
+            if isinstance(file_path, SQLSource):
+                streams[name] = self.iter_sql(file_path, chunksize=chunksize, columns=columns,
+                                              filters=kw.get('filters'),
+                                              optimize_dtypes=kw.get('optimize_dtypes'),
+                                              dtypes=kw.get('dtypes'))
+                continue
+            path = Path(file_path)
+            error = self._stream_error(path)
+            if error is not None:
+                self.load_errors[name] = error
+                logger.error(f"Cannot stream {path}: {error}")
+                continue
+            streams[name] = self.iter_chunks(path, chunksize, columns=columns, **kw)
+            
+        return streams
+    
+    def plan_multiple(self,
+                      file_paths: List[Union[str, Path]],
+                      n_shards: int,
+                      names: Optional[List[str]] = None,
+                      schema_mapper: Optional[SchemaMapper] = None,
+                      chunksize: Optional[int] = None,
+                      **kwargs) -> Dict[str, List[Shard]]:
+        """
+        Split multiple files into shards (see plan_shards)
+        
+        Columns are projected and filters and declared dtypes translated as
+        in load_multiple. Files that cannot be read in chunks are logged and
+        skipped, with their errors kept in `load_errors`.
+        
+        Args:
+            file_paths: List of file paths and/or SQLSource objects
+            n_shards: Target number of shards per file
+            names: Optional names for the datasets
+            schema_mapper: Optional SchemaMapper (see load_multiple)
+            chunksize: Rows per chunk read from a shard
+            **kwargs: Additional arguments for the read functions
+            
+        Returns:
+            Dictionary mapping names to their shards, in the order of file_paths
+        """
+        plans = {}
+        self.load_errors = {}
+        kwargs.pop('sampling', None)
+        names, projections, file_kwargs = self._read_plan(file_paths, names, schema_mapper, kwargs)
+        
+        for name, file_path, columns, kw in zip(names, file_paths, projections, file_kwargs):
+            error = None if isinstance(file_path, SQLSource) else self._stream_error(Path(file_path))
+            if error is None:
+                try:
+                    plans[name] = self.plan_shards(file_path, n_shards, columns=columns, chunksize=chunksize, **kw)
+                except Exception as e:
+                    error = str(e)
+            if error is not None:
+                self.load_errors[name] = error
+                logger.error(f"Cannot shard {file_path}: {error}")
+                
+        return plans
+    
+    def plan_shards(self,
+                    file_path: Union[str, Path, SQLSource],
+                    n_shards: int,
+                    columns: Optional[List[str]] = None,
+                    chunksize: Optional[int] = None,
+                    **kwargs) -> List[Shard]:
+        """
+        Split one input into up to n_shards contiguous shards of similar size
+        
+        Parquet files are split by row groups, Arrow IPC files by record
+        batches and
+        uncompressed CSV/TSV/JSONL files into byte ranges starting at line
+        boundaries. Other inputs (compressed files, Excel, nested JSON,
+        database sources) are a single shard. Only metadata, or a few bytes
+        around each boundary, is read, except for CSV/TSV files: line breaks
+        inside quoted values are not row boundaries, so these are scanned up
+        to the last boundary to track quote parity. Quotes are assumed to be
+        escaped by doubling them (the default); files using an escapechar for
+        quotes should not be sharded.
+        
+        Args:
+            file_path: Path to the file, or a SQLSource
+            n_shards: Target number of shards
+            columns: Optional subset of columns to read
+            chunksize: Rows per chunk read from a shard
+            **kwargs: Additional arguments for iter_chunks (filters, dtypes, ...)
+            
+        Returns:
+            List of shards covering the input, in row order
+        """
+        whole = [Shard(str(file_path) if not isinstance(file_path, SQLSource) else file_path,
+                       columns=columns, chunksize=chunksize, read_kwargs=kwargs)]
+        if isinstance(file_path, SQLSource) or n_shards <= 1:
+            return whole
+        
+        file_path = Path(file_path)
+        file_format = self._detect_format(file_path)
+        if detect_compression(file_path) is not None:
+            return whole
+        
+        if file_format == '.parquet':
+            import pyarrow.parquet as pq
+            
+            metadata = pq.ParquetFile(file_path).metadata
+            sizes = [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+            groups = [list(range(start, end)) for start, end in _split_evenly(sizes, n_shards)]
+            shards = [replace(whole[0], row_groups=group) for group in groups]
+        elif file_format in self.MEMORY_MAPPED_FORMATS:
+            import pyarrow.ipc as ipc
+            
+            reader = self._ipc_reader(file_path)
+            if not isinstance(reader, ipc.RecordBatchFileReader):
+                # Streaming format files cannot seek to a batch
+                return whole
+            # Only the footer is read: IPC writers emit batches of a fixed
+            # number of rows, so batches are split evenly by count
+            runs = _split_evenly([1] * reader.num_record_batches, n_shards)
+            shards = [replace(whole[0], batches=list(range(start, end))) for start, end in runs]
+        elif file_format in self.LINE_SPLITTABLE_FORMATS:
+            header = None
+            with open(file_path, 'rb') as f:
+                if file_format != '.jsonl':
+                    first_line = f.readline()
+                    sep = kwargs.get('sep') or ('\t' if file_format == '.tsv' else ',')
+                    header = pd.read_csv(io.BytesIO(first_line), sep=sep, nrows=0).columns.tolist()
+                start = f.tell()
+                size = os.fstat(f.fileno()).st_size
+                # JSON strings cannot hold raw newlines, but quoted CSV values can
+                quotechar = None
+                if file_format != '.jsonl' and kwargs.get('quoting') != csv.QUOTE_NONE:
+                    quotechar = kwargs.get('quotechar') or '"'
+                boundaries = _line_boundaries(f, start, size, n_shards, quotechar)
+            ranges = [(a, b) for a, b in zip(boundaries, boundaries[1:]) if b > a]
+            shards = [replace(whole[0], byte_range=r, header=header) for r in ranges]
+        else:
+            return whole
+        
+        shards = shards or whole
+        for i, shard in enumerate(shards):
+            shard.index, shard.count = i, len(shards)
+        return shards
+    
+    def iter_shard(self, shard: Shard, optimize_dtypes: Optional[bool] = None) -> Iterator[pd.DataFrame]:
+        """
+        Read one shard as a sequence of DataFrame chunks
+        
+        Chunks are filtered, projected and typed as by iter_chunks.
+        
+        Args:
+            shard: Shard from plan_shards
+            optimize_dtypes: Optimize each chunk's data types
+            
+        Yields:
+            DataFrame chunks
+        """
+        kwargs = dict(shard.read_kwargs or {})
+        if isinstance(shard.source, SQLSource):
+            yield from self.iter_sql(shard.source, chunksize=shard.chunksize, columns=shard.columns,
+                                     optimize_dtypes=optimize_dtypes, filters=kwargs.get('filters'),
+                                     dtypes=kwargs.get('dtypes'))
+            return
+        
+        file_path = Path(shard.source)
+        if shard.row_groups is None and shard.batches is None and shard.byte_range is None:
+            yield from self.iter_chunks(file_path, shard.chunksize, columns=shard.columns,
+                                        optimize_dtypes=optimize_dtypes, **kwargs)
+            return
+        
+        filters = kwargs.pop('filters', None)
+        dtypes = kwargs.pop('dtypes', None)
+        kwargs.pop('optimize_dtypes', None)
+        chunksize = shard.chunksize or self.chunksize or self.json_batch_size
+        optimize = optimize_dtypes if optimize_dtypes is not None else self.optimize_dtypes
+        read_columns = self._with_filter_columns(shard.columns, filters)
+        
+        if shard.row_groups is not None:
+            chunks = self._iter_parquet_chunks(file_path, chunksize, shard.columns, filters,
+                                               row_groups=shard.row_groups)
+        elif shard.batches is not None:
+            optimize = False
+            table = self._read_ipc(file_path, read_columns, batches=shard.batches)
+            chunks = (
+                self._select_columns(self._apply_filters(
+                    table.slice(start, chunksize).to_pandas(types_mapper=pd.ArrowDtype), filters
+                ), shard.columns)
+                for start in range(0, max(table.num_rows, 1), chunksize)
+            )
+        else:
+            chunks = (
+                self._select_columns(self._apply_filters(chunk, filters), shard.columns)
+                for chunk in self._iter_byte_range(file_path, shard, chunksize, read_columns, **kwargs)
+            )
+        
+        for chunk in chunks:
+            chunk = self._apply_dtypes(chunk, dtypes)
+            if optimize:
+                chunk = self._optimize_dtypes(chunk)
+            yield chunk
+    
+    def _iter_byte_range(self,
+                         file_path: Path,
+                         shard: Shard,
+                         chunksize: int,
+                         columns: Optional[List[str]] = None,
+                         **kwargs) -> Iterator[pd.DataFrame]:
+        """Parse the lines of a CSV/TSV/JSONL byte-range shard in chunks"""
+        file_format = self._detect_format(file_path)
+        if self.dtype_backend == 'pyarrow':
+            kwargs.setdefault('dtype_backend', 'pyarrow')
+        start, end = shard.byte_range
+        with open(file_path, 'rb') as raw:
+            raw.seek(start)
+            source = io.TextIOWrapper(io.BufferedReader(_ByteRange(raw, end - start)), encoding='utf-8')
+            if file_format == '.jsonl':
+                with pd.read_json(source, lines=True, chunksize=chunksize, **kwargs) as reader:
+                    for chunk in reader:
+                        yield self._select_columns(chunk, columns)
+            else:
+                if file_format == '.tsv':
+                    kwargs.setdefault('sep', '\t')
+                with pd.read_csv(source, header=None, names=shard.header, usecols=columns,
+                                 chunksize=chunksize, **kwargs) as reader:
+                    yield from reader
+    
+    def _stream_error(self, path: Path) -> Optional[str]:
+        """Why a path cannot be read as a stream of chunks, if it cannot"""
+        if not path.is_file():
+            return f"Not a file: {path}"
+        try:
+            self._detect_format(path)
+        except ValueError as e:
+            return str(e)
+        return None
+    
+    def _read_plan(self,
+                   file_paths: List[Union[str, Path]],
+                   names: Optional[List[str]],
+                   schema_mapper: Optional[SchemaMapper],
+                   kwargs: Dict[str, Any]) -> Tuple[List[str], List[Optional[List[str]]], List[Dict[str, Any]]]:
+        """Dataset names, column projections and read arguments of multiple files"""
+        if names is None:
+            names = [fp.name if isinstance(fp, SQLSource) else Path(fp).stem for fp in file_paths]
+        
+        if schema_mapper is not None:
+            standardized = self._standardized_headers(file_paths, schema_mapper)
+            projections = self._project_standardized(standardized)
+        else:
+            standardized = [None] * len(file_paths)
+            projections = [None] * len(file_paths)
+        
+        return names, projections, self._file_kwargs(standardized, schema_mapper, kwargs)
+    
+    def _file_kwargs(self,
+                     standardized: List[Optional[Dict[str, str]]],
+                     schema_mapper: Optional[SchemaMapper],
+                     kwargs: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Read arguments per file, with standardized field names translated to the file's own"""
+        # Filters, the stratification column and declared field types name
+        # standardized fields; each file is read using its own column names
+        if schema_mapper is None:
+            return [kwargs] * len(standardized)
+        sampling = kwargs.get('sampling') or self.sampling
+        stratify_by = sampling.stratify_by if sampling is not None else None
+        file_kwargs = []
+        for std in standardized:
+            translated = dict(kwargs)
+            if kwargs.get('filters'):
+                translated['filters'] = self._translate_filters(kwargs['filters'], std)
+            if stratify_by:
+                translated['sampling'] = replace(sampling, stratify_by=self._translate_column(stratify_by, std))
+            dtypes = self._declared_dtypes(std, schema_mapper)
+            if dtypes:
+                translated['dtypes'] = {**dtypes, **(kwargs.get('dtypes') or {})}
+            file_kwargs.append(translated)
+        return file_kwargs
+    
+    def _try_load(self,
+                  file_path: Union[str, Path],
+                  columns: Optional[List[str]],
+                  kwargs: Dict[str, Any]) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+        """Load one file, returning (DataFrame, None) or (None, error message)"""
+        try:
+            return self.load(file_path, columns=columns, **kwargs), None
+        except Exception as e:
+            return None, str(e)
+    
+    def _releases_gil(self, file_path: Union[str, Path, SQLSource]) -> bool:
+        """Whether loading a path runs mostly in Arrow, outside the GIL"""
+        if isinstance(file_path, SQLSource):
+            # Queries wait on the database; connections stay in this process
+            return True
+        file_path = Path(file_path)
+        if file_path.is_dir():
+            # Partitioned directories are scanned by multithreaded pyarrow
+            return True
+        try:
+            file_format = self._detect_format(file_path)
+        except Exception:
+            # Let the worker report the error like any other failure
+            return False
+        return file_format in self.GIL_RELEASING_FORMATS or (
+            self.dtype_backend == 'pyarrow' and file_format in self.ARROW_READER_FORMATS
+        )
+    
+    def _load_concurrently(self,
+                           file_paths: List[Union[str, Path]],
+                           projections: List[Optional[List[str]]],
+                           max_workers: int,
+                           file_kwargs: List[Dict[str, Any]]) -> List[Tuple[Optional[pd.DataFrame], Optional[str]]]:
+        """
+        Load files on a thread pool (Arrow readers) and a process pool
+        (pure-Python CSV/JSON/Excel parsing), returning outcomes in input order
+        """
+        from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+        
+        thread_pool = None
+        process_pool = None
+        futures = []
+        try:
+            for file_path, columns, kwargs in zip(file_paths, projections, file_kwargs):
+                if self._releases_gil(file_path):
+                    if thread_pool is None:
+                        thread_pool = ThreadPoolExecutor(max_workers=max_workers)
+                    futures.append(thread_pool.submit(self._try_load, file_path, columns, kwargs))
+                else:
+                    if process_pool is None:
+                        process_pool = ProcessPoolExecutor(max_workers=max_workers)
+                    futures.append(process_pool.submit(_load_in_worker, self, file_path, columns, kwargs))
+            
+            outcomes = []
+            for future in futures:
+                try:
+                    outcomes.append(future.result())
+                except Exception as e:
+                    # e.g. a worker process died or the result could not be pickled
+                    outcomes.append((None, str(e)))
+            return outcomes
+        finally:
+            for pool in (thread_pool, process_pool):
+                if pool is not None:
+                    pool.shutdown()
+    
     def load_from_directory(self, 
                           directory: Union[str, Path],
                           pattern: str = "*",
+                          partitioned: bool = False,
                           **kwargs) -> Dict[str, pd.DataFrame]:
         """
         Load all matching files from a directory
@@ -106,7 +1092,10 @@ class DataLoader:
         Args:
             directory: Directory path
             pattern: File pattern (e.g., "*.csv")
-            **kwargs: Additional arguments for read functions
+            partitioned: Treat each matching subdirectory as one Hive-partitioned
+                dataset (e.g. events/date=2024-01-01/part-0.parquet) named
+                after the subdirectory, instead of ignoring it
+            **kwargs: Additional arguments for load_multiple / read functions
             
         Returns:
             Dictionary mapping file names to DataFrames
@@ -117,27 +1106,418 @@ class DataLoader:
             raise FileNotFoundError(f"Directory not found: {directory}")
         
         # Find all matching files
-        files = list(directory.glob(pattern))
+        files = sorted(directory.glob(pattern)) if partitioned else list(directory.glob(pattern))
         
         # Filter for supported formats
-        supported_files = [f for f in files if f.suffix.lower() in self.SUPPORTED_FORMATS]
+        supported_files = [f for f in files if self._is_supported(f)]
+        
+        if partitioned:
+            datasets = [f for f in files if f.is_dir() and not f.name.startswith(('.', '_'))]
+            supported_files = datasets + [f for f in supported_files if f.is_file()]
+        
+        if not supported_files:
+            logger.warning(f"No supported files found in {directory} matching pattern {pattern}")
+            return {}
+        
+        names = [f.name if f.is_dir() else strip_compression_suffix(f).stem for f in supported_files]
+        return self.load_multiple(supported_files, names=names, **kwargs)
+    
+    def iter_directory(self,
+                       directory: Union[str, Path],
+                       pattern: str = "*",
+                       **kwargs) -> Dict[str, Iterator[pd.DataFrame]]:
+        """
+        Open all matching files of a directory as streams of chunks
+        
+        Args:
+            directory: Directory path
+            pattern: File pattern (e.g., "*.csv")
+            **kwargs: Additional arguments for iter_multiple / iter_chunks
+            
+        Returns:
+            Dictionary mapping file names to chunk iterators
+        """
+        directory = Path(directory)
+        
+        if not directory.exists():
+            raise FileNotFoundError(f"Directory not found: {directory}")
+        
+        supported_files = [f for f in sorted(directory.glob(pattern)) if f.is_file() and self._is_supported(f)]
         
         if not supported_files:
             logger.warning(f"No supported files found in {directory} matching pattern {pattern}")
             return {}
         
-        return self.load_multiple(supported_files, **kwargs)
+        names = [strip_compression_suffix(f).stem for f in supported_files]
+        return self.iter_multiple(supported_files, names=names, **kwargs)
+    
+    def load_partitioned(self,
+                         directory: Union[str, Path],
+                         columns: Optional[List[str]] = None,
+                         filters: Optional[List] = None,
+                         optimize_dtypes: Optional[bool] = None,
+                         sampling: Optional[SamplingConfig] = None,
+                         dtypes: Optional[Dict[str, str]] = None,
+                         **kwargs) -> pd.DataFrame:
+        """
+        Load a Hive-partitioned directory as one logical dataset
+        
+        Partition keys (`key=value` path segments) become columns. Parquet,
+        CSV/TSV and JSONL partitions are scanned with pyarrow.dataset, which
+        reads files in parallel and prunes partitions that cannot match the
+        filters before opening them. Other formats are loaded file by file.
+        
+        Args:
+            directory: Root directory of the partitioned dataset
+            columns: Optional subset of columns (including partition keys) to read
+            filters: Optional row filters (see load); filters on partition keys
+                skip whole partitions
+            optimize_dtypes: Optimize data types for memory efficiency
+            sampling: Optional SamplingConfig; record batches are streamed
+                through the sampler
+            dtypes: Optional read dtypes per column (see load)
+            **kwargs: Additional arguments for read functions (file-by-file path only)
+            
+        Returns:
+            DataFrame with one column per partition key
+        """
+        directory = Path(directory)
+        optimize = optimize_dtypes if optimize_dtypes is not None else self.optimize_dtypes
+        
+        dataset = self._open_partitioned(directory)
+        if dataset is not None:
+            import pyarrow.parquet as pq
+            expression = None
+            if filters:
+                expression = pq.filters_to_expression(self._coerce_arrow_filters(dataset.schema, filters))
+            types_mapper = pd.ArrowDtype if self.dtype_backend == 'pyarrow' else None
+            if sampling is not None:
+                read_columns = self._with_extra_columns(columns, [sampling.stratify_by])
+                batches = dataset.to_batches(columns=read_columns, filter=expression,
+                                             batch_size=self.SAMPLING_CHUNKSIZE)
+                chunks = (self._apply_dtypes(batch.to_pandas(types_mapper=types_mapper), dtypes)
+                          for batch in batches)
+                if optimize:
+                    chunks = (self._optimize_dtypes(chunk) for chunk in chunks)
+                return self._select_columns(self._sample_chunks(chunks, sampling), columns)
+            table = dataset.to_table(columns=columns, filter=expression, use_threads=True)
+            df = table.to_pandas(types_mapper=types_mapper)
+        else:
+            df = self._load_partition_files(directory, columns, filters, **kwargs)
+            if sampling is not None:
+                df = self._sample_chunks(iter([df]), sampling)
+        
+        df = self._apply_dtypes(df, dtypes)
+        if optimize:
+            df = self._optimize_dtypes(df)
+        return df
+    
+    def _partition_files(self, directory: Path) -> List[Path]:
+        """Data files below a partitioned directory, skipping hidden/metadata files"""
+        return sorted(
+            f for f in directory.rglob('*')
+            if f.is_file()
+            and self._is_supported(f)
+            and not any(part.startswith(('.', '_')) for part in f.relative_to(directory).parts)
+        )
+    
+    def _open_partitioned(self, directory: Path):
+        """Open a partitioned directory as a pyarrow dataset, or None if unsupported"""
+        files = self._partition_files(directory)
+        if not files:
+            raise ValueError(f"No supported files found in partitioned directory {directory}")
         
+        # pyarrow infers CSV/JSON compression from the file extension, but
+        # cannot read compressed Parquet or IPC files
+        suffix = strip_compression_suffix(files[0]).suffix.lower()
+        dataset_format = self.PARTITIONED_FORMATS.get(suffix)
+        if dataset_format is None or (dataset_format in ('parquet', 'ipc') and detect_compression(files[0])):
+            return None
+        
+        import pyarrow.csv as pv
+        import pyarrow.dataset as ds
+        if dataset_format == 'tsv':
+            dataset_format = ds.CsvFileFormat(parse_options=pv.ParseOptions(delimiter='\t'))
+        
+        # Dictionary-encoded partition keys load as pandas categories
+        partitioning = ds.HivePartitioning.discover(infer_dictionary=True)
+        return ds.dataset([str(f) for f in files], format=dataset_format,
+                          partitioning=partitioning, partition_base_dir=str(directory))
+    
+    def _load_partition_files(self,
+                              directory: Path,
+                              columns: Optional[List[str]],
+                              filters: Optional[List],
+                              **kwargs) -> pd.DataFrame:
+        """Load partition files one by one, adding partition keys as columns"""
+        frames = []
+        for file_path in self._partition_files(directory):
+            df = self._load_file(file_path, self._detect_format(file_path), **kwargs)
+            for part in file_path.relative_to(directory).parts[:-1]:
+                if '=' in part:
+                    key, value = part.split('=', 1)
+                    df[key] = value
+            frames.append(df)
+        
+        df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        return self._select_columns(self._apply_filters(df, filters), columns)
+    
+    def read_columns(self, file_path: Union[str, Path, SQLSource]) -> Optional[List[str]]:
+        """
+        Read column names from file headers/metadata without loading the data
+        
+        Reads the first line of CSV/TSV files, the Parquet footer and the
+        header row of Excel sheets. Compressed files are only decompressed as
+        far as needed (Parquet and Excel entirely). JSON and JSONL records
+        can add keys anywhere in the file, so they have no header.
+        
+        Args:
+            file_path: Path to the file, or a SQLSource
+            
+        Returns:
+            List of column names, or None if the format has no cheap header
+            (JSON and JSONL)
+        """
+        if isinstance(file_path, SQLSource):
+            return self._read_sql_columns(file_path)
+        
+        file_path = Path(file_path)
+        if file_path.is_dir():
+            dataset = self._open_partitioned(file_path)
+            return dataset.schema.names if dataset is not None else None
+        
+        file_format = self._detect_format(file_path)
+        
+        if file_format == '.csv':
+            with self._open_source(file_path, file_format) as source:
+                return pd.read_csv(source, nrows=0).columns.tolist()
+        elif file_format == '.tsv':
+            with self._open_source(file_path, file_format) as source:
+                return pd.read_csv(source, sep='\t', nrows=0).columns.tolist()
+        elif file_format == '.parquet':
+            import pyarrow.parquet as pq
+            with self._open_source(file_path, file_format) as source:
+                names = pq.read_schema(source).names
+            # Skip serialized pandas index columns
+            return [name for name in names if not name.startswith('__index_level_')]
+        elif file_format in self.MEMORY_MAPPED_FORMATS:
+            return self._ipc_reader(file_path).schema.names
+        elif file_format in ['.xlsx', '.xls']:
+            with self._open_source(file_path, file_format) as source:
+                return pd.read_excel(source, nrows=0).columns.tolist()
+        
+        return None
+    
+    def probe(self, file_path: Union[str, Path]) -> Dict[str, Any]:
+        """
+        Describe a file from its metadata without loading the data
+        
+        Parquet is described from its footer; CSV/TSV, JSONL and Excel from
+        the first HEADER_SAMPLE_RECORDS rows. Row counts of line-based files
+        are estimated from sampled blocks unless the file is small enough to
+        count exactly. Compressed files report their size on disk; their row
+        count is only known when the decompressed file fits in the sample.
+        
+        Args:
+            file_path: Path to a file or partitioned directory
+            
+        Returns:
+            Dictionary with path, format, file_size (bytes), columns, dtypes
+            (as inferred by the readers, before optimization), num_rows and
+            num_rows_exact. Columns, dtypes and num_rows are None when the
+            format has no cheap metadata (e.g. nested JSON documents).
+        """
+        file_path = Path(file_path)
+        if file_path.is_dir():
+            return self._probe_partitioned(file_path)
+        
+        file_format = self._detect_format(file_path)
+        compression = detect_compression(file_path)
+        file_size = file_path.stat().st_size
+        sample = None
+        num_rows, exact = None, False
+        
+        if file_format == '.parquet':
+            import pyarrow.parquet as pq
+            with self._open_source(file_path, file_format) as source:
+                metadata = pq.read_metadata(source)
+            sample = metadata.schema.to_arrow_schema().empty_table().to_pandas()
+            num_rows, exact = metadata.num_rows, True
+        elif file_format in self.MEMORY_MAPPED_FORMATS:
+            sample = self._ipc_reader(file_path).schema.empty_table().to_pandas(types_mapper=pd.ArrowDtype)
+            num_rows, exact = self._ipc_num_rows(file_path), True
+        elif file_format in ['.csv', '.tsv']:
+            sep = '\t' if file_format == '.tsv' else ','
+            with self._open_source(file_path, file_format) as source:
+                sample = pd.read_csv(source, sep=sep, nrows=self.HEADER_SAMPLE_RECORDS)
+            num_lines, exact = _count_lines(file_path, self.PROBE_SAMPLE_BYTES, compression)
+            if num_lines is not None:
+                num_rows = max(num_lines - 1, 0)  # header line
+        elif file_format == '.jsonl':
+            with self._open_source(file_path, file_format) as source:
+                sample = pd.read_json(source, lines=True, nrows=self.HEADER_SAMPLE_RECORDS)
+            num_rows, exact = _count_lines(file_path, self.PROBE_SAMPLE_BYTES, compression)
+        elif file_format in ['.xlsx', '.xls']:
+            with self._open_source(file_path, file_format) as source:
+                sample = pd.read_excel(source, nrows=self.HEADER_SAMPLE_RECORDS)
+            # The sample only gives the row count if it covers the whole sheet
+            if len(sample) < self.HEADER_SAMPLE_RECORDS:
+                num_rows, exact = len(sample), True
+        
+        return {
+            'path': str(file_path),
+            'format': file_format,
+            'file_size': file_size,
+            'columns': sample.columns.tolist() if sample is not None else None,
+            'dtypes': {col: str(dtype) for col, dtype in sample.dtypes.items()} if sample is not None else None,
+            'num_rows': num_rows,
+            'num_rows_exact': exact
+        }
+    
+    def _probe_partitioned(self, directory: Path) -> Dict[str, Any]:
+        """Describe a partitioned directory from its dataset schema and per-file probes"""
+        files = self._partition_files(directory)
+        dataset = self._open_partitioned(directory)
+        probes = [self.probe(f) for f in files]
+        
+        if dataset is not None:
+            sample = dataset.schema.empty_table().to_pandas()
+            columns = sample.columns.tolist()
+            dtypes = {col: str(dtype) for col, dtype in sample.dtypes.items()}
+        else:
+            columns, dtypes = probes[0]['columns'], probes[0]['dtypes']
+        
+        counts = [p['num_rows'] for p in probes]
+        return {
+            'path': str(directory),
+            'format': self._detect_format(files[0]),
+            'file_size': sum(p['file_size'] for p in probes),
+            'columns': columns,
+            'dtypes': dtypes,
+            'num_rows': sum(counts) if None not in counts else None,
+            'num_rows_exact': all(p['num_rows_exact'] for p in probes)
+        }
+    
+    def project_columns(self,
+                        file_paths: List[Union[str, Path]],
+                        schema_mapper: SchemaMapper) -> List[Optional[List[str]]]:
+        """
+        Work out which columns of each file map to fields common to all files
+        
+        Only headers are read. Column names are standardized with the schema
+        mapper, the standardized names are intersected across files, and each
+        file is projected onto its columns that map into that intersection.
+        
+        Args:
+            file_paths: List of file paths
+            schema_mapper: SchemaMapper used to standardize column names
+            
+        Returns:
+            List with, per file, the original column names to read, or None
+            to read the whole file
+        """
+        return self._project_standardized(self._standardized_headers(file_paths, schema_mapper))
+    
+    def _project_standardized(self,
+                              standardized: List[Optional[Dict[str, str]]]) -> List[Optional[List[str]]]:
+        """Project standardized headers (see _standardized_headers) onto their common fields"""
+        known = [std for std in standardized if std is not None]
+        if not known:
+            return [None] * len(standardized)
+        
+        common_fields = set(known[0].values())
+        for std in known[1:]:
+            common_fields &= set(std.values())
+        
+        if not common_fields:
+            logger.warning("No common fields found in file headers; loading all columns")
+            return [None] * len(standardized)
+        
+        logger.info(f"Projecting {len(standardized)} files onto {len(common_fields)} common fields")
+        return [
+            None if std is None else [col for col, name in std.items() if name in common_fields]
+            for std in standardized
+        ]
+    
+    def _standardized_headers(self,
+                              file_paths: List[Union[str, Path]],
+                              schema_mapper: SchemaMapper) -> List[Optional[Dict[str, str]]]:
+        """Map each file's original column names to standardized names (None if unknown)"""
+        standardized = []
+        for file_path in file_paths:
+            try:
+                columns = self.read_columns(file_path)
+            except Exception as e:
+                logger.warning(f"Could not read header of {file_path}: {e}")
+                columns = None
+            
+            # Files without a readable header are loaded in full; the intersection
+            # of the known headers is still a superset of the true common fields
+            if columns is None:
+                standardized.append(None)
+                continue
+            rename_map = schema_mapper.resolve_columns(columns)
+            standardized.append({col: rename_map.get(col, col) for col in columns})
+        return standardized
+    
+    def _declared_dtypes(self,
+                         standardized: Optional[Dict[str, str]],
+                         schema_mapper: SchemaMapper) -> Dict[str, str]:
+        """Read dtypes for a file's columns whose standard field declares a data type"""
+        if standardized is None:
+            return {}
+        dtypes = {}
+        for col, name in standardized.items():
+            mapping = schema_mapper.standard_fields.get(name)
+            dtype = self.DECLARED_DTYPES.get(mapping.data_type) if mapping is not None else None
+            if dtype is not None:
+                dtypes[col] = dtype
+        return dtypes
+    
+    def _translate_column(self, column: str, standardized: Optional[Dict[str, str]]) -> str:
+        """Map a standardized field name to a file's own column name"""
+        if standardized is None or column in standardized:
+            return column
+        for col, name in standardized.items():
+            if name == column:
+                return col
+        return column
+    
+    def _translate_filters(self, filters: List, standardized: Optional[Dict[str, str]]) -> List:
+        """Rewrite filters on standardized field names to a file's own column names"""
+        if standardized is None:
+            return filters
+        
+        def translate(col):
+            return self._translate_column(col, standardized)
+        
+        if isinstance(filters[0], tuple):
+            return [(translate(col), op, value) for col, op, value in filters]
+        return [[(translate(col), op, value) for col, op, value in group] for group in filters]
+        
+    def _is_supported(self, file_path: Path) -> bool:
+        """Whether a path has a supported (optionally compressed) extension"""
+        return strip_compression_suffix(file_path).suffix.lower() in self.SUPPORTED_FORMATS
+    
+    def _open_source(self, file_path: Path, file_format: str, text: bool = False):
+        """Open a file for a reader, decompressing it on the fly if needed (see open_source)"""
+        return open_source(file_path, detect_compression(file_path),
+                           seekable=file_format in self.SEEKABLE_FORMATS, text=text,
+                           max_workers=self.decompress_workers)
+    
     def _detect_format(self, file_path: Path) -> str:
-        """Detect file format from extension"""
-        suffix = file_path.suffix.lower()
+        """Detect file format from extension, looking through compression suffixes"""
+        compression = detect_compression(file_path)
+        suffix = strip_compression_suffix(file_path).suffix.lower()
         
         if suffix not in self.SUPPORTED_FORMATS:
-            # Try to detect from content
-            with open(file_path, 'rb') as f:
+            # Try to detect from (decompressed) content
+            with (open_decompressed(file_path, compression) if compression else open(file_path, 'rb')) as f:
                 header = f.read(100)
                 if b'PAR1' in header:
                     return '.parquet'
+                elif header.startswith(b'ARROW1'):
+                    return '.arrow'
                 elif b',' in header or b'\t' in header:
                     return '.csv'
                 elif header.startswith(b'{') or header.startswith(b'['):
@@ -147,102 +1527,463 @@ class DataLoader:
         
         return suffix
     
-    def _load_file(self, file_path: Path, file_format: str, **kwargs) -> pd.DataFrame:
-        """Load data based on file format"""
+    def _load_file(self,
+                   file_path: Path,
+                   file_format: str,
+                   columns: Optional[List[str]] = None,
+                   filters: Optional[List] = None,
+                   dtypes: Optional[Dict[str, str]] = None,
+                   **kwargs) -> pd.DataFrame:
+        """Load data based on file format, reading only `columns` if given"""
+        kwargs = self._backend_kwargs(file_format, kwargs)
         
-        if file_format == '.csv':
-            return pd.read_csv(file_path, **kwargs)
-        elif file_format == '.tsv':
-            return pd.read_csv(file_path, sep='\t', **kwargs)
-        elif file_format == '.parquet':
-            return pd.read_parquet(file_path, **kwargs)
-        elif file_format == '.json':
-            # Try regular JSON first
+        if file_format in self.MEMORY_MAPPED_FORMATS:
+            # Arrow-backed columns wrap the mapped buffers, whatever the dtype_backend
+            return self._read_ipc(file_path, columns, filters).to_pandas(types_mapper=pd.ArrowDtype)
+        
+        if file_format == '.parquet':
+            with self._open_source(file_path, file_format) as source:
+                # Filters are pushed into the reader and prune row groups
+                if filters:
+                    import pyarrow.parquet as pq
+                    filters = self._coerce_arrow_filters(pq.read_schema(source), filters)
+                df = pd.read_parquet(source, columns=columns, filters=filters or None, **kwargs)
+            return self._apply_dtypes(df, dtypes)
+        
+        # Other readers filter after parsing, so read the filter columns too
+        read_columns = self._with_filter_columns(columns, filters)
+        
+        if file_format in ['.csv', '.tsv']:
+            df = self._read_csv(file_path, file_format, read_columns, dtypes, kwargs)
+            return self._select_columns(self._apply_filters(self._apply_dtypes(df, dtypes), filters), columns)
+        
+        with self._open_source(file_path, file_format) as source:
+            if file_format == '.json':
+                # Nested or large documents go straight to the streaming
+                # parser; others try regular JSON first
+                df = None
+                if not self._stream_json(file_path):
+                    try:
+                        df = pd.read_json(source, **kwargs)
+                    except (ValueError, json.JSONDecodeError):
+                        pass
+            elif file_format == '.jsonl' and read_columns is not None and kwargs.get('engine') != 'pyarrow':
+                # Parse in batches, keeping only the wanted columns of each, so
+                # peak memory holds all columns of one batch only (the pyarrow
+                # engine cannot read in batches but parses into compact columns)
+                with pd.read_json(source, lines=True, chunksize=self.json_batch_size, **kwargs) as reader:
+                    df = self._concat_chunks(self._select_columns(chunk, read_columns) for chunk in reader)
+            elif file_format == '.jsonl':
+                df = pd.read_json(source, lines=True, **kwargs)
+            elif file_format in ['.xlsx', '.xls']:
+                df = pd.read_excel(source, usecols=read_columns, **kwargs)
+            else:
+                raise ValueError(f"Unsupported format: {file_format}")
+        
+        if df is None:
+            # Try as nested JSON (reopens the file, the stream is consumed)
+            df = self._load_nested_json(file_path)
+            if self.dtype_backend == 'pyarrow':
+                df = df.convert_dtypes(dtype_backend='pyarrow')
+        
+        return self._select_columns(self._apply_filters(self._apply_dtypes(df, dtypes), filters), columns)
+    
+    def _read_csv(self,
+                  file_path: Path,
+                  file_format: str,
+                  columns: Optional[List[str]],
+                  dtypes: Optional[Dict[str, str]],
+                  kwargs: Dict[str, Any]) -> pd.DataFrame:
+        """
+        Read a CSV/TSV file, parsing declared numeric and datetime dtypes
+        inside the reader
+        
+        If the values do not fit the declared dtypes the file is read again
+        without them and converted afterwards (see _apply_dtypes), so bad
+        values become missing instead of failing the load.
+        """
+        if file_format == '.tsv':
+            kwargs = {'sep': '\t', **kwargs}
+        
+        dtype_kwargs = {}
+        if dtypes and kwargs.get('engine') != 'pyarrow':
+            dtype_kwargs = self._csv_dtype_kwargs(dtypes, columns)
+            # Explicit reader arguments win
+            dtype_kwargs = {key: value for key, value in dtype_kwargs.items() if key not in kwargs}
+        
+        if dtype_kwargs:
             try:
-                return pd.read_json(file_path, **kwargs)
-            except (ValueError, json.JSONDecodeError):
-                # Try as nested JSON
-                return self._load_nested_json(file_path)
-        elif file_format == '.jsonl':
-            return pd.read_json(file_path, lines=True, **kwargs)
-        elif file_format in ['.xlsx', '.xls']:
-            return pd.read_excel(file_path, **kwargs)
+                with self._open_source(file_path, file_format) as source:
+                    return pd.read_csv(source, usecols=columns, **dtype_kwargs, **kwargs)
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Declared dtypes do not fit {file_path} ({e}); converting after parsing")
+        
+        with self._open_source(file_path, file_format) as source:
+            return pd.read_csv(source, usecols=columns, **kwargs)
+    
+    def _csv_dtype_kwargs(self, dtypes: Dict[str, str], columns: Optional[List[str]]) -> Dict[str, Any]:
+        """pd.read_csv dtype / parse_dates arguments for declared dtypes"""
+        if columns is not None:
+            dtypes = {col: dtype for col, dtype in dtypes.items() if col in columns}
+        
+        csv_kwargs = {}
+        # Categories parsed by read_csv are always strings, which would not
+        # match numeric categories from typed formats; those are converted
+        # after parsing instead
+        dtype = {col: value for col, value in dtypes.items() if value == 'float32'}
+        parse_dates = [col for col, value in dtypes.items() if value == 'datetime']
+        if dtype:
+            csv_kwargs['dtype'] = dtype
+        if parse_dates:
+            csv_kwargs['parse_dates'] = parse_dates
+        return csv_kwargs
+    
+    def _apply_dtypes(self, df: pd.DataFrame, dtypes: Optional[Dict[str, str]]) -> pd.DataFrame:
+        """
+        Convert columns to declared read dtypes unless they already have them
+        
+        Arrow-backed columns keep the types the Arrow readers gave them.
+        Values that cannot be converted become missing.
+        """
+        if not dtypes:
+            return df
+        
+        converted = {}
+        for col, dtype in dtypes.items():
+            if col not in df.columns or isinstance(df[col], pd.DataFrame):
+                continue
+            series = df[col]
+            if isinstance(series.dtype, pd.ArrowDtype):
+                continue
+            try:
+                if dtype == 'category' and not isinstance(series.dtype, pd.CategoricalDtype):
+                    converted[col] = series.astype('category')
+                elif dtype == 'datetime' and not pd.api.types.is_datetime64_any_dtype(series.dtype):
+                    converted[col] = pd.to_datetime(series, errors='coerce')
+                elif dtype == 'float32' and series.dtype != np.float32:
+                    converted[col] = pd.to_numeric(series, errors='coerce').astype(np.float32)
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Could not convert column '{col}' to {dtype}: {e}")
+        
+        if not converted:
+            return df
+        
+        df = df.copy(deep=False)
+        for col, values in converted.items():
+            df[col] = values
+        return df
+    
+    def _read_ipc(self,
+                  file_path: Path,
+                  columns: Optional[List[str]] = None,
+                  filters: Optional[List] = None,
+                  batches: Optional[List[int]] = None):
+        """
+        Read an Arrow IPC / Feather file as a memory-mapped Arrow table
+        
+        The table's buffers point into the mapped file, so only the pages of
+        the columns actually used are read, and processes mapping the same
+        file share one copy in the OS page cache. Filtering materializes the
+        matching rows; compressed files are decompressed into memory, and
+        files with compressed buffers (e.g. Feather with zstd) only the
+        batches read.
+        
+        Args:
+            file_path: Path to the IPC file (file or streaming format)
+            columns: Optional subset of columns to keep
+            filters: Optional row filters in pyarrow DNF form (see load)
+            batches: Optional record batches to read (file format only)
+            
+        Returns:
+            pyarrow Table
+        """
+        import pyarrow as pa
+        
+        reader = self._ipc_reader(file_path)
+        if batches is None:
+            table = reader.read_all()
         else:
-            raise ValueError(f"Unsupported format: {file_format}")
+            table = pa.Table.from_batches([reader.get_batch(i) for i in batches], schema=reader.schema)
+        
+        if filters:
+            import pyarrow.dataset as ds
+            import pyarrow.parquet as pq
+            expression = pq.filters_to_expression(self._coerce_arrow_filters(table.schema, filters))
+            table = ds.dataset(table).to_table(filter=expression)
+        if columns is not None:
+            table = table.select(columns)
+        return table
+    
+    def _ipc_reader(self, file_path: Path):
+        """Open an Arrow IPC file (memory-mapped unless compressed) for reading its batches"""
+        import pyarrow as pa
+        import pyarrow.ipc as ipc
+        
+        if detect_compression(file_path) is None:
+            source = pa.memory_map(str(file_path), 'r')
+        else:
+            with self._open_source(file_path, '.arrow') as buffer:
+                source = pa.BufferReader(buffer.getvalue())
+        
+        try:
+            return ipc.open_file(source)
+        except pa.ArrowInvalid:
+            # Streaming format files have no footer
+            source.seek(0)
+            return ipc.open_stream(source)
+    
+    def _ipc_num_rows(self, file_path: Path) -> int:
+        """Rows of an Arrow IPC file, counted from batch metadata where possible"""
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        
+        if detect_compression(file_path) is None:
+            try:
+                return ds.dataset(str(file_path), format='ipc').count_rows()
+            except (pa.ArrowInvalid, OSError):
+                pass
+        return self._read_ipc(file_path).num_rows
+    
+    def _with_extra_columns(self,
+                            columns: Optional[List[str]],
+                            extra: List[Optional[str]]) -> Optional[List[str]]:
+        """Extend a column projection with additional columns needed while reading"""
+        if columns is None:
+            return columns
+        missing = [col for col in extra if col is not None and col not in columns]
+        return list(columns) + list(dict.fromkeys(missing))
+    
+    def _with_filter_columns(self,
+                             columns: Optional[List[str]],
+                             filters: Optional[List]) -> Optional[List[str]]:
+        """Extend a column projection with the columns referenced by filters"""
+        if not filters:
+            return columns
+        return self._with_extra_columns(columns, [col for col, _, _ in _filter_terms(filters)])
+    
+    def _apply_filters(self, df: pd.DataFrame, filters: Optional[List]) -> pd.DataFrame:
+        """Apply DNF row filters to an already parsed DataFrame"""
+        if not filters:
+            return df
+        
+        groups = [filters] if isinstance(filters[0], tuple) else filters
+        mask = pd.Series(False, index=df.index)
+        for group in groups:
+            group_mask = pd.Series(True, index=df.index)
+            for col, op, value in group:
+                if op not in _FILTER_OPS:
+                    raise ValueError(f"Unsupported filter operator: {op}")
+                series = df[col]
+                group_mask &= _FILTER_OPS[op](series, _coerce_filter_value(series, value)).fillna(False).astype(bool)
+            mask |= group_mask
+        return df[mask]
+    
+    def _coerce_arrow_filters(self, schema, filters: List) -> List:
+        """
+        Cast string filter values to the column types of an Arrow schema
+        
+        Lets filters such as ('date', '>=', '2024-01-01') from the command line
+        compare against timestamp or numeric columns.
+        """
+        import pyarrow as pa
+        
+        def coerce(col, value):
+            if col not in schema.names:
+                return value
+            field_type = schema.field(col).type
+            if isinstance(value, (list, tuple, set)):
+                return [coerce(col, v) for v in value]
+            if isinstance(value, str) and not (pa.types.is_string(field_type) or
+                                               pa.types.is_large_string(field_type) or
+                                               pa.types.is_dictionary(field_type)):
+                try:
+                    return pa.scalar(value).cast(field_type).as_py()
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                    return value
+            return value
+        
+        groups = [filters] if isinstance(filters[0], tuple) else filters
+        coerced = [[(col, op, coerce(col, value)) for col, op, value in group] for group in groups]
+        return coerced[0] if isinstance(filters[0], tuple) else coerced
+    
+    def _backend_kwargs(self, file_format: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Add reader arguments for the configured dtype backend"""
+        if self.dtype_backend != 'pyarrow':
+            return kwargs
+        
+        backend_kwargs = {'dtype_backend': 'pyarrow'}
+        if file_format in ['.csv', '.tsv', '.jsonl']:
+            # Multithreaded Arrow parser instead of the pandas C/Python parser
+            backend_kwargs['engine'] = 'pyarrow'
+        return {**backend_kwargs, **kwargs}
+    
+    def _select_columns(self, df: pd.DataFrame, columns: Optional[List[str]]) -> pd.DataFrame:
+        """Select columns for readers that cannot project while parsing"""
+        if columns is None:
+            return df
+        return df[[col for col in columns if col in df.columns]]
+    
+    def _stream_json(self, file_path: Path) -> bool:
+        """
+        Whether a JSON document is better parsed record by record
+        
+        Top-level arrays larger than JSON_READ_MAX_BYTES, or whose first
+        record is nested, are streamed (see iter_nested_json). Other
+        documents, including the column-oriented layouts only pd.read_json
+        understands, are read whole. Only the first record is parsed.
+        """
+        with self._open_source(file_path, '.json', text=True) as f:
+            head = f.read(4096).lstrip()
+            if not head.startswith('['):
+                return False
+        if file_path.stat().st_size > self.JSON_READ_MAX_BYTES:
+            return True
+        with self._open_source(file_path, '.json', text=True) as f:
+            record = next(_iter_json_records(f), None)
+        return isinstance(record, dict) and any(isinstance(value, (dict, list)) for value in record.values())
     
     def _load_nested_json(self, file_path: Path) -> pd.DataFrame:
         """Load and flatten nested JSON"""
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        
-        # Helper function to flatten nested structures
-        def flatten_dict(d, parent_key='', sep='_'):
-            items = []
-            for k, v in d.items():
-                new_key = f"{parent_key}{sep}{k}" if parent_key else k
-                
-                if isinstance(v, dict):
-                    items.extend(flatten_dict(v, new_key, sep=sep).items())
-                elif isinstance(v, list):
-                    if len(v) > 0 and isinstance(v[0], dict):
-                        # List of dicts - create numbered entries
-                        for i, item in enumerate(v[:10]):  # Limit to first 10 items
-                            items.extend(flatten_dict(item, f"{new_key}_{i}", sep=sep).items())
-                    else:
-                        items.append((new_key, str(v)))
+        batches = list(self.iter_nested_json(file_path))
+        if not batches:
+            return pd.DataFrame()
+        return pd.concat(batches, ignore_index=True)
+    
+    def iter_nested_json(self,
+                         file_path: Union[str, Path],
+                         batch_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """
+        Stream a nested JSON document as flattened DataFrame batches
+        
+        Records are parsed one at a time from a top-level array (or a
+        sequence of concatenated JSON values) and flattened straight into
+        per-column buffers, so memory is bounded by the batch size rather
+        than the file size. Nested objects become `parent_child` columns,
+        lists of objects become `parent_<i>_child` columns for the first
+        `max_list_items` items and other lists are stored as strings.
+        
+        Args:
+            file_path: Path to the JSON file
+            batch_size: Records per batch (defaults to json_batch_size)
+            
+        Yields:
+            DataFrames of up to batch_size flattened records
+        """
+        batch_size = batch_size or self.json_batch_size
+        buffers: Dict[str, list] = {}
+        n_rows = 0
+        
+        with self._open_source(Path(file_path), '.json', text=True) as f:
+            for record in _iter_json_records(f):
+                flat = {}
+                if isinstance(record, dict):
+                    _flatten_record(record, flat, '', self.max_list_items)
                 else:
-                    items.append((new_key, v))
-            return dict(items)
-        
-        # Handle different JSON structures
-        if isinstance(data, dict):
-            data = [data]
-        elif not isinstance(data, list):
-            data = [{'value': data}]
-        
-        # Flatten each record
-        flattened_records = []
-        for record in data:
-            if isinstance(record, dict):
-                flat_record = flatten_dict(record)
-            else:
-                flat_record = {'value': record}
-            flattened_records.append(flat_record)
+                    flat['value'] = record
+                
+                for key, value in flat.items():
+                    buffer = buffers.get(key)
+                    if buffer is None:
+                        # Column first seen in this batch: pad earlier rows
+                        buffer = buffers[key] = [None] * n_rows
+                    buffer.append(value)
+                n_rows += 1
+                for buffer in buffers.values():
+                    if len(buffer) < n_rows:
+                        buffer.append(None)
+                
+                if n_rows >= batch_size:
+                    yield pd.DataFrame(buffers)
+                    buffers = {}
+                    n_rows = 0
         
-        return pd.DataFrame(flattened_records)
+        if n_rows:
+            yield pd.DataFrame(buffers)
     
     def _optimize_dtypes(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Optimize data types for memory efficiency"""
+        """
+        Optimize data types for memory efficiency
         
-        for col in df.columns:
-            col_type = df[col].dtype
-            
-            # Skip if already optimized or is datetime
-            if col_type == 'category' or 'datetime' in str(col_type):
+        All casts are decided in a single pass over the columns and the
+        result is built once: integers are downcast from their min/max,
+        floats to float32 when lossless, string columns holding numbers or
+        ISO-8601 timestamps are parsed, and low-cardinality strings become
+        categories. Cardinality is estimated from a fixed-size sample.
+        """
+        rng = np.random.default_rng(0)
+        new_columns = {}
+        
+        for i, dtype in enumerate(df.dtypes):
+            # Arrow-backed columns are already compact; categories and
+            # datetimes are already optimized
+            if isinstance(dtype, (pd.ArrowDtype, pd.CategoricalDtype)) or \
+                    pd.api.types.is_datetime64_any_dtype(dtype):
                 continue
             
-            # Optimize numeric types
-            if col_type != 'object':
+            series = df.iloc[:, i]
+            try:
+                if isinstance(dtype, np.dtype) and dtype.kind in 'iuf':
+                    values = _downcast_numeric(series.to_numpy())
+                    if values is not None:
+                        new_columns[i] = values
+                elif pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+                    converted = self._optimize_strings(series, rng)
+                    if converted is not None:
+                        new_columns[i] = converted
+            except (TypeError, ValueError):
+                continue
+        
+        if not new_columns:
+            return df
+        
+        # Build the new frame once; unchanged columns are not copied
+        optimized = pd.DataFrame(
+            {i: new_columns.get(i, df.iloc[:, i]) for i in range(df.shape[1])},
+            index=df.index,
+            copy=False
+        )
+        optimized.columns = df.columns
+        optimized.attrs.update(df.attrs)
+        return optimized
+    
+    def _optimize_strings(self, series: pd.Series, rng: np.random.Generator) -> Optional[Any]:
+        """Pick a compact representation for a string/object column, or None to keep it"""
+        n_total = len(series)
+        if n_total == 0:
+            return None
+        
+        if n_total > self.CARDINALITY_SAMPLE_SIZE:
+            positions = rng.choice(n_total, self.CARDINALITY_SAMPLE_SIZE, replace=False)
+            sample = series.iloc[np.sort(positions)]
+        else:
+            sample = series
+        non_null = sample.dropna()
+        
+        if len(non_null) > 0 and non_null.map(type).eq(str).all():
+            # Numeric strings (but not zero-padded codes such as zip codes);
+            # the sample only suggests the cast, which would lose the zeros
+            # of any padded value, so the whole column is checked for them
+            if not non_null.str.match(r'^\s*[+-]?0\d').any() and \
+                    pd.to_numeric(non_null, errors='coerce').notna().all() and \
+                    not series.str.match(r'^\s*[+-]?0\d', na=False).any():
                 try:
-                    # Try to downcast numeric types
-                    if 'int' in str(col_type):
-                        df[col] = pd.to_numeric(df[col], downcast='integer')
-                    elif 'float' in str(col_type):
-                        df[col] = pd.to_numeric(df[col], downcast='float')
-                except:
+                    numeric = pd.to_numeric(series).to_numpy()
+                    return _downcast_numeric(numeric) if numeric.dtype.kind in 'iuf' else None
+                except (TypeError, ValueError):
                     pass
             
-            # Convert low-cardinality strings to category
-            elif col_type == 'object':
+            # ISO-8601 timestamp strings
+            if pd.to_datetime(non_null, errors='coerce', format='ISO8601').notna().all():
                 try:
-                    num_unique = df[col].nunique()
-                    num_total = len(df[col])
-                    if num_total > 0 and num_unique / num_total < 0.5:
-                        df[col] = df[col].astype('category')
-                except:
+                    return pd.to_datetime(series, format='ISO8601')
+                except (TypeError, ValueError):
                     pass
         
-        return df
+        # Low-cardinality strings to category; a sample's distinct ratio
+        # over-estimates the full column's, so this never over-converts
+        if sample.nunique() / len(sample) < 0.5:
+            return series.astype('category')
+        return None
     
     def get_info(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Get DataFrame information"""
@@ -267,5 +2008,351 @@ class DataLoader:
             df.to_json(file_path, **kwargs)
         elif suffix in ['.xlsx', '.xls']:
             df.to_excel(file_path, index=False, **kwargs)
+        elif suffix in ['.arrow', '.feather', '.ipc']:
+            # Uncompressed so that loads can memory-map the buffers
+            kwargs.setdefault('compression', 'uncompressed')
+            df.reset_index(drop=True).to_feather(file_path, **kwargs)
         else:
             raise ValueError(f"Unsupported format for saving: {suffix}")
+
+
+def _load_in_worker(loader: DataLoader,
+                    file_path: Union[str, Path],
+                    columns: Optional[List[str]],
+                    kwargs: Dict[str, Any]) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+    """Process pool entry point for DataLoader._load_concurrently"""
+    return loader._try_load(file_path, columns, kwargs)
+
+
+def _regroup_batches(batches: Iterator, chunksize: int, types_mapper=None) -> Iterator[pd.DataFrame]:
+    """Regroup Arrow record batches into DataFrames of at least chunksize rows"""
+    import pyarrow as pa
+    
+    pending = []
+    n_rows = 0
+    for batch in batches:
+        pending.append(batch)
+        n_rows += batch.num_rows
+        if n_rows >= chunksize:
+            yield pa.Table.from_batches(pending).to_pandas(types_mapper=types_mapper)
+            pending = []
+            n_rows = 0
+    if pending:
+        yield pa.Table.from_batches(pending).to_pandas(types_mapper=types_mapper)
+
+
+def _split_evenly(sizes: List[int], n_parts: int) -> List[Tuple[int, int]]:
+    """Split consecutive items into at most n_parts (start, end) runs of similar total size"""
+    total = sum(sizes)
+    runs = []
+    start = 0
+    cumulative = 0
+    for i, size in enumerate(sizes):
+        cumulative += size
+        # Close the run once it reaches its share of the total
+        if cumulative * n_parts >= total * (len(runs) + 1) and i + 1 < len(sizes):
+            runs.append((start, i + 1))
+            start = i + 1
+    if start < len(sizes):
+        runs.append((start, len(sizes)))
+    return runs
+
+
+def _line_boundaries(f: BinaryIO,
+                     start: int,
+                     size: int,
+                     n_parts: int,
+                     quotechar: Optional[str] = None,
+                     block_size: int = 1 << 24) -> List[int]:
+    """
+    Offsets splitting bytes start..size of f into up to n_parts runs of whole lines
+    
+    Each boundary is the start of the first line at or after its share of
+    the range. With a quotechar, line breaks after an odd number of quote
+    characters are inside a quoted value and skipped; this needs every byte
+    before the last boundary to be read.
+    """
+    targets = [start + (size - start) * i // n_parts for i in range(1, n_parts)]
+    boundaries = [start]
+    if quotechar is None:
+        for target in targets:
+            f.seek(max(target, boundaries[-1]))
+            f.readline()
+            if f.tell() < size:
+                boundaries.append(f.tell())
+        boundaries.append(size)
+        return boundaries
+    
+    quote = quotechar.encode('utf-8')
+    f.seek(start)
+    block_start, quoted = start, False
+    targets.reverse()
+    while targets:
+        block = f.read(block_size)
+        if not block:
+            break
+        block_end = block_start + len(block)
+        i = 0
+        while targets and targets[-1] < block_end:
+            # First line break at or after the target with an even number of quotes before it
+            i = max(i, targets[-1] - block_start, boundaries[-1] - block_start)
+            inside = quoted ^ (block.count(quote, 0, i) % 2 == 1)
+            newline = block.find(b'\n', i)
+            while newline >= 0:
+                inside ^= block.count(quote, i, newline) % 2 == 1
+                if not inside:
+                    break
+                i = newline
+                newline = block.find(b'\n', newline + 1)
+            if newline < 0:
+                # Keep looking from the start of the next block
+                targets[-1] = block_end
+                break
+            i = newline + 1
+            targets.pop()
+            if block_start + i < size:
+                boundaries.append(block_start + i)
+        quoted ^= block.count(quote) % 2 == 1
+        block_start = block_end
+    boundaries.append(size)
+    return boundaries
+
+
+class _ByteRange(io.RawIOBase):
+    """Read-only view of the next `length` bytes of a binary file"""
+    
+    def __init__(self, raw: BinaryIO, length: int):
+        self.raw = raw
+        self.remaining = length
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, buffer) -> int:
+        if self.remaining <= 0:
+            return 0
+        view = memoryview(buffer)[:self.remaining]
+        n = self.raw.readinto(view)
+        self.remaining -= n
+        return n
+
+
+def _count_lines(file_path: Path,
+                 sample_bytes: int,
+                 compression: Optional[str] = None,
+                 num_blocks: int = 8) -> Tuple[Optional[int], bool]:
+    """
+    Count the lines of a file, estimating from sampled blocks if it is large
+    
+    Args:
+        file_path: Path to the file
+        sample_bytes: Files up to this size are counted exactly; larger files
+            are estimated from num_blocks evenly spaced blocks totalling
+            sample_bytes
+        compression: Compression of the file; compressed files cannot be
+            sampled at random offsets and are only counted if their
+            decompressed content fits in sample_bytes
+        num_blocks: Number of blocks sampled for the estimate
+        
+    Returns:
+        Tuple of (line count or None if unknown, whether the count is exact)
+    """
+    if compression is not None:
+        with open_decompressed(file_path, compression) as f:
+            data = f.read(sample_bytes + 1)
+        if len(data) > sample_bytes:
+            return None, False
+        return data.count(b'\n') + (bool(data) and not data.endswith(b'\n')), True
+    
+    file_size = file_path.stat().st_size
+    if file_size == 0:
+        return 0, True
+    
+    with open(file_path, 'rb') as f:
+        if file_size <= sample_bytes:
+            data = f.read()
+            # A last line without a trailing newline still counts
+            return data.count(b'\n') + (not data.endswith(b'\n')), True
+        
+        block_size = sample_bytes // num_blocks
+        stride = (file_size - block_size) // (num_blocks - 1)
+        newlines = 0
+        for i in range(num_blocks):
+            f.seek(i * stride)
+            newlines += f.read(block_size).count(b'\n')
+    
+    return round(file_size * newlines / (block_size * num_blocks)), False
+
+
+def _dtype_kind(series: pd.Series) -> str:
+    """Broad type of a column's values: bool, numeric, datetime or text"""
+    if pd.api.types.is_bool_dtype(series):
+        return 'bool'
+    if pd.api.types.is_numeric_dtype(series):
+        return 'numeric'
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return 'datetime'
+    return 'text'
+
+
+def _as_text(series: pd.Series) -> pd.Series:
+    """A column's values as strings, keeping nulls"""
+    return series.astype(str).astype(object).where(series.notna(), None)
+
+
+def _downcast_numeric(values: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Downcast a NumPy numeric array, or return None if it cannot shrink
+    
+    Integers go to the smallest signed type holding their min/max; floats go
+    to float32 when values survive the round trip (same tolerance as
+    pd.to_numeric(downcast='float')).
+    """
+    if values.dtype.kind in 'iu':
+        if len(values) == 0:
+            return None
+        lo, hi = values.min(), values.max()
+        for candidate in (np.int8, np.int16, np.int32, np.int64):
+            info = np.iinfo(candidate)
+            if info.min <= lo and hi <= info.max:
+                if np.dtype(candidate).itemsize < values.dtype.itemsize:
+                    return values.astype(candidate)
+                return None
+        return None
+    
+    if values.dtype.kind == 'f' and values.dtype.itemsize > 4:
+        with np.errstate(over='ignore'):
+            downcast = values.astype(np.float32)
+        if np.allclose(downcast, values, equal_nan=True, rtol=0.0, atol=5e-4):
+            return downcast
+    return None
+
+
+_FILTER_OPS = {
+    '==': lambda s, v: s == v,
+    '=': lambda s, v: s == v,
+    '!=': lambda s, v: s != v,
+    '<': lambda s, v: s < v,
+    '<=': lambda s, v: s <= v,
+    '>': lambda s, v: s > v,
+    '>=': lambda s, v: s >= v,
+    'in': lambda s, v: s.isin(v),
+    'not in': lambda s, v: ~s.isin(v),
+}
+
+
+def _coerce_filter_value(series: pd.Series, value: Any) -> Any:
+    """Convert string filter values to the column's type for comparison"""
+    if isinstance(value, (list, tuple, set)):
+        return [_coerce_filter_value(series, v) for v in value]
+    if isinstance(value, str):
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            # Compare with the categories' type (e.g. numbers parsed from text)
+            return _coerce_filter_value(pd.Series(series.cat.categories), value)
+        if pd.api.types.is_datetime64_any_dtype(series.dtype):
+            return pd.Timestamp(value)
+        if pd.api.types.is_numeric_dtype(series.dtype) and not pd.api.types.is_bool_dtype(series.dtype):
+            for cast in ((int, float) if pd.api.types.is_integer_dtype(series.dtype) else (float,)):
+                try:
+                    return cast(value)
+                except ValueError:
+                    continue
+    return value
+
+
+def _filter_terms(filters: List) -> List[Tuple[str, str, Any]]:
+    """Flatten DNF filters (a list of tuples or a list of lists) into terms"""
+    if isinstance(filters[0], tuple):
+        return list(filters)
+    return [term for group in filters for term in group]
+
+
+def _flatten_record(record: Dict[str, Any],
+                    out: Dict[str, Any],
+                    parent_key: str,
+                    max_list_items: Optional[int],
+                    sep: str = '_') -> None:
+    """Flatten a nested JSON object into `out` without intermediate lists"""
+    for k, v in record.items():
+        new_key = f"{parent_key}{sep}{k}" if parent_key else k
+        
+        if isinstance(v, dict):
+            _flatten_record(v, out, new_key, max_list_items, sep)
+        elif isinstance(v, list):
+            if len(v) > 0 and isinstance(v[0], dict):
+                # List of dicts - create numbered entries
+                items = v if max_list_items is None else v[:max_list_items]
+                for i, item in enumerate(items):
+                    if isinstance(item, dict):
+                        _flatten_record(item, out, f"{new_key}{sep}{i}", max_list_items, sep)
+                    else:
+                        out[f"{new_key}{sep}{i}"] = item
+            else:
+                out[new_key] = str(v)
+        else:
+            out[new_key] = v
+
+
+def _iter_json_records(f: TextIO, block_size: int = 1024 * 1024) -> Iterator[Any]:
+    """
+    Incrementally decode records from a JSON text stream
+    
+    A top-level array yields its elements one at a time; otherwise each
+    top-level value (a single document or concatenated/NDJSON values) is
+    yielded in turn. Only the current record and one read block are held
+    in memory.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    eof = False
+    in_array = None
+    
+    def fill(size: int) -> bool:
+        nonlocal buffer, pos, eof
+        data = f.read(size)
+        if not data:
+            eof = True
+            return False
+        buffer = buffer[pos:] + data
+        pos = 0
+        return True
+    
+    def skip(chars: str) -> None:
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in chars:
+                pos += 1
+            if pos < len(buffer) or not fill(block_size):
+                return
+    
+    skip(' \t\r\n')
+    if pos < len(buffer):
+        in_array = buffer[pos] == '['
+        if in_array:
+            pos += 1
+    
+    while True:
+        skip(' \t\r\n,' if in_array else ' \t\r\n')
+        if pos >= len(buffer):
+            return
+        if in_array and buffer[pos] == ']':
+            return
+        
+        read_size = block_size
+        while True:
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Record spans the block boundary - read more and retry
+                if not fill(read_size):
+                    raise
+                read_size *= 2
+                continue
+            if end == len(buffer) and not eof and fill(read_size):
+                # A number or literal may continue in the next block
+                continue
+            break
+        
+        pos = end
+        yield value
@@ -0,0 +1,229 @@
+"""DB-API database sources with projection and filter pushdown."""
+
+import sys
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# DNF filter operators translated to SQL
+SQL_OPERATORS = {
+    '==': '=',
+    '=': '=',
+    '!=': '<>',
+    '<': '<',
+    '<=': '<=',
+    '>': '>',
+    '>=': '>=',
+    'in': 'IN',
+    'not in': 'NOT IN'
+}
+
+
+@dataclass
+class SQLSource:
+    """
+    A table or query in a database, loadable like a file by DataLoader
+
+    Args:
+        connection: An open DB-API connection, or a URL. sqlite:///path.db
+            (sqlite:////abs/path.db for absolute paths) is supported
+            natively; other URLs are opened through SQLAlchemy if installed
+        table: Table (or view) to read
+        query: SELECT statement to read instead of a table
+        name: Dataset name (defaults to the table name)
+        paramstyle: DB-API paramstyle override (detected from the driver
+            module otherwise)
+    """
+    connection: Any
+    table: Optional[str] = None
+    query: Optional[str] = None
+    name: Optional[str] = None
+    paramstyle: Optional[str] = None
+
+    def __post_init__(self):
+        if (self.table is None) == (self.query is None):
+            raise ValueError("SQLSource needs exactly one of table or query")
+        if self.name is None:
+            self.name = self.table or 'query'
+
+    def __str__(self) -> str:
+        target = self.table if self.table is not None else f"({self.query})"
+        if isinstance(self.connection, str):
+            return f"{self.connection} {target}"
+        return target
+
+
+class ConnectionPool:
+    """
+    Pool of DB-API connections keyed by URL
+
+    Connections are handed out to one user at a time and returned to the
+    pool afterwards, so the datasets of one comparison reuse connections
+    instead of reconnecting. Connection objects passed in by the caller are
+    used as they are and never closed by the pool.
+    """
+
+    def __init__(self):
+        """Initialize an empty pool"""
+        self._idle: Dict[str, List[Any]] = {}
+        self._paramstyles: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Connections cannot cross process boundaries; workers start empty
+        return {}
+
+    def __setstate__(self, state):
+        self.__init__()
+
+    @contextmanager
+    def connection(self, source: SQLSource) -> Iterator[Tuple[Any, str]]:
+        """
+        Borrow a connection for a source
+
+        Yields:
+            Tuple of (DB-API connection, paramstyle)
+        """
+        if not isinstance(source.connection, str):
+            yield source.connection, source.paramstyle or driver_paramstyle(source.connection)
+            return
+
+        url = source.connection
+        with self._lock:
+            idle = self._idle.setdefault(url, [])
+            conn = idle.pop() if idle else None
+        if conn is None:
+            conn, paramstyle = self._connect(url)
+            with self._lock:
+                self._paramstyles[url] = paramstyle
+            logger.debug(f"Opened database connection to {url}")
+
+        reusable = False
+        try:
+            yield conn, source.paramstyle or self._paramstyles[url]
+            reusable = True
+        finally:
+            if reusable:
+                with self._lock:
+                    self._idle[url].append(conn)
+            else:
+                # The connection may be mid-query or in a failed transaction
+                conn.close()
+
+    def close(self):
+        """Close all idle pooled connections"""
+        with self._lock:
+            for connections in self._idle.values():
+                for conn in connections:
+                    conn.close()
+            self._idle.clear()
+
+    def _connect(self, url: str) -> Tuple[Any, str]:
+        """Open a new connection for a URL"""
+        if url.startswith('sqlite://'):
+            path = url[len('sqlite://'):]
+            path = path[1:] if path.startswith('/') else path
+            # Pooled connections may be used by other loader threads
+            # (one at a time)
+            return sqlite3.connect(path or ':memory:', check_same_thread=False), sqlite3.paramstyle
+
+        try:
+            import sqlalchemy
+        except ImportError:
+            raise ImportError(f"Connecting to {url} requires SQLAlchemy: pip install sqlalchemy")
+        engine = sqlalchemy.create_engine(url, poolclass=sqlalchemy.pool.NullPool)
+        return engine.raw_connection(), engine.dialect.paramstyle
+
+
+def driver_paramstyle(connection: Any) -> str:
+    """DB-API paramstyle of the driver module a connection comes from"""
+    module_name = type(connection).__module__
+    while module_name:
+        paramstyle = getattr(sys.modules.get(module_name), 'paramstyle', None)
+        if paramstyle is not None:
+            return paramstyle
+        module_name = module_name.rpartition('.')[0]
+    return 'qmark'
+
+
+def quote_identifier(name: str) -> str:
+    """Quote a table or column name as a standard SQL delimited identifier"""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def build_query(source: SQLSource,
+                columns: Optional[List[str]] = None,
+                filters: Optional[List] = None,
+                paramstyle: str = 'qmark') -> Tuple[str, Union[List[Any], Dict[str, Any]]]:
+    """
+    Build the SELECT statement for a source with projection and filters
+
+    Args:
+        source: Table or query to read
+        columns: Optional subset of columns to select
+        filters: Optional row filters in pyarrow DNF form (see
+            DataLoader.load), turned into a parameterized WHERE clause
+        paramstyle: DB-API paramstyle of the driver
+
+    Returns:
+        Tuple of (SQL statement, parameters)
+    """
+    select = ', '.join(quote_identifier(col) for col in columns) if columns else '*'
+    if source.table is not None:
+        relation = '.'.join(quote_identifier(part) for part in source.table.split('.'))
+    else:
+        relation = f"({source.query}) AS source_query"
+    sql = f"SELECT {select} FROM {relation}"
+
+    params = _Parameters(paramstyle)
+    if filters:
+        groups = [filters] if isinstance(filters[0], tuple) else filters
+        clauses = []
+        for group in groups:
+            terms = [_filter_clause(col, op, value, params) for col, op, value in group]
+            clauses.append('(' + ' AND '.join(terms) + ')' if terms else '(1 = 1)')
+        sql += ' WHERE ' + ' OR '.join(clauses)
+    return sql, params.values
+
+
+def _filter_clause(col: str, op: str, value: Any, params: '_Parameters') -> str:
+    """SQL condition for one DNF filter term"""
+    if op not in SQL_OPERATORS:
+        raise ValueError(f"Unsupported filter operator: {op}")
+    column = quote_identifier(col)
+    if op in ('in', 'not in'):
+        values = list(value)
+        if not values:
+            return '1 = 0' if op == 'in' else '1 = 1'
+        placeholders = ', '.join(params.add(v) for v in values)
+        return f"{column} {SQL_OPERATORS[op]} ({placeholders})"
+    return f"{column} {SQL_OPERATORS[op]} {params.add(value)}"
+
+
+class _Parameters:
+    """Collects query parameters and renders placeholders for a paramstyle"""
+
+    def __init__(self, paramstyle: str):
+        if paramstyle not in ('qmark', 'numeric', 'named', 'format', 'pyformat'):
+            raise ValueError(f"Unsupported paramstyle: {paramstyle}")
+        self.paramstyle = paramstyle
+        self.values = {} if paramstyle in ('named', 'pyformat') else []
+
+    def add(self, value: Any) -> str:
+        """Record a parameter value and return its placeholder"""
+        if isinstance(self.values, dict):
+            key = f"p{len(self.values)}"
+            self.values[key] = value
+            return f":{key}" if self.paramstyle == 'named' else f"%({key})s"
+
+        self.values.append(value)
+        if self.paramstyle == 'qmark':
+            return '?'
+        elif self.paramstyle == 'numeric':
+            return f":{len(self.values)}"
+        return '%s'
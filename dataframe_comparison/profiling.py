@@ -0,0 +1,347 @@
+"""Streaming per-field profiles of datasets too large to load."""
+
+import os
+import uuid
+import pickle
+import logging
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Union
+
+from .schema import DataType
+from .sketches import CategoryCounts, CorrelationSums, Histogram, Moments, QuantileSketch, ReservoirSample
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ProfileConfig:
+    """Accuracy and memory settings of dataset profiles"""
+    sketch_k: int = 512
+    sample_size: int = 5000
+    histogram_bins: int = 256
+    max_categories: int = 10000
+    seed: int = 0
+
+
+@dataclass
+class FieldProfile:
+    """
+    Bounded-memory summary of one field of a dataset
+
+    Numeric fields keep moments, a quantile sketch, a uniform sample and a
+    histogram; other fields keep category counts (datetime fields only null
+    counts).
+    """
+    name: str
+    data_type: DataType
+    count: int = 0
+    null_count: int = 0
+    # Values of a numeric field that are not numbers (counted as nulls)
+    ignored: int = 0
+    moments: Optional[Moments] = None
+    sketch: Optional[QuantileSketch] = None
+    sample: Optional[ReservoirSample] = None
+    histogram: Optional[Histogram] = None
+    categories: Optional[CategoryCounts] = None
+
+    @classmethod
+    def create(cls, name: str, data_type: DataType, config: ProfileConfig) -> 'FieldProfile':
+        """Empty profile with the state its data type needs"""
+        profile = cls(name, data_type)
+        if data_type == DataType.NUMERIC:
+            profile.moments = Moments()
+            profile.sketch = QuantileSketch(config.sketch_k, seed=config.seed)
+            profile.sample = ReservoirSample(config.sample_size, seed=config.seed)
+            profile.histogram = Histogram(config.histogram_bins)
+        elif data_type != DataType.DATETIME:
+            profile.categories = CategoryCounts(config.max_categories)
+        return profile
+
+    def update(self, series: pd.Series):
+        """Add the values of one chunk"""
+        if self.data_type == DataType.NUMERIC:
+            if not pd.api.types.is_numeric_dtype(series):
+                present = int(series.notna().sum())
+                series = pd.to_numeric(series, errors='coerce')
+                ignored = present - int(series.notna().sum())
+                if ignored and not self.ignored:
+                    logger.warning(f"Field '{self.name}' is profiled as numeric but has dtype {series.dtype}; "
+                                   f"non-numeric values are ignored")
+                self.ignored += ignored
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            missing = np.isnan(values)
+            values = values[~missing]
+            self.null_count += int(missing.sum())
+            self.count += len(values)
+            self.moments.update(values)
+            self.sketch.update(values)
+            self.sample.update(values)
+            self.histogram.update(values)
+        else:
+            values = series.dropna()
+            self.null_count += len(series) - len(values)
+            self.count += len(values)
+            if self.categories is not None:
+                self.categories.update(values)
+
+    def add_nulls(self, n: int):
+        """Count rows of a chunk that lacks this field"""
+        self.null_count += n
+
+    def merge(self, other: 'FieldProfile') -> 'FieldProfile':
+        """Merge the profile of other rows of the same field"""
+        if other.data_type != self.data_type:
+            raise ValueError(f"Cannot merge {other.data_type.value} profile of '{other.name}' "
+                             f"into a {self.data_type.value} profile")
+        self.count += other.count
+        self.null_count += other.null_count
+        self.ignored += other.ignored
+        for attr in ('moments', 'sketch', 'sample', 'histogram', 'categories'):
+            state = getattr(self, attr)
+            if state is not None:
+                state.merge(getattr(other, attr))
+        return self
+
+    def inferred_type(self) -> DataType:
+        """Comparison type of the field, inferred as for in-memory datasets"""
+        if self.data_type in (DataType.NUMERIC, DataType.DATETIME) or self.categories is None:
+            return self.data_type
+        if self.categories.truncated or self.count == 0:
+            return DataType.TEXT
+        # Less than 5% unique values
+        if len(self.categories.counts) / self.count < 0.05:
+            return DataType.CATEGORICAL
+        return DataType.TEXT
+
+
+class DatasetProfile:
+    """
+    Mergeable, bounded-memory profile of a dataset read as chunks
+
+    Holds a FieldProfile per column, the row count and pairwise sums for
+    the correlation matrix of the numeric columns. Memory depends on the
+    number of columns and the ProfileConfig, not on the number of rows, so
+    datasets of any size can be profiled chunk by chunk, and profiles of
+    disjoint parts of a dataset can be merged. Profiles can be saved as
+    snapshots and compared against later batches without the raw rows.
+    """
+
+    # Version of the snapshot format written by save
+    SNAPSHOT_VERSION = 1
+
+    def __init__(self,
+                 name: str,
+                 field_types: Optional[Dict[str, DataType]] = None,
+                 config: Optional[ProfileConfig] = None):
+        """
+        Initialize empty profile
+
+        Args:
+            name: Dataset name
+            field_types: Declared data types by column; other columns are
+                typed from their dtype in the first chunk with values for
+                them
+            config: Accuracy and memory settings
+        """
+        self.name = name
+        self.field_types = field_types or {}
+        self.config = config or ProfileConfig()
+        self.row_count = 0
+        self.fields: Dict[str, FieldProfile] = {}
+        # dtype of each column in the first chunk with values for it
+        self.dtypes: Dict[str, str] = {}
+        self.correlation: Optional[CorrelationSums] = None
+        # Tested as numbers, but left out of correlations as for in-memory
+        # datasets
+        self.boolean_columns: Set[str] = set()
+
+    @classmethod
+    def from_chunks(cls,
+                    name: str,
+                    chunks: Iterable[pd.DataFrame],
+                    field_types: Optional[Dict[str, DataType]] = None,
+                    config: Optional[ProfileConfig] = None) -> 'DatasetProfile':
+        """
+        Profile a dataset from an iterable of DataFrame chunks
+
+        Args:
+            name: Dataset name
+            chunks: DataFrame chunks, e.g. from DataLoader.iter_chunks
+            field_types: Declared data types by column
+            config: Accuracy and memory settings
+
+        Returns:
+            DatasetProfile of all chunks
+        """
+        profile = cls(name, field_types, config)
+        for chunk in chunks:
+            profile.update(chunk)
+        logger.info(f"Profiled {name}: {profile.row_count:,} rows × {len(profile.fields)} fields")
+        return profile
+
+    @classmethod
+    def like(cls,
+             name: str,
+             reference: 'DatasetProfile',
+             field_types: Optional[Dict[str, DataType]] = None) -> 'DatasetProfile':
+        """
+        Empty profile that types columns as a reference profile does
+
+        Profiles of new data made this way compare field by field with the
+        reference (e.g. a baseline snapshot) even where dtypes differ.
+
+        Args:
+            name: Dataset name
+            reference: Profile whose field types and config are reused
+            field_types: Declared data types overriding the reference's
+
+        Returns:
+            Empty DatasetProfile
+        """
+        profile = cls(name, {**reference.typed_fields(), **(field_types or {})}, reference.config)
+        profile.boolean_columns |= reference.boolean_columns
+        return profile
+
+    @property
+    def columns(self) -> List[str]:
+        """Profiled columns, in order of appearance"""
+        return list(self.fields)
+
+    def __len__(self) -> int:
+        return self.row_count
+
+    def update(self, chunk: pd.DataFrame):
+        """Add one chunk of rows"""
+        for col in chunk.columns:
+            profile = self.fields.get(col)
+            if profile is not None and not self._untyped(col):
+                continue
+            # The dtype of a chunk without values (e.g. all-NaN text read as
+            # float) says nothing about the field, so it is typed again by the
+            # first chunk with values
+            if profile is not None and not chunk[col].notna().any():
+                continue
+            self.boolean_columns.discard(col)
+            data_type = self.field_types.get(col) or self._dtype_type(chunk[col])
+            profile = FieldProfile.create(col, data_type, self.config)
+            # Rows seen before the column first had values
+            profile.add_nulls(self.row_count)
+            self.fields[col] = profile
+            self.dtypes[col] = str(chunk[col].dtype)
+        for col, profile in self.fields.items():
+            if col in chunk.columns:
+                profile.update(chunk[col])
+            else:
+                profile.add_nulls(len(chunk))
+
+        if self.correlation is None:
+            self.correlation = CorrelationSums(self._correlation_columns())
+        else:
+            self.correlation.extend(self._correlation_columns())
+        self.correlation.update(chunk)
+        self.row_count += len(chunk)
+
+    def merge(self, other: 'DatasetProfile') -> 'DatasetProfile':
+        """Merge the profile of other rows of the same dataset into this one"""
+        for col, other_profile in other.fields.items():
+            if col in self.fields and other._untyped(col):
+                self.fields[col].add_nulls(other_profile.null_count)
+            elif col in self.fields and self._untyped(col):
+                profile = FieldProfile.create(col, other_profile.data_type, self.config)
+                profile.add_nulls(self.fields[col].null_count)
+                self.fields[col] = profile.merge(other_profile)
+                self.dtypes[col] = other.dtypes[col]
+            elif col in self.fields:
+                self.fields[col].merge(other_profile)
+            else:
+                profile = FieldProfile.create(col, other_profile.data_type, self.config)
+                profile.add_nulls(self.row_count)
+                self.fields[col] = profile.merge(other_profile)
+        for col, profile in self.fields.items():
+            if col not in other.fields:
+                profile.add_nulls(other.row_count)
+
+        if other.correlation is not None:
+            if self.correlation is None:
+                self.correlation = CorrelationSums(other.correlation.columns)
+            self.correlation.merge(other.correlation)
+        self.boolean_columns |= other.boolean_columns
+        self.dtypes = {**other.dtypes, **self.dtypes}
+        self.row_count += other.row_count
+        return self
+
+    def save(self, path: Union[str, Path]):
+        """
+        Save the profile as a snapshot file
+
+        Snapshots are pickles; only load snapshots from trusted sources.
+
+        Args:
+            path: Snapshot file to write
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'version': self.SNAPSHOT_VERSION, 'profile': self}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        logger.info(f"Saved profile of {self.name} ({self.row_count:,} rows) to {path}")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'DatasetProfile':
+        """
+        Load a profile snapshot written by save
+
+        Args:
+            path: Snapshot file
+
+        Returns:
+            DatasetProfile
+        """
+        with open(path, 'rb') as f:
+            snapshot = pickle.load(f)
+        if not isinstance(snapshot, dict) or snapshot.get('version') != cls.SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported profile snapshot: {path}")
+        return snapshot['profile']
+
+    def typed_fields(self) -> Dict[str, DataType]:
+        """Data types of the fields that are declared or had values"""
+        return {col: profile.data_type for col, profile in self.fields.items() if not self._untyped(col)}
+
+    def null_counts(self) -> Dict[str, int]:
+        """Number of missing values per column"""
+        return {col: profile.null_count for col, profile in self.fields.items()}
+
+    def correlation_matrix(self) -> Optional[pd.DataFrame]:
+        """Pearson correlations of the numeric columns, like DataFrame.corr()"""
+        if self.correlation is None:
+            return None
+        return self.correlation.correlation()
+
+    def _correlation_columns(self) -> List[str]:
+        """Numeric columns included in the correlation matrix"""
+        return [col for col, profile in self.fields.items()
+                if profile.data_type == DataType.NUMERIC and col not in self.boolean_columns
+                and not self._untyped(col)]
+
+    def _untyped(self, col: str) -> bool:
+        """Whether a column's type is only a guess, as it had no values so far"""
+        return self.fields[col].count == 0 and col not in self.field_types
+
+    def _dtype_type(self, series: pd.Series) -> DataType:
+        """Profile type of a column from its dtype"""
+        if pd.api.types.is_bool_dtype(series):
+            self.boolean_columns.add(series.name)
+            return DataType.NUMERIC
+        if pd.api.types.is_numeric_dtype(series):
+            return DataType.NUMERIC
+        if pd.api.types.is_datetime64_any_dtype(series):
+            return DataType.DATETIME
+        return DataType.CATEGORICAL
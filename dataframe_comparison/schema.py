@@ -1,8 +1,19 @@
 """Schema mapping and field configuration for dataframe comparison."""
 
+import json
+import hashlib
+import logging
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
+from difflib import SequenceMatcher
 from enum import Enum
-from typing import List, Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple, Union
+
+from .cache import MappingCache
+
+logger = logging.getLogger(__name__)
 
 
 class DataType(Enum):
@@ -21,19 +32,37 @@ class FieldMapping:
     aliases: List[str]
     data_type: DataType = DataType.UNKNOWN
     description: Optional[str] = None
+    
+    def __post_init__(self):
+        # Accept type names such as 'numeric'; names without a DataType
+        # (e.g. 'identifier') leave the type to inference
+        if not isinstance(self.data_type, DataType):
+            try:
+                self.data_type = DataType(str(self.data_type).lower())
+            except ValueError:
+                logger.debug(f"Unknown data type {self.data_type!r} for '{self.standard_name}'; will infer")
+                self.data_type = DataType.UNKNOWN
 
 
 class SchemaMapper:
     """Maps varied column names to standardized names for comparison."""
     
-    def __init__(self, config: Optional[List[FieldMapping]] = None):
+    # Minimum similarity ratio for fuzzy column matches
+    FUZZY_THRESHOLD = 0.8
+    
+    def __init__(self,
+                 config: Optional[List[FieldMapping]] = None,
+                 cache_dir: Optional[Union[str, Path]] = None):
         """
         Initialize schema mapper with field mappings.
         
         Args:
             config: List of FieldMapping objects defining standard names and aliases
+            cache_dir: Optional directory persisting resolved mappings (and
+                inferred data types) per column list across runs
         """
         self.config = config or []
+        self.mapping_cache = MappingCache(cache_dir) if cache_dir is not None else None
         self._build_mapping_dict()
         
     def _build_mapping_dict(self):
@@ -45,6 +74,20 @@ class SchemaMapper:
             self.standard_fields[mapping.standard_name] = mapping
             for alias in mapping.aliases:
                 self.mapping_dict[alias.lower()] = mapping.standard_name
+        
+        # Fuzzy candidates in the order _find_best_match has always scored
+        # them (standard names, then aliases), which decides ties
+        candidates = [(name.lower(), name) for name in self.standard_fields]
+        candidates += list(self.mapping_dict.items())
+        self._fuzzy_index = _FuzzyIndex.for_candidates(tuple(candidates))
+        
+        # Identifies the config in mapping cache keys; any change to names,
+        # aliases, declared types or the threshold invalidates cached entries
+        fingerprint = json.dumps([
+            [m.standard_name, list(m.aliases), getattr(m.data_type, 'value', str(m.data_type))]
+            for m in self.config
+        ] + [self.FUZZY_THRESHOLD])
+        self.config_fingerprint = hashlib.sha256(fingerprint.encode()).hexdigest()
                 
     def standardize_dataframe(self, df):
         """
@@ -54,50 +97,235 @@ class SchemaMapper:
             df: Input dataframe
             
         Returns:
-            DataFrame with standardized column names
+            DataFrame with standardized column names (an independent copy
+            of the input)
         """
-        import pandas as pd
-        
         df_copy = df.copy()
+        rename_map = self.resolve_columns(df.columns)
+        
+        if rename_map:
+            df_copy.columns = [rename_map.get(col, col) for col in df.columns]
+            
+        return df_copy
+        
+    def standardize_with_mapping(self, df):
+        """
+        Standardize column names without copying any column data.
+        
+        The result is a shallow copy of the input that shares its data
+        buffers; only the column labels are replaced. Unless pandas
+        copy-on-write is enabled, in-place changes to the values of either
+        frame show in the other, so this is meant for read-only use such as
+        compare_datasets; standardize_dataframe returns an independent copy.
+        
+        Args:
+            df: Input dataframe
+            
+        Returns:
+            Tuple of (DataFrame with standardized column names, dictionary
+            mapping original column names to standard names for the renamed
+            columns only)
+        """
+        rename_map = self.resolve_columns(df.columns)
+        
+        df_view = df.copy(deep=False)
+        if rename_map:
+            df_view.columns = [rename_map.get(col, col) for col in df.columns]
+            
+        return df_view, rename_map
+        
+    def resolve_columns(self, columns) -> Dict[str, str]:
+        """
+        Resolve column names to standard names without touching any data.
+        
+        Args:
+            columns: Iterable of column names (e.g. a file header)
+            
+        Returns:
+            Dictionary mapping original column names to standard names,
+            containing only the columns that are renamed
+        """
+        columns = list(columns)
+        cache_key = None
+        if self.mapping_cache is not None:
+            cache_key = self.mapping_cache.key(columns, self.config_fingerprint)
+            entry = self.mapping_cache.get(cache_key)
+            if entry is not None:
+                return dict(entry['rename_map'])
+        
         rename_map = {}
+        fuzzy_matches = {}
         
-        for col in df.columns:
+        for col in columns:
             col_lower = col.lower()
             if col_lower in self.mapping_dict:
                 rename_map[col] = self.mapping_dict[col_lower]
             else:
                 # Try fuzzy matching for close matches
-                best_match = self._find_best_match(col_lower)
+                best_match = self._find_best_match(col_lower, self.FUZZY_THRESHOLD)
                 if best_match:
                     rename_map[col] = best_match
+                    fuzzy_matches[col] = best_match
+        
+        if cache_key is not None:
+            self.mapping_cache.put(cache_key, {
+                'columns': columns,
+                'config_fingerprint': self.config_fingerprint,
+                'rename_map': rename_map,
+                'fuzzy_matches': fuzzy_matches,
+                'data_types': {}
+            })
                     
-        if rename_map:
-            df_copy = df_copy.rename(columns=rename_map)
+        return rename_map
+        
+    def cached_data_types(self, columns) -> Dict[str, DataType]:
+        """
+        Data types recorded for a column list by an earlier run.
+        
+        Args:
+            columns: Original column names of the dataset
             
-        return df_copy
+        Returns:
+            Dictionary mapping standard field names to DataType (empty
+            without a cache or entry)
+        """
+        if self.mapping_cache is None:
+            return {}
+        entry = self.mapping_cache.get(self.mapping_cache.key(list(columns), self.config_fingerprint))
+        if entry is None:
+            return {}
+        return {field: DataType(value) for field, value in entry.get('data_types', {}).items()}
+        
+    def record_data_types(self, columns, data_types: Dict[str, DataType]):
+        """
+        Persist the data types inferred for a column list.
+        
+        Args:
+            columns: Original column names of the dataset
+            data_types: Dictionary mapping standard field names to DataType
+        """
+        if self.mapping_cache is None:
+            return
+        key = self.mapping_cache.key(list(columns), self.config_fingerprint)
+        self.mapping_cache.update(key, data_types={field: dt.value for field, dt in data_types.items()})
         
     def _find_best_match(self, column_name: str, threshold: float = 0.8) -> Optional[str]:
-        """Find best matching standard field using fuzzy matching."""
-        from difflib import SequenceMatcher
+        """
+        Find best matching standard field using fuzzy matching.
         
-        best_score = 0
-        best_match = None
+        Scores are SequenceMatcher ratios against standard names and aliases;
+        the highest score at or above the threshold wins, ties going to the
+        earliest candidate. See _FuzzyIndex for how candidates are pruned.
+        """
+        return self._fuzzy_index.best_match(column_name, threshold)
+
+
+class _FuzzyIndex:
+    """
+    Character-trigram index over fuzzy matching candidates.
+    
+    Candidates are visited in order of shared trigrams with the column
+    name, so a strong match is found early, and skipped when the cheap
+    SequenceMatcher upper bounds (real_quick_ratio, quick_ratio) show they
+    cannot beat it. Only lengths that can reach the threshold are visited
+    at all. Results are identical to scoring every candidate, and the most
+    recent ones are memoized per column name; recently used indexes are
+    shared by all SchemaMappers with the same candidates.
+    """
+    
+    # Column names whose best match is memoized per index
+    MEMO_SIZE = 100000
+    
+    @classmethod
+    @lru_cache(maxsize=16)
+    def for_candidates(cls, candidates: Tuple[Tuple[str, str], ...]) -> '_FuzzyIndex':
+        """Return the shared index for a candidate list, building it on first use."""
+        return cls(candidates)
+    
+    def __init__(self, candidates: Tuple[Tuple[str, str], ...]):
+        """
+        Build the index.
         
-        for standard_name in self.standard_fields:
-            score = SequenceMatcher(None, column_name, standard_name.lower()).ratio()
-            if score > best_score and score >= threshold:
-                best_score = score
-                best_match = standard_name
-                
-        # Also check aliases
-        for alias, standard_name in self.mapping_dict.items():
-            score = SequenceMatcher(None, column_name, alias).ratio()
-            if score > best_score and score >= threshold:
+        Args:
+            candidates: (lowercase name, standard name) pairs in priority order
+        """
+        self.names: List[str] = []
+        self.targets: List[str] = []
+        self.matchers: List[SequenceMatcher] = []
+        self.by_length: Dict[int, List[int]] = {}
+        self.postings: Dict[str, List[int]] = {}
+        self.memo: 'OrderedDict[Tuple[str, float], Optional[str]]' = OrderedDict()
+        
+        seen = set()
+        for name, target in candidates:
+            # A repeated name scores the same; its first occurrence wins
+            if name in seen:
+                continue
+            seen.add(name)
+            i = len(self.names)
+            self.names.append(name)
+            self.targets.append(target)
+            # SequenceMatcher caches its analysis of the second sequence
+            matcher = SequenceMatcher(None)
+            matcher.set_seq2(name)
+            self.matchers.append(matcher)
+            self.by_length.setdefault(len(name), []).append(i)
+            for gram in _trigrams(name):
+                self.postings.setdefault(gram, []).append(i)
+    
+    def best_match(self, column_name: str, threshold: float) -> Optional[str]:
+        """Best matching standard name for a lowercase column name, or None."""
+        key = (column_name, threshold)
+        if key in self.memo:
+            self.memo.move_to_end(key)
+            return self.memo[key]
+        
+        shared = Counter()
+        for gram in _trigrams(column_name):
+            for i in self.postings.get(gram, ()):
+                shared[i] += 1
+        
+        order = sorted(self._length_candidates(len(column_name), threshold),
+                       key=lambda i: (-shared[i], i))
+        
+        best_score = 0.0
+        best = None
+        
+        def may_win(score: float, i: int) -> bool:
+            if score < threshold:
+                return False
+            return best is None or score > best_score or (score == best_score and i < best)
+        
+        for i in order:
+            matcher = self.matchers[i]
+            matcher.set_seq1(column_name)
+            if not may_win(matcher.real_quick_ratio(), i) or not may_win(matcher.quick_ratio(), i):
+                continue
+            score = matcher.ratio()
+            if may_win(score, i):
                 best_score = score
-                best_match = standard_name
-                
+                best = i
+        
+        best_match = self.targets[best] if best is not None else None
         if best_match:
-            import logging
-            logging.info(f"Fuzzy matched '{column_name}' to '{best_match}'")
-            
+            logger.info(f"Fuzzy matched '{column_name}' to '{best_match}'")
+        self.memo[key] = best_match
+        if len(self.memo) > self.MEMO_SIZE:
+            self.memo.popitem(last=False)
         return best_match
+    
+    def _length_candidates(self, length: int, threshold: float) -> List[int]:
+        """Candidates whose length allows a ratio of at least threshold."""
+        # ratio <= 2 * min(la, lb) / (la + lb)
+        candidates = []
+        for other, ids in self.by_length.items():
+            total = length + other
+            if total and 2.0 * min(length, other) / total >= threshold:
+                candidates.extend(ids)
+        return candidates
+
+
+def _trigrams(name: str) -> Set[str]:
+    """Character trigrams of a name, padded so short names have some."""
+    padded = f"^{name}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
@@ -0,0 +1,264 @@
+"""Map-reduce profiling of datasets split into shards."""
+
+import os
+import time
+import uuid
+import pickle
+import logging
+import traceback
+import pandas as pd
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Union
+
+from .data_loader import DataLoader, Shard
+from .profiling import DatasetProfile, ProfileConfig
+from .schema import DataType
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ShardTask:
+    """
+    Profiling of one shard of a dataset, handed to a ShardExecutor
+
+    Everything a worker needs is in the task, so it can be pickled to
+    another process or node. Source paths must be readable there too.
+    """
+    dataset: str
+    shard: Shard
+    loader: DataLoader
+    rename_map: Dict[str, str] = field(default_factory=dict)
+    field_types: Dict[str, DataType] = field(default_factory=dict)
+    boolean_columns: Set[str] = field(default_factory=set)
+    config: ProfileConfig = field(default_factory=ProfileConfig)
+
+
+def profile_shard(task: ShardTask) -> DatasetProfile:
+    """
+    Profile the rows of one shard into a partial DatasetProfile
+
+    Runs in a worker process or on another node. Each shard draws its
+    sketch compactions and sample keys from its own seed so merged partials
+    stay uniformly random.
+    """
+    config = replace(task.config, seed=task.config.seed + task.shard.index)
+    profile = DatasetProfile(task.dataset, task.field_types, config)
+    profile.boolean_columns |= task.boolean_columns
+    for chunk in task.loader.iter_shard(task.shard):
+        profile.update(_renamed(chunk, task.rename_map))
+    logger.info(f"Profiled shard {task.shard.index + 1}/{task.shard.count} of {task.dataset}: "
+                f"{profile.row_count:,} rows")
+    return profile
+
+
+def merge_profiles(profiles: Iterable[DatasetProfile]) -> Optional[DatasetProfile]:
+    """Merge partial profiles of disjoint parts of a dataset, in order"""
+    merged = None
+    for profile in profiles:
+        merged = profile if merged is None else merged.merge(profile)
+    return merged
+
+
+class ShardExecutor(ABC):
+    """
+    Runs profile_shard on a list of tasks
+
+    Subclasses decide where the tasks run; results come back in task order
+    so they can be merged while later shards are still being profiled.
+    """
+
+    @abstractmethod
+    def map(self, tasks: List[ShardTask]) -> Iterator[DatasetProfile]:
+        """Profile each task, yielding the partial profiles in task order"""
+
+
+class LocalShardExecutor(ShardExecutor):
+    """Profile shards on a pool of local worker processes"""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Initialize local executor
+
+        Args:
+            max_workers: Number of worker processes (defaults to the CPU count;
+                1 profiles shards serially in this process)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def map(self, tasks: List[ShardTask]) -> Iterator[DatasetProfile]:
+        if self.max_workers <= 1 or len(tasks) <= 1:
+            for task in tasks:
+                yield profile_shard(task)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(tasks))) as pool:
+            futures = [pool.submit(profile_shard, task) for task in tasks]
+            try:
+                for future in futures:
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+
+class FileShardExecutor(ShardExecutor):
+    """
+    Hand shards off through a shared directory
+
+    Each task is pickled to `<run>-<n>.task` in the directory. Workers on
+    any node that can read the directory and the sources (see run_worker,
+    or `python -m dataframe_comparison.sharding <directory>`) claim tasks by
+    renaming them and write back `<run>-<n>.profile`, or `<run>-<n>.error`
+    with the worker's traceback. The comparing process works on tasks
+    itself while it waits unless work_locally is False.
+
+    Task and profile files are pickles; only share the directory with
+    trusted nodes.
+    """
+
+    def __init__(self,
+                 directory: Union[str, Path],
+                 poll_interval: float = 1.0,
+                 timeout: Optional[float] = None,
+                 work_locally: bool = True):
+        """
+        Initialize file-based executor
+
+        Args:
+            directory: Hand-off directory shared with the worker nodes
+            poll_interval: Seconds between checks for finished shards
+            timeout: Seconds to wait for any one shard before giving up
+                (None waits indefinitely)
+            work_locally: Whether the comparing process also profiles shards
+        """
+        self.directory = Path(directory)
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.work_locally = work_locally
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def map(self, tasks: List[ShardTask]) -> Iterator[DatasetProfile]:
+        run = uuid.uuid4().hex[:12]
+        stems = [f"{run}-{i:05d}" for i in range(len(tasks))]
+        for stem, task in zip(stems, tasks):
+            _write_atomic(self.directory / f"{stem}.task", task)
+        logger.info(f"Handed off {len(tasks)} shards in {self.directory}")
+
+        try:
+            for stem in stems:
+                yield self._wait_for(stem)
+        finally:
+            # Withdraw tasks nobody has claimed yet
+            for stem in stems:
+                (self.directory / f"{stem}.task").unlink(missing_ok=True)
+
+    def _wait_for(self, stem: str) -> DatasetProfile:
+        """Wait for a shard's result, working on pending tasks meanwhile"""
+        result_path = self.directory / f"{stem}.profile"
+        error_path = self.directory / f"{stem}.error"
+        deadline = None if self.timeout is None else time.monotonic() + self.timeout
+        while True:
+            if result_path.exists():
+                with open(result_path, 'rb') as f:
+                    profile = pickle.load(f)
+                result_path.unlink()
+                return profile
+            if error_path.exists():
+                message = error_path.read_text()
+                error_path.unlink()
+                raise RuntimeError(f"Shard {stem} failed:\n{message}")
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError(f"No result for shard {stem} in {self.directory} after {self.timeout}s")
+            if not (self.work_locally and run_next_task(self.directory)):
+                time.sleep(self.poll_interval)
+
+
+def run_next_task(directory: Union[str, Path]) -> bool:
+    """
+    Claim and profile one pending task of a FileShardExecutor directory
+
+    Returns:
+        Whether a task was found
+    """
+    directory = Path(directory)
+    for task_path in sorted(directory.glob('*.task')):
+        claimed = task_path.with_name(f"{task_path.stem}.{uuid.uuid4().hex}.claimed")
+        try:
+            # Renames are atomic, so exactly one worker wins each task
+            os.rename(task_path, claimed)
+        except FileNotFoundError:
+            continue
+        try:
+            with open(claimed, 'rb') as f:
+                task = pickle.load(f)
+            _write_atomic(directory / f"{task_path.stem}.profile", profile_shard(task))
+        except Exception:
+            logger.exception(f"Shard {task_path.stem} failed")
+            _write_atomic(directory / f"{task_path.stem}.error", traceback.format_exc(), text=True)
+        finally:
+            claimed.unlink(missing_ok=True)
+        return True
+    return False
+
+
+def run_worker(directory: Union[str, Path],
+               poll_interval: float = 1.0,
+               idle_timeout: Optional[float] = None):
+    """
+    Profile tasks handed off by FileShardExecutor until idle
+
+    Args:
+        directory: Hand-off directory
+        poll_interval: Seconds between checks for new tasks
+        idle_timeout: Seconds without tasks after which the worker exits
+            (None runs until interrupted)
+    """
+    idle_since = time.monotonic()
+    while True:
+        if run_next_task(directory):
+            idle_since = time.monotonic()
+        elif idle_timeout is not None and time.monotonic() - idle_since > idle_timeout:
+            return
+        else:
+            time.sleep(poll_interval)
+
+
+def _renamed(chunk: pd.DataFrame, rename_map: Dict[str, str]) -> pd.DataFrame:
+    """Chunk with standardized column names, sharing its data"""
+    if not rename_map:
+        return chunk
+    chunk = chunk.copy(deep=False)
+    chunk.columns = [rename_map.get(col, col) for col in chunk.columns]
+    return chunk
+
+
+def _write_atomic(path: Path, payload, text: bool = False):
+    """Write a pickle (or text) so readers never see a partial file"""
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        if text:
+            tmp_path.write_text(payload)
+        else:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Profile shards handed off through a shared directory')
+    parser.add_argument('directory', help='Hand-off directory of the comparing process')
+    parser.add_argument('--poll-interval', type=float, default=1.0, help='Seconds between checks for tasks')
+    parser.add_argument('--idle-timeout', type=float, help='Exit after this many seconds without tasks')
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    run_worker(args.directory, args.poll_interval, args.idle_timeout)
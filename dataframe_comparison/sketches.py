@@ -0,0 +1,550 @@
+"""Bounded-memory, mergeable summaries of column values."""
+
+import math
+import logging
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class QuantileSketch:
+    """
+    KLL quantile sketch
+
+    Keeps a hierarchy of compactors; items at level h stand for 2**h values.
+    Memory is O(k) regardless of the number of values, and the rank error
+    is roughly 1.7 / k with high probability. Sketches built from disjoint
+    parts of a dataset can be merged.
+    """
+
+    def __init__(self, k: int = 512, seed: int = 0):
+        """
+        Initialize quantile sketch
+
+        Args:
+            k: Size of the top compactor (accuracy/memory trade-off)
+            seed: Seed for the random compaction offsets
+        """
+        self.k = k
+        self.n = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._levels: List[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    @property
+    def exact(self) -> bool:
+        """Whether no values have been compacted away yet"""
+        return len(self._levels) == 1
+
+    def update(self, values: np.ndarray):
+        """Add NaN-free float values"""
+        if len(values) == 0:
+            return
+        self.n += len(values)
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """Merge another sketch into this one"""
+        if other.n == 0:
+            return self
+        self.n += other.n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0))
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate([self._levels[level], items])
+        self._compress()
+        return self
+
+    def weighted_items(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Retained items and the number of values each stands for
+
+        Returns:
+            Tuple of (sorted values, weights); the weights sum to n
+        """
+        values = np.concatenate(self._levels)
+        weights = np.concatenate([np.full(len(items), 2 ** level, dtype=np.int64)
+                                  for level, items in enumerate(self._levels)])
+        order = np.argsort(values, kind='stable')
+        return values[order], weights[order]
+
+    def quantiles(self, qs: Sequence[float]) -> np.ndarray:
+        """Approximate quantiles for probabilities in [0, 1]"""
+        values, weights = self.weighted_items()
+        if len(values) == 0:
+            return np.full(len(qs), np.nan)
+        cumulative = np.cumsum(weights)
+        ranks = np.clip(np.asarray(qs, dtype=float), 0, 1) * self.n
+        idx = np.minimum(np.searchsorted(cumulative, ranks, side='left'), len(values) - 1)
+        return values[idx]
+
+    def cdf(self, points: np.ndarray) -> np.ndarray:
+        """Approximate fraction of values <= each point"""
+        values, weights = self.weighted_items()
+        if len(values) == 0:
+            return np.zeros(len(points))
+        cumulative = np.concatenate([[0], np.cumsum(weights)])
+        return cumulative[np.searchsorted(values, points, side='right')] / self.n
+
+    def _capacity(self, level: int) -> int:
+        """Number of items a level holds before it is compacted"""
+        depth = len(self._levels) - level - 1
+        return max(2, int(math.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        """Compact levels over capacity, promoting every other item upwards"""
+        level = 0
+        while level < len(self._levels):
+            items = self._levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self._levels):
+                    self._levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item out stays behind at this level
+                leftover = items[len(items) - len(items) % 2:]
+                offset = int(self._rng.integers(2))
+                promoted = items[offset:len(items) - len(items) % 2:2]
+                self._levels[level + 1] = np.concatenate([self._levels[level + 1], promoted])
+                self._levels[level] = leftover
+            level += 1
+
+
+class ReservoirSample:
+    """
+    Uniform random sample of at most `size` values (bottom-k sampling)
+
+    Every value gets a random key and the values with the smallest keys are
+    kept, so samples of disjoint parts of a dataset merge into a uniform
+    sample of the whole.
+    """
+
+    def __init__(self, size: int = 5000, seed: int = 0):
+        """
+        Initialize reservoir sample
+
+        Args:
+            size: Maximum number of values kept
+            seed: Seed for the random keys
+        """
+        self.size = size
+        self.keys = np.empty(0)
+        self.values = np.empty(0)
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values: np.ndarray):
+        """Add NaN-free float values"""
+        if len(values) == 0:
+            return
+        self._keep(np.concatenate([self.keys, self._rng.random(len(values))]),
+                   np.concatenate([self.values, values]))
+
+    def merge(self, other: 'ReservoirSample') -> 'ReservoirSample':
+        """Merge another sample into this one"""
+        self._keep(np.concatenate([self.keys, other.keys]), np.concatenate([self.values, other.values]))
+        return self
+
+    def _keep(self, keys: np.ndarray, values: np.ndarray):
+        """Keep the values with the smallest keys, in key order"""
+        if len(keys) > self.size:
+            kept = np.argpartition(keys, self.size - 1)[:self.size]
+            keys, values = keys[kept], values[kept]
+        order = np.argsort(keys, kind='stable')
+        self.keys, self.values = keys[order], values[order]
+
+
+class Histogram:
+    """
+    Histogram with power-of-two bin widths aligned at zero
+
+    Bins are [i * w, (i + 1) * w) with w = 2**exponent, so histograms with
+    different widths can always be merged by doubling the finer one's
+    width. When the values span more than max_bins bins the width doubles
+    and adjacent bins are combined.
+    """
+
+    def __init__(self, max_bins: int = 256):
+        """
+        Initialize histogram
+
+        Args:
+            max_bins: Maximum number of bins kept
+        """
+        self.max_bins = max_bins
+        self.exponent: Optional[int] = None
+        self.offset = 0
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    @property
+    def width(self) -> float:
+        """Bin width"""
+        return math.ldexp(1.0, self.exponent) if self.exponent is not None else math.nan
+
+    def update(self, values: np.ndarray):
+        """Add NaN-free float values (infinite values are ignored)"""
+        values = values[np.isfinite(values)]
+        if len(values) == 0:
+            return
+        lo, hi = float(values.min()), float(values.max())
+        if self.exponent is None:
+            self.exponent = self._initial_exponent(lo, hi)
+        self._extend(math.floor(lo / self.width), math.floor(hi / self.width))
+        idx = np.floor(values / self.width).astype(np.int64) - self.offset
+        self.counts += np.bincount(idx, minlength=len(self.counts))
+
+    def merge(self, other: 'Histogram') -> 'Histogram':
+        """Merge another histogram into this one"""
+        if other.exponent is None:
+            return self
+        other = other.copy()
+        if self.exponent is None:
+            self.exponent = other.exponent
+        while other.exponent < self.exponent:
+            other._coarsen()
+        while self.exponent < other.exponent:
+            self._coarsen()
+        # Covering both ranges may coarsen this histogram further
+        self._extend(other.offset, other.offset + len(other.counts) - 1)
+        while other.exponent < self.exponent:
+            other._coarsen()
+        start = other.offset - self.offset
+        self.counts[start:start + len(other.counts)] += other.counts
+        return self
+
+    def copy(self) -> 'Histogram':
+        """Independent copy"""
+        copied = Histogram(self.max_bins)
+        copied.exponent = self.exponent
+        copied.offset = self.offset
+        copied.counts = self.counts.copy()
+        return copied
+
+    def edges(self) -> np.ndarray:
+        """Bin edges (one more than the number of bins)"""
+        return (self.offset + np.arange(len(self.counts) + 1)) * self.width
+
+    def _initial_exponent(self, lo: float, hi: float) -> int:
+        """Finest width covering [lo, hi] in max_bins bins"""
+        magnitude = max(abs(lo), abs(hi))
+        # Bins narrower than float resolution at this magnitude are useless
+        # and their indices would overflow
+        floor_exponent = math.frexp(magnitude)[1] - 52 if magnitude > 0 else -1022
+        if hi > lo:
+            exponent = math.frexp((hi - lo) / self.max_bins)[1]
+        elif magnitude > 0:
+            exponent = math.frexp(magnitude)[1] - 8
+        else:
+            exponent = -30
+        return max(exponent, floor_exponent)
+
+    def _extend(self, first: int, last: int):
+        """
+        Grow the bin range to cover bin indices first..last (at the current width)
+
+        The width is doubled first as often as needed for the combined range
+        to fit in max_bins, so no more than max_bins bins are ever allocated.
+        """
+        if len(self.counts) > 0:
+            first = min(first, self.offset)
+            last = max(last, self.offset + len(self.counts) - 1)
+        doublings = 0
+        while (last >> doublings) - (first >> doublings) + 1 > self.max_bins:
+            doublings += 1
+        for _ in range(doublings):
+            self._coarsen()
+        first, last = first >> doublings, last >> doublings
+
+        counts = np.zeros(last - first + 1, dtype=np.int64)
+        if len(self.counts) > 0:
+            start = self.offset - first
+            counts[start:start + len(self.counts)] = self.counts
+        self.offset, self.counts = first, counts
+
+    def _coarsen(self):
+        """Double the bin width, combining adjacent bins"""
+        self.exponent += 1
+        if len(self.counts) == 0:
+            return
+        idx = (self.offset + np.arange(len(self.counts))) // 2
+        offset = int(idx[0])
+        self.counts = np.bincount(idx - offset, weights=self.counts).astype(np.int64)
+        self.offset = offset
+
+
+def align_histograms(histograms: List[Histogram],
+                     max_bins: int = 60) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """
+    Put histograms on one shared grid of at most max_bins bins
+
+    Args:
+        histograms: Histograms to align (not modified)
+        max_bins: Maximum number of bins of the shared grid
+
+    Returns:
+        Tuple of (bin edges, counts per histogram)
+    """
+    histograms = [h.copy() for h in histograms if h.exponent is not None]
+    if not histograms:
+        return np.zeros(0), []
+    exponent = max(h.exponent for h in histograms)
+    for h in histograms:
+        while h.exponent < exponent:
+            h._coarsen()
+    first = min(h.offset for h in histograms)
+    last = max(h.offset + len(h.counts) - 1 for h in histograms)
+    while last - first + 1 > max_bins:
+        for h in histograms:
+            h._coarsen()
+        first = min(h.offset for h in histograms)
+        last = max(h.offset + len(h.counts) - 1 for h in histograms)
+
+    aligned = []
+    for h in histograms:
+        counts = np.zeros(last - first + 1, dtype=np.int64)
+        start = h.offset - first
+        counts[start:start + len(h.counts)] = h.counts
+        aligned.append(counts)
+    edges = (first + np.arange(last - first + 2)) * histograms[0].width
+    return edges, aligned
+
+
+class Moments:
+    """Count, mean, central moments up to the fourth, min and max, mergeable"""
+
+    def __init__(self):
+        """Initialize empty moments"""
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.m3 = 0.0
+        self.m4 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def update(self, values: np.ndarray):
+        """Add NaN-free float values"""
+        if len(values) == 0:
+            return
+        chunk = Moments()
+        chunk.n = len(values)
+        chunk.mean = float(values.mean())
+        centered = values - chunk.mean
+        squared = centered * centered
+        chunk.m2 = float(squared.sum())
+        chunk.m3 = float((squared * centered).sum())
+        chunk.m4 = float((squared * squared).sum())
+        chunk.min = float(values.min())
+        chunk.max = float(values.max())
+        self.merge(chunk)
+
+    def merge(self, other: 'Moments') -> 'Moments':
+        """Merge another set of moments into this one (Chan et al. / Pebay)"""
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            self.__dict__.update(other.__dict__)
+            return self
+        n_a, n_b = self.n, other.n
+        n = n_a + n_b
+        delta = other.mean - self.mean
+        delta_n = delta / n
+        m2 = self.m2 + other.m2 + delta * delta_n * n_a * n_b
+        m3 = (self.m3 + other.m3
+              + delta * delta_n ** 2 * n_a * n_b * (n_a - n_b)
+              + 3 * delta_n * (n_a * other.m2 - n_b * self.m2))
+        m4 = (self.m4 + other.m4
+              + delta * delta_n ** 3 * n_a * n_b * (n_a * n_a - n_a * n_b + n_b * n_b)
+              + 6 * delta_n ** 2 * (n_a * n_a * other.m2 + n_b * n_b * self.m2)
+              + 4 * delta_n * (n_a * other.m3 - n_b * self.m3))
+        self.n = n
+        self.mean += delta_n * n_b
+        self.m2, self.m3, self.m4 = m2, m3, m4
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (ddof=1)"""
+        return self.m2 / (self.n - 1) if self.n > 1 else math.nan
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1)"""
+        return math.sqrt(self.variance) if self.n > 1 else math.nan
+
+    @property
+    def skewness(self) -> float:
+        """Sample skewness (biased, as scipy.stats.skew)"""
+        if self.n < 2 or self.m2 == 0:
+            return math.nan
+        return math.sqrt(self.n) * self.m3 / self.m2 ** 1.5
+
+    @property
+    def kurtosis(self) -> float:
+        """Sample excess kurtosis (biased, as scipy.stats.kurtosis)"""
+        if self.n < 2 or self.m2 == 0:
+            return math.nan
+        return self.n * self.m4 / (self.m2 * self.m2) - 3.0
+
+
+class CategoryCounts:
+    """
+    Value counts of a categorical field, bounded to max_categories values
+
+    When there are more distinct values, only the most frequent are kept
+    and the rest are counted in `other`; the field is then marked as
+    truncated (and is better treated as text).
+    """
+
+    def __init__(self, max_categories: int = 10000):
+        """
+        Initialize category counts
+
+        Args:
+            max_categories: Maximum number of distinct values kept
+        """
+        self.max_categories = max_categories
+        self.counts: Dict = {}
+        self.other = 0
+        self.truncated = False
+
+    @property
+    def total(self) -> int:
+        """Number of values counted"""
+        return sum(self.counts.values()) + self.other
+
+    def update(self, values: pd.Series):
+        """Add non-null values"""
+        for value, count in values.value_counts(sort=False).items():
+            if count:
+                self.counts[value] = self.counts.get(value, 0) + int(count)
+        self._bound()
+
+    def merge(self, other: 'CategoryCounts') -> 'CategoryCounts':
+        """Merge other counts into these"""
+        for value, count in other.counts.items():
+            self.counts[value] = self.counts.get(value, 0) + count
+        self.other += other.other
+        self.truncated = self.truncated or other.truncated
+        self._bound()
+        return self
+
+    def _bound(self):
+        """Drop the least frequent values beyond max_categories"""
+        if len(self.counts) <= self.max_categories:
+            return
+        kept = sorted(self.counts.items(), key=lambda item: item[1], reverse=True)[:self.max_categories]
+        self.other += self.total - self.other - sum(count for _, count in kept)
+        self.counts = dict(kept)
+        self.truncated = True
+
+
+class CorrelationSums:
+    """
+    Pairwise-complete sums for Pearson correlations between numeric columns
+
+    For every pair of columns the count, sums and sums of squares and
+    products over rows where both are present are accumulated, matching
+    pandas' DataFrame.corr(). Values are shifted by a per-column reference
+    (the first chunk's mean) to limit cancellation. Memory is quadratic in
+    the number of columns and independent of the number of rows.
+    """
+
+    def __init__(self, columns: List[str]):
+        """
+        Initialize correlation sums
+
+        Args:
+            columns: Numeric columns to correlate
+        """
+        self.columns = list(columns)
+        p = len(self.columns)
+        self.shift: Optional[np.ndarray] = None
+        self.n = np.zeros((p, p))
+        self.sx = np.zeros((p, p))
+        self.sxx = np.zeros((p, p))
+        self.sxy = np.zeros((p, p))
+
+    def update(self, df: pd.DataFrame):
+        """Add the rows of a chunk (columns missing from it count as null)"""
+        if not self.columns or len(df) == 0:
+            return
+        values = np.column_stack([_float_values(df, col) for col in self.columns])
+        if self.shift is None:
+            with np.errstate(invalid='ignore'):
+                counts = (~np.isnan(values)).sum(axis=0)
+                self.shift = np.where(counts > 0, np.nansum(values, axis=0) / np.maximum(counts, 1), 0.0)
+        values = values - self.shift
+        present = ~np.isnan(values)
+        mask = present.astype(np.float64)
+        filled = np.where(present, values, 0.0)
+        self.n += mask.T @ mask
+        # sx[i, j]: sum of column i over rows where i and j are present
+        self.sx += filled.T @ mask
+        self.sxx += (filled * filled).T @ mask
+        self.sxy += filled.T @ filled
+
+    def merge(self, other: 'CorrelationSums') -> 'CorrelationSums':
+        """Merge sums of other rows into these"""
+        if other.shift is None:
+            return self
+        self.extend(other.columns)
+        other = other._reindexed(self.columns)
+        if self.shift is None:
+            self.shift = other.shift.copy()
+        # Re-express other's sums relative to this shift
+        d = other.shift - self.shift
+        di, dj = d[:, None], d[None, :]
+        self.sxy += other.sxy + dj * other.sx + di * other.sx.T + di * dj * other.n
+        self.sxx += other.sxx + 2 * di * other.sx + di * di * other.n
+        self.sx += other.sx + di * other.n
+        self.n += other.n
+        return self
+
+    def correlation(self) -> pd.DataFrame:
+        """Pearson correlation matrix (NaN where undefined)"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            covariance = self.n * self.sxy - self.sx * self.sx.T
+            var_i = self.n * self.sxx - self.sx * self.sx
+            corr = covariance / np.sqrt(var_i * var_i.T)
+        corr[self.n < 2] = np.nan
+        corr = np.clip(corr, -1, 1)
+        return pd.DataFrame(corr, index=self.columns, columns=self.columns)
+
+    def extend(self, columns: List[str]):
+        """Add columns not tracked yet (with no rows so far)"""
+        columns = self.columns + [col for col in columns if col not in self.columns]
+        if len(columns) > len(self.columns):
+            self.__dict__.update(self._reindexed(columns).__dict__)
+
+    def _reindexed(self, columns: List[str]) -> 'CorrelationSums':
+        """Copy laid out for a superset of the columns"""
+        if columns == self.columns:
+            return self
+        result = CorrelationSums(columns)
+        idx = [columns.index(col) for col in self.columns]
+        grid = np.ix_(idx, idx)
+        for attr in ('n', 'sx', 'sxx', 'sxy'):
+            getattr(result, attr)[grid] = getattr(self, attr)
+        if self.shift is not None:
+            result.shift = np.zeros(len(columns))
+            result.shift[idx] = self.shift
+        return result
+
+
+def _float_values(df: pd.DataFrame, column: str) -> np.ndarray:
+    """A column as float64 with NaN for nulls, text, and columns missing from df"""
+    if column not in df.columns:
+        return np.full(len(df), np.nan)
+    series = df[column]
+    if not pd.api.types.is_numeric_dtype(series):
+        series = pd.to_numeric(series, errors='coerce')
+    return series.to_numpy(dtype=np.float64, na_value=np.nan)
@@ -43,19 +43,19 @@ class StatisticalTester:
         Returns:
             List of TestResult objects
         """
-        results = []
-        
         # Clean and prepare arrays
         clean_arrays = []
         for arr in arrays:
-            if hasattr(arr, 'values'):
-                arr = arr.values
-            elif not isinstance(arr, np.ndarray):
-                arr = np.array(arr)
-            
             try:
-                arr = arr.astype(float)
-                clean_arrays.append(arr[~np.isnan(arr)])
+                if hasattr(arr, 'to_numpy'):
+                    # Series and extension arrays (including Arrow-backed ones)
+                    # convert straight to float without an object round trip
+                    arr = arr.to_numpy(dtype=float, na_value=np.nan)
+                else:
+                    # No copy for float64 arrays, e.g. from a ColumnStore
+                    arr = np.asarray(arr, dtype=float)
+                missing = np.isnan(arr)
+                clean_arrays.append(arr[~missing] if missing.any() else arr)
             except (ValueError, TypeError):
                 continue
                 
@@ -64,68 +64,134 @@ class StatisticalTester:
         if len(arrays) < 2:
             raise ValueError("Need at least 2 arrays to compare")
             
+        results = self.compare_numeric_samples(*arrays)
+            
+        # Anderson-Darling test (for each distribution)
+        for i, arr in enumerate(arrays):
+            result = self.normality_test(i, arr)
+            if result is not None:
+                results.append(result)
+                
+        return results
+        
+    def compare_numeric_samples(self, *arrays) -> List[TestResult]:
+        """
+        Run the tests that compare numeric samples with each other.
+        
+        Kolmogorov-Smirnov (for exactly 2 samples) and Kruskal-Wallis; the
+        per-sample Anderson-Darling tests are run by normality_test.
+        
+        Args:
+            *arrays: NaN-free float arrays (e.g. from a ColumnStore)
+            
+        Returns:
+            List of TestResult objects
+        """
+        results = []
+        
         # Kolmogorov-Smirnov test (for 2 samples)
         if len(arrays) == 2:
             ks_stat, ks_p = ks_2samp(arrays[0], arrays[1])
-            results.append(TestResult(
-                test_name="Kolmogorov-Smirnov Test",
-                description="A non-parametric test that compares the cumulative distributions of two samples. "
-                           "It measures the maximum distance between the empirical distribution functions and "
-                           "tests whether two samples come from the same distribution. Sensitive to differences "
-                           "in both location and shape of distributions. Works well for continuous data.",
-                statistic=ks_stat,
-                p_value=ks_p,
-                alpha=self.alpha,
-                significant=ks_p < self.alpha,
-                interpretation=self._interpret_p_value(ks_p, "distributions are identical")
-            ))
+            results.append(self._ks_result(ks_stat, ks_p))
             
         # Kruskal-Wallis test (for 2+ samples)
         if len(arrays) >= 2:
             kw_stat, kw_p = kruskal(*arrays)
-            results.append(TestResult(
-                test_name="Kruskal-Wallis Test",
-                description="A non-parametric alternative to one-way ANOVA that tests whether samples originate "
-                           "from the same distribution. It uses ranks rather than actual values, making it robust "
-                           "to outliers and non-normal distributions. Tests the null hypothesis that all groups have "
-                           "identical median values. Suitable for comparing 2 or more independent samples.",
-                statistic=kw_stat,
-                p_value=kw_p,
-                alpha=self.alpha,
-                significant=kw_p < self.alpha,
-                interpretation=self._interpret_p_value(kw_p, "all distributions are identical") + " " + 
-                             self._get_practical_interpretation("Kruskal-Wallis Test", kw_p, kw_p < self.alpha),
-            ))
+            results.append(self._kruskal_result(kw_stat, kw_p))
             
-        # Anderson-Darling test (for each distribution)
-        for i, arr in enumerate(arrays):
-            if len(arr) >= 5:
-                result = anderson(arr)
-                # Check significance at alpha level
-                sig_levels = result.significance_level / 100  # Convert percentages to decimals
-                significant = False
-                for idx, sig_level in enumerate(sig_levels):
-                    if abs(sig_level - self.alpha) < 0.01:  # Find closest significance level
-                        test_stat = result.statistic
-                        crit_val = result.critical_values[idx]
-                        significant = test_stat > crit_val
-                        break
-                
-                results.append(TestResult(
-                    test_name=f"Anderson-Darling Test (Sample {i+1})",
-                    description="A goodness-of-fit test that determines if a sample comes from a specified distribution "
-                               "(usually normal). More sensitive than Kolmogorov-Smirnov to deviations in the tails of "
-                               "distributions. Provides critical values at multiple significance levels rather than a single "
-                               "p-value. Particularly useful for testing normality assumptions before applying parametric tests.",
-                    statistic=result.statistic,
-                    p_value=-1,  # Anderson test doesn't return p-value directly
-                    alpha=self.alpha,
-                    significant=significant,
-                    interpretation=(f"Statistically significant at α={self.alpha} level" if test_stat > crit_val
-                                else f"Not significant at α={self.alpha} level") + " " + 
-                                self._get_practical_interpretation("Anderson-Darling Test", 0.0, test_stat > crit_val),
-                    metadata={"significance_levels": result.significance_level, "critical_values": result.critical_values}
-                ))
+        return results
+        
+    def normality_test(self, index: int, values: np.ndarray) -> Optional[TestResult]:
+        """
+        Anderson-Darling normality test of one sample.
+        
+        Depends only on that sample, so results can be reused while the
+        other datasets of a comparison change.
+        
+        Args:
+            index: Position of the sample in the comparison
+            values: NaN-free float array
+            
+        Returns:
+            TestResult, or None for fewer than 5 values
+        """
+        if len(values) < 5:
+            return None
+        result = anderson(values)
+        return self._anderson_result(index, result.statistic, result.critical_values,
+                                     result.significance_level)
+        
+    def compare_identical(self, n_samples: int, values: Optional[np.ndarray] = None) -> List[TestResult]:
+        """
+        Results for a field whose column is identical in every dataset.
+        
+        The comparison tests are not run: identical samples cannot differ,
+        so they are reported as a single "Identical Columns" result. For
+        numeric fields the Anderson-Darling test is run once and reported
+        for each sample.
+        
+        Args:
+            n_samples: Number of datasets compared
+            values: NaN-free float array of the shared column, for numeric fields
+            
+        Returns:
+            List of TestResult objects
+        """
+        results = [TestResult(
+            test_name="Identical Columns",
+            description="The column has the same type and the same values, in the same order, in every dataset "
+                        "(compared by content fingerprint), so its distributions are identical and the "
+                        "comparison tests were skipped.",
+            statistic=0.0,
+            p_value=1.0,
+            alpha=self.alpha,
+            significant=False,
+            interpretation=f"Identical in all {n_samples} datasets; no differences to test.",
+            metadata={"identical": True}
+        )]
+        if values is not None and len(values) >= 5:
+            result = anderson(values)
+            for i in range(n_samples):
+                results.append(self._anderson_result(i, result.statistic, result.critical_values,
+                                                     result.significance_level))
+        return results
+        
+    def compare_numeric_profiles(self, *profiles) -> List[TestResult]:
+        """
+        Compare numeric fields from their streaming profiles.
+        
+        All tests are run on each field's mergeable uniform random sample
+        instead of the raw values. Statistics rebuilt from the quantile
+        sketches would carry its rank error at the full row counts and flag
+        identical distributions as different on large inputs; the samples
+        keep the p-values calibrated, at the power of the sample size.
+        
+        Args:
+            *profiles: FieldProfile objects of one field in each dataset
+            
+        Returns:
+            List of TestResult objects
+        """
+        results = []
+        profiles = [p for p in profiles if p.sample is not None and len(p.sample.values) > 0]
+        if len(profiles) < 2:
+            raise ValueError("Need at least 2 non-empty profiles to compare")
+        samples = [p.sample.values for p in profiles]
+        approximate = {'approximate': True, 'sample_sizes': [len(sample) for sample in samples]}
+        
+        if len(profiles) == 2:
+            ks_stat, ks_p = ks_2samp(samples[0], samples[1])
+            results.append(self._ks_result(ks_stat, ks_p, approximate))
+            
+        kw_stat, kw_p = kruskal(*samples)
+        results.append(self._kruskal_result(kw_stat, kw_p, approximate))
+        
+        for i, profile in enumerate(profiles):
+            sample = profile.sample.values
+            if len(sample) >= 5:
+                result = anderson(sample)
+                results.append(self._anderson_result(i, result.statistic, result.critical_values,
+                                                     result.significance_level, {'sample_size': len(sample)}))
                 
         return results
         
@@ -167,25 +233,121 @@ class StatisticalTester:
         
         # Chi-square test
         if contingency_table.size > 0 and np.sum(contingency_table) > 0:
-            chi2, p_value, dof, expected = chi2_contingency(contingency_table)
-            results.append(TestResult(
-                test_name="Chi-square Test",
-                description="A statistical test for categorical data that determines if there is a significant "
-                           "association between two or more categorical variables. It compares observed frequencies "
-                           "in a contingency table with expected frequencies under the assumption of independence. "
-                           "Requires sufficient sample size (expected frequencies > 5) for validity. Tests whether "
-                           "the distribution of one variable differs across levels of another variable.",
-                statistic=chi2,
-                p_value=p_value,
-                alpha=self.alpha,
-                significant=p_value < self.alpha,
-                interpretation=self._interpret_p_value(p_value, "distributions are independent") + " " + 
-                             self._get_practical_interpretation("Chi-square Test", p_value, p_value < self.alpha),
-                metadata={"degrees_of_freedom": dof}
-            ))
+            results.append(self._chi_square_result(contingency_table))
             
         return results
         
+    def compare_categorical_profiles(self, *profiles) -> List[TestResult]:
+        """
+        Compare categorical fields from the category counts of their profiles.
+        
+        Args:
+            *profiles: FieldProfile objects of one field in each dataset
+            
+        Returns:
+            List of TestResult objects
+        """
+        results = []
+        if len(profiles) < 2:
+            return results
+            
+        categories = set()
+        for profile in profiles:
+            categories.update(profile.categories.counts)
+        categories = sorted(categories, key=str)
+        
+        contingency_table = np.array([
+            [profile.categories.counts.get(cat, 0) for cat in categories] for profile in profiles
+        ])
+        if contingency_table.size > 0 and np.sum(contingency_table) > 0:
+            results.append(self._chi_square_result(contingency_table))
+            
+        return results
+        
+    def _ks_result(self, ks_stat: float, ks_p: float, metadata: Optional[Dict[str, Any]] = None) -> TestResult:
+        """Kolmogorov-Smirnov TestResult."""
+        return TestResult(
+            test_name="Kolmogorov-Smirnov Test",
+            description="A non-parametric test that compares the cumulative distributions of two samples. "
+                        "It measures the maximum distance between the empirical distribution functions and "
+                        "tests whether two samples come from the same distribution. Sensitive to differences "
+                        "in both location and shape of distributions. Works well for continuous data.",
+            statistic=ks_stat,
+            p_value=ks_p,
+            alpha=self.alpha,
+            significant=ks_p < self.alpha,
+            interpretation=self._interpret_p_value(ks_p, "distributions are identical"),
+            metadata=metadata
+        )
+        
+    def _kruskal_result(self, kw_stat: float, kw_p: float, metadata: Optional[Dict[str, Any]] = None) -> TestResult:
+        """Kruskal-Wallis TestResult."""
+        return TestResult(
+            test_name="Kruskal-Wallis Test",
+            description="A non-parametric alternative to one-way ANOVA that tests whether samples originate "
+                        "from the same distribution. It uses ranks rather than actual values, making it robust "
+                        "to outliers and non-normal distributions. Tests the null hypothesis that all groups have "
+                        "identical median values. Suitable for comparing 2 or more independent samples.",
+            statistic=kw_stat,
+            p_value=kw_p,
+            alpha=self.alpha,
+            significant=kw_p < self.alpha,
+            interpretation=self._interpret_p_value(kw_p, "all distributions are identical") + " " + 
+                         self._get_practical_interpretation("Kruskal-Wallis Test", kw_p, kw_p < self.alpha),
+            metadata=metadata
+        )
+        
+    def _anderson_result(self,
+                         index: int,
+                         statistic: float,
+                         critical_values: np.ndarray,
+                         significance_level: np.ndarray,
+                         metadata: Optional[Dict[str, Any]] = None) -> TestResult:
+        """Anderson-Darling normality TestResult for the sample at index."""
+        # Check significance at alpha level
+        sig_levels = significance_level / 100  # Convert percentages to decimals
+        significant = False
+        for idx, sig_level in enumerate(sig_levels):
+            if abs(sig_level - self.alpha) < 0.01:  # Find closest significance level
+                significant = statistic > critical_values[idx]
+                break
+                
+        return TestResult(
+            test_name=f"Anderson-Darling Test (Sample {index+1})",
+            description="A goodness-of-fit test that determines if a sample comes from a specified distribution "
+                        "(usually normal). More sensitive than Kolmogorov-Smirnov to deviations in the tails of "
+                        "distributions. Provides critical values at multiple significance levels rather than a single "
+                        "p-value. Particularly useful for testing normality assumptions before applying parametric tests.",
+            statistic=statistic,
+            p_value=-1,  # Anderson test doesn't return p-value directly
+            alpha=self.alpha,
+            significant=significant,
+            interpretation=(f"Statistically significant at α={self.alpha} level" if significant
+                        else f"Not significant at α={self.alpha} level") + " " + 
+                        self._get_practical_interpretation("Anderson-Darling Test", 0.0, significant),
+            metadata={"significance_levels": significance_level, "critical_values": critical_values,
+                      **(metadata or {})}
+        )
+        
+    def _chi_square_result(self, contingency_table: np.ndarray) -> TestResult:
+        """Chi-square test of independence TestResult for a contingency table."""
+        chi2, p_value, dof, expected = chi2_contingency(contingency_table)
+        return TestResult(
+            test_name="Chi-square Test",
+            description="A statistical test for categorical data that determines if there is a significant "
+                        "association between two or more categorical variables. It compares observed frequencies "
+                        "in a contingency table with expected frequencies under the assumption of independence. "
+                        "Requires sufficient sample size (expected frequencies > 5) for validity. Tests whether "
+                        "the distribution of one variable differs across levels of another variable.",
+            statistic=chi2,
+            p_value=p_value,
+            alpha=self.alpha,
+            significant=p_value < self.alpha,
+            interpretation=self._interpret_p_value(p_value, "distributions are independent") + " " + 
+                         self._get_practical_interpretation("Chi-square Test", p_value, p_value < self.alpha),
+            metadata={"degrees_of_freedom": dof}
+        )
+        
     def _interpret_p_value(self, p_value: float, null_hypothesis: str) -> str:
         """Generate interpretation text for p-value with alpha level."""
         if p_value < 0.001:
@@ -6,6 +6,16 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from typing import Dict, Optional
 from .schema import DataType
+from .profiling import DatasetProfile, FieldProfile
+from .sketches import align_histograms
+
+
+def numeric_columns(df: pd.DataFrame) -> list:
+    """Numeric (non-boolean) columns, including Arrow-backed ones."""
+    return [
+        col for col, dtype in df.dtypes.items()
+        if pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+    ]
 
 
 class VisualizationEngine:
@@ -39,7 +49,10 @@ class VisualizationEngine:
             color = self.color_palette[idx % len(self.color_palette)]
             
             # Convert to proper format for Plotly
-            if isinstance(data, pd.Series):
+            if data_type == DataType.NUMERIC and hasattr(data, 'to_numpy'):
+                # Arrow-backed and nullable columns convert without object arrays
+                data_values = data.to_numpy(dtype=float, na_value=np.nan).tolist()
+            elif isinstance(data, pd.Series):
                 data_values = data.values.tolist()
             elif hasattr(data, 'values'):
                 data_values = data.values.tolist()
@@ -82,6 +95,65 @@ class VisualizationEngine:
         
         return fig
         
+    def create_profile_distribution_overlay(self,
+                                            profiles: Dict[str, FieldProfile],
+                                            field_name: str,
+                                            data_type: DataType) -> go.Figure:
+        """
+        Create overlay distribution plot from field profiles of streamed datasets.
+        
+        Numeric fields are drawn from the profiles' histograms, aligned on
+        one shared grid; categorical fields from their category counts.
+        
+        Args:
+            profiles: Dictionary mapping dataset names to FieldProfiles
+            field_name: Name of the field being compared
+            data_type: Type of data (numeric or categorical)
+            
+        Returns:
+            Plotly figure object
+        """
+        fig = go.Figure()
+        
+        if data_type == DataType.NUMERIC:
+            # Empty histograms are left out of the shared grid
+            named = [(name, p.histogram) for name, p in profiles.items() if p.histogram.exponent is not None]
+            edges, counts = align_histograms([h for _, h in named], max_bins=60)
+            centers = ((edges[:-1] + edges[1:]) / 2).tolist()
+            width = float(edges[1] - edges[0]) if len(edges) > 1 else None
+            for idx, ((name, _), bin_counts) in enumerate(zip(named, counts)):
+                fig.add_trace(go.Bar(
+                    x=centers,
+                    y=bin_counts.tolist(),
+                    width=width,
+                    name=name,
+                    opacity=0.7,
+                    marker_color=self.color_palette[idx % len(self.color_palette)]
+                ))
+        else:
+            for idx, (name, profile) in enumerate(profiles.items()):
+                value_counts = pd.Series(profile.categories.counts).sort_values(ascending=False).head(20)
+                fig.add_trace(go.Bar(
+                    x=value_counts.index.tolist(),
+                    y=value_counts.values.tolist(),
+                    name=name,
+                    marker_color=self.color_palette[idx % len(self.color_palette)],
+                    opacity=0.7
+                ))
+                
+        fig.update_layout(
+            title=f"Distribution Comparison: {field_name}",
+            barmode='overlay' if data_type == DataType.NUMERIC else 'group',
+            xaxis_title=field_name,
+            yaxis_title="Frequency",
+            hovermode='x unified',
+            template='plotly_white',
+            showlegend=True,
+            height=400
+        )
+        
+        return fig
+        
     def create_correlation_heatmap(self, df: pd.DataFrame, title: str) -> go.Figure:
         """
         Create correlation heatmap for numeric fields.
@@ -93,9 +165,26 @@ class VisualizationEngine:
         Returns:
             Plotly figure object
         """
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        numeric_cols = numeric_columns(df)
+        corr_matrix = df.loc[:, df.columns.isin(numeric_cols)].corr() if len(numeric_cols) >= 2 else None
+        return self._correlation_figure(corr_matrix, title)
+        
+    def create_profile_correlation_heatmap(self, profile: DatasetProfile, title: str) -> go.Figure:
+        """
+        Create correlation heatmap from the correlation sums of a dataset profile.
+        
+        Args:
+            profile: DatasetProfile of a streamed dataset
+            title: Title for the heatmap
+            
+        Returns:
+            Plotly figure object
+        """
+        return self._correlation_figure(profile.correlation_matrix(), title)
         
-        if len(numeric_cols) < 2:
+    def _correlation_figure(self, corr_matrix: Optional[pd.DataFrame], title: str) -> go.Figure:
+        """Heatmap of a correlation matrix, or a placeholder for fewer than two columns"""
+        if corr_matrix is None or len(corr_matrix.columns) < 2:
             # Return empty figure if not enough numeric columns
             fig = go.Figure()
             fig.add_annotation(
@@ -105,8 +194,6 @@ class VisualizationEngine:
             )
             return fig
             
-        corr_matrix = df[numeric_cols].corr()
-        
         fig = go.Figure(data=go.Heatmap(
             z=corr_matrix.values.tolist(),
             x=corr_matrix.columns.tolist(),
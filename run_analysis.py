@@ -5,6 +5,7 @@ Run comparison analysis on multiple datasets with automatic format detection
 """
 
 import argparse
+import re
 import sys
 import os
 from pathlib import Path
@@ -18,8 +19,12 @@ import time
 sys.path.append(str(Path(__file__).parent))
 
 from dataframe_comparison import DataFrameComparison
-from dataframe_comparison.data_loader import DataLoader
+from dataframe_comparison.data_loader import DataLoader, SamplingConfig
+from dataframe_comparison.compression import strip_compression_suffix
+from dataframe_comparison.database import SQLSource
+from dataframe_comparison.profiling import DatasetProfile
 from dataframe_comparison.schema import FieldMapping, SchemaMapper
+from dataframe_comparison.sharding import FileShardExecutor, LocalShardExecutor
 
 
 def create_synthetic_datasets(n_rows: int = 1000, n_cols: int = 10) -> dict:
@@ -112,7 +117,7 @@ def create_synthetic_datasets(n_rows: int = 1000, n_cols: int = 10) -> dict:
     return datasets
 
 
-def create_schema_mappings(datasets: dict) -> list:
+def create_schema_mappings(datasets: dict = None) -> list:
     """Create schema mappings based on dataset columns"""
     # Define common field mappings
     mappings = [
@@ -194,42 +199,146 @@ def save_datasets_to_data_folder(datasets: dict, data_dir: Path):
     print(f"✅ Saved {len(datasets)} datasets to {data_dir}")
 
 
-def load_datasets_from_files(file_paths: list) -> dict:
-    """Load datasets from file paths"""
-    loader = DataLoader(optimize_dtypes=True)
-    datasets = {}
+def create_loader(args) -> DataLoader:
+    """Create a DataLoader configured from command line arguments"""
+    return DataLoader(
+        optimize_dtypes=True,
+        max_workers=args.workers,
+        cache_dir=args.cache_dir,
+        chunksize=args.chunksize,
+        dtype_backend='pyarrow' if args.arrow else 'numpy',
+        sampling=create_sampling_config(args)
+    )
+
+
+def create_sampling_config(args) -> SamplingConfig:
+    """Create the load-time sampling configuration, if any was requested"""
+    if args.sample_size is None and args.sample_frac is None:
+        return None
+    return SamplingConfig(
+        size=args.sample_size,
+        fraction=args.sample_frac,
+        stratify_by=args.stratify_by,
+        seed=args.seed
+    )
+
+
+def parse_filter(expression: str) -> tuple:
+    """
+    Parse a 'column<op>value' filter (e.g. 'date>=2024-01-01') into a DNF term
+
+    The value is kept as written; readers cast it to the column's type, so
+    'zip==007' still matches zero-padded text codes.
+    """
+    match = re.match(r'^\s*([^<>=!]+?)\s*(==|!=|>=|<=|=|<|>)\s*(.+?)\s*$', expression)
+    if not match:
+        raise argparse.ArgumentTypeError(f"Invalid filter expression: {expression}")
+    return tuple(match.groups())
+
+
+def load_datasets_from_files(file_paths: list, loader: DataLoader = None, filters: list = None,
+                             schema_cache_dir: Path = None) -> dict:
+    """Load datasets from file paths, reading only the fields common to all files"""
+    loader = loader or DataLoader(optimize_dtypes=True)
     
+    paths = []
+    names = []
     for i, file_path in enumerate(file_paths):
         path = Path(file_path)
         if path.exists():
-            try:
-                # Use file stem as dataset name
-                name = path.stem or f"Dataset_{i+1}"
-                datasets[name] = loader.load(path)
-                print(f"✅ Loaded {name} from {path} ({datasets[name].shape[0]} rows × {datasets[name].shape[1]} cols)")
-            except Exception as e:
-                print(f"❌ Failed to load {path}: {e}")
+            paths.append(path)
+            # Use file stem (without any compression suffix) as dataset name
+            names.append(strip_compression_suffix(path).stem or f"Dataset_{i+1}")
         else:
             print(f"⚠️ File not found: {path}")
     
+    schema_mapper = SchemaMapper(create_schema_mappings(), cache_dir=schema_cache_dir)
+    datasets = loader.load_multiple(paths, names=names, schema_mapper=schema_mapper, filters=filters)
+    
+    for name, path in zip(names, paths):
+        if name in datasets:
+            print(f"✅ Loaded {name} from {path} ({datasets[name].shape[0]} rows × {datasets[name].shape[1]} cols)")
+        elif name in loader.load_errors:
+            print(f"❌ Failed to load {path}: {loader.load_errors[name]}")
+    
     return datasets
 
 
-def load_datasets_from_directory(directory: Path) -> dict:
-    """Load all datasets from a directory"""
-    loader = DataLoader(optimize_dtypes=True)
-    datasets = loader.load_from_directory(directory)
+def load_datasets_from_directory(directory: Path, loader: DataLoader = None, filters: list = None,
+                                 partitioned: bool = False, schema_cache_dir: Path = None) -> dict:
+    """Load all datasets from a directory, reading only the fields common to all files"""
+    loader = loader or DataLoader(optimize_dtypes=True)
+    schema_mapper = SchemaMapper(create_schema_mappings(), cache_dir=schema_cache_dir)
+    datasets = loader.load_from_directory(directory, partitioned=partitioned,
+                                          schema_mapper=schema_mapper, filters=filters)
     
     if datasets:
         print(f"✅ Loaded {len(datasets)} datasets from {directory}")
         for name, df in datasets.items():
             print(f"   - {name}: {df.shape[0]} rows × {df.shape[1]} cols")
+    for name, error in loader.load_errors.items():
+        print(f"❌ Failed to load {name}: {error}")
     
     return datasets
 
 
-def run_comparison(datasets: dict, output_dir: Path, open_browser: bool = True):
-    """Run comparison analysis on datasets"""
+def open_streams(sources: list, loader: DataLoader, names: list = None, directory: Path = None,
+                 filters: list = None, schema_cache_dir: Path = None) -> dict:
+    """Open files, a directory or database tables as chunk streams for an out-of-core comparison"""
+    schema_mapper = SchemaMapper(create_schema_mappings(), cache_dir=schema_cache_dir)
+    if directory is not None:
+        streams = loader.iter_directory(directory, schema_mapper=schema_mapper, filters=filters)
+    else:
+        streams = loader.iter_multiple(sources, names=names, schema_mapper=schema_mapper, filters=filters)
+    
+    print(f"✅ Streaming {len(streams)} datasets in chunks of {loader.chunksize or 'default size'} rows")
+    for name, error in loader.load_errors.items():
+        print(f"❌ Cannot stream {name}: {error}")
+    
+    return streams
+
+
+def plan_shards(sources: list, loader: DataLoader, n_shards: int, names: list = None, filters: list = None,
+                schema_cache_dir: Path = None) -> dict:
+    """Split files or database tables into shards profiled in parallel"""
+    schema_mapper = SchemaMapper(create_schema_mappings(), cache_dir=schema_cache_dir)
+    shards = loader.plan_multiple(sources, n_shards, names=names, schema_mapper=schema_mapper, filters=filters)
+    
+    for name, dataset_shards in shards.items():
+        print(f"✅ Split {name} into {len(dataset_shards)} shards")
+    for name, error in loader.load_errors.items():
+        print(f"❌ Cannot shard {name}: {error}")
+    
+    return shards
+
+
+def load_datasets_from_database(url: str, tables: list, loader: DataLoader = None, filters: list = None,
+                                schema_cache_dir: Path = None) -> dict:
+    """Load database tables, pushing the common-field projection and filters into the queries"""
+    loader = loader or DataLoader(optimize_dtypes=True)
+    sources = [SQLSource(url, table=table) for table in tables]
+    
+    schema_mapper = SchemaMapper(create_schema_mappings(), cache_dir=schema_cache_dir)
+    try:
+        datasets = loader.load_multiple(sources, schema_mapper=schema_mapper, filters=filters)
+    finally:
+        loader.close()
+    
+    for source in sources:
+        if source.name in datasets:
+            df = datasets[source.name]
+            print(f"✅ Loaded {source.name} from {url} ({df.shape[0]} rows × {df.shape[1]} cols)")
+        elif source.name in loader.load_errors:
+            print(f"❌ Failed to load {source.name}: {loader.load_errors[source.name]}")
+    
+    return datasets
+
+
+def run_comparison(datasets: dict, output_dir: Path, open_browser: bool = True, schema_cache_dir: Path = None,
+                   result_cache_dir: Path = None,
+                   analysis_workers: int = 1, analysis_executor: str = 'process', stream: bool = False,
+                   shard_loader: DataLoader = None, shard_executor=None, save_profiles_dir: Path = None):
+    """Run comparison analysis on datasets (DataFrames, chunk iterators when streaming, or shards)"""
     print("\n🔍 Running comparison analysis...")
     print("=" * 60)
     
@@ -238,7 +347,11 @@ def run_comparison(datasets: dict, output_dir: Path, open_browser: bool = True):
     
     # Initialize comparison engine
     comparison_engine = DataFrameComparison(
-        schema_config=mappings
+        schema_config=mappings,
+        cache_dir=schema_cache_dir,
+        max_workers=analysis_workers,
+        executor=analysis_executor,
+        result_cache_dir=result_cache_dir
     )
     
     # Generate report
@@ -246,11 +359,21 @@ def run_comparison(datasets: dict, output_dir: Path, open_browser: bool = True):
     report_path = output_dir / f"comparison_report_{timestamp}.html"
     
     # Run comparison (this also generates the report)
-    results = comparison_engine.compare_datasets(
-        datasets, 
-        output_path=str(report_path),
-        title="DataFrame Comparison Report"
-    )
+    if shard_loader is not None:
+        results = comparison_engine.compare_shards(
+            datasets,
+            shard_loader,
+            output_path=str(report_path),
+            title="DataFrame Comparison Report",
+            shard_executor=shard_executor
+        )
+    else:
+        compare = comparison_engine.compare_streams if stream else comparison_engine.compare_datasets
+        results = compare(
+            datasets, 
+            output_path=str(report_path),
+            title="DataFrame Comparison Report"
+        )
     
     # Print summary
     print("\n📊 Comparison Results Summary:")
@@ -270,6 +393,15 @@ def run_comparison(datasets: dict, output_dir: Path, open_browser: bool = True):
     
     print(f"\n✅ Report saved to: {report_path}")
     
+    # Save profile snapshots of the compared inputs for later --baseline runs
+    if save_profiles_dir is not None:
+        for name, data in results['datasets'].items():
+            if isinstance(datasets[name], DatasetProfile):
+                continue
+            profile = data if isinstance(data, DatasetProfile) else comparison_engine.create_profile(name, data)
+            profile.save(save_profiles_dir / f"{name}.profile")
+            print(f"💾 Saved profile of {name} to {save_profiles_dir / f'{name}.profile'}")
+    
     # Open in browser
     if open_browser:
         print("🌐 Opening report in browser...")
@@ -294,6 +426,9 @@ Examples:
   # Load all files from a directory
   python run_analysis.py --dir data/
   
+  # Compare database tables
+  python run_analysis.py --db sqlite:///warehouse.db --table orders --table orders_v2
+  
   # Generate larger synthetic datasets
   python run_analysis.py --demo --rows 5000 --cols 50
   
@@ -305,11 +440,48 @@ Examples:
     parser.add_argument('files', nargs='*', help='Data files to compare')
     parser.add_argument('--demo', action='store_true', help='Use synthetic demo data')
     parser.add_argument('--dir', type=str, help='Load all files from directory')
+    parser.add_argument('--db', type=str,
+                        help='Database URL (e.g. sqlite:///warehouse.db) to load --table datasets from')
+    parser.add_argument('--table', dest='tables', action='append', help='Database table to compare (repeatable)')
     parser.add_argument('--rows', type=int, default=1000, help='Number of rows for demo data')
     parser.add_argument('--cols', type=int, default=10, help='Number of columns for demo data')
     parser.add_argument('--output', type=str, default='output', help='Output directory for reports')
     parser.add_argument('--save-demo', action='store_true', help='Save demo datasets to data folder')
     parser.add_argument('--no-browser', action='store_true', help='Do not open report in browser')
+    parser.add_argument('--workers', type=int, default=1, help='Number of files to load concurrently')
+    parser.add_argument('--analysis-workers', type=int, default=1,
+                        help='Number of fields to test and plot concurrently')
+    parser.add_argument('--analysis-executor', choices=['process', 'thread'], default='process',
+                        help='Run concurrent field analysis on worker processes (default) or threads')
+    parser.add_argument('--chunksize', type=int, help='Read input files in chunks of this many rows to bound memory')
+    parser.add_argument('--stream', action='store_true',
+                        help='Compare inputs chunk by chunk from bounded-memory sketches, without loading them; '
+                             'test statistics are approximate')
+    parser.add_argument('--shards', type=int,
+                        help='With --stream, split each input into this many shards profiled on parallel processes '
+                             '(Parquet by row group, Arrow by rows, uncompressed CSV/TSV/JSONL by line ranges)')
+    parser.add_argument('--shard-dir', type=str,
+                        help='With --shards, hand shards off through this shared directory; other nodes help by running '
+                             '"python -m dataframe_comparison.sharding DIR"')
+    parser.add_argument('--baseline', dest='baselines', action='append',
+                        help='Profile snapshot (from --save-profiles) to compare the inputs against without '
+                             'loading its rows (repeatable)')
+    parser.add_argument('--save-profiles', type=str,
+                        help='Save a profile snapshot of each input to this directory for later --baseline runs')
+    parser.add_argument('--arrow', action='store_true', help='Parse inputs with pyarrow into Arrow-backed dtypes')
+    parser.add_argument('--filter', dest='filters', action='append', type=parse_filter,
+                        help="Row filter on a standardized field such as 'date>=2024-01-01' "
+                             "(repeatable, AND-ed; pushed down into Parquet)")
+    parser.add_argument('--partitioned', action='store_true',
+                        help='With --dir, load each subdirectory as one Hive-partitioned dataset')
+    parser.add_argument('--sample-size', type=int,
+                        help='Load a fixed-size random sample of each input (per stratum with --stratify-by)')
+    parser.add_argument('--sample-frac', type=float, help='Load a random fraction of each input')
+    parser.add_argument('--stratify-by', type=str, help='Standardized field to stratify --sample-size by')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for load-time sampling')
+    parser.add_argument('--cache-dir', type=str, help='Cache parsed CSV/JSON/Excel inputs as Parquet, resolved column '
+                             'mappings as JSON (under schema/) and test results and figures keyed by column '
+                             'content (under results/) in this directory')
     
     args = parser.parse_args()
     
@@ -321,8 +493,15 @@ Examples:
     print("   DataFrame Comparison Tool")
     print("=" * 60)
     
+    # Resolved column mappings and comparison results are cached next to
+    # the parsed inputs
+    schema_cache_dir = Path(args.cache_dir) / 'schema' if args.cache_dir else None
+    result_cache_dir = Path(args.cache_dir) / 'results' if args.cache_dir else None
+    
     # Load or generate datasets
     datasets = {}
+    stream_loader = None
+    sharded = False
     
     if args.demo:
         # Generate synthetic data
@@ -333,24 +512,66 @@ Examples:
             data_dir = Path('data')
             save_datasets_to_data_folder(datasets, data_dir)
     
+    elif args.stream and (args.dir or args.db or args.files):
+        # Open inputs as chunk streams; nothing is read until the comparison
+        stream_loader = create_loader(args)
+        if args.shards and not args.dir:
+            sharded = True
+            if args.db:
+                sources = [SQLSource(args.db, table=table) for table in args.tables or []]
+                datasets = plan_shards(sources, stream_loader, args.shards, filters=args.filters,
+                                       schema_cache_dir=schema_cache_dir)
+            else:
+                paths = [Path(f) for f in args.files]
+                datasets = plan_shards(paths, stream_loader, args.shards,
+                                       names=[strip_compression_suffix(p).stem for p in paths],
+                                       filters=args.filters, schema_cache_dir=schema_cache_dir)
+        elif args.dir:
+            datasets = open_streams(None, stream_loader, directory=Path(args.dir), filters=args.filters,
+                                    schema_cache_dir=schema_cache_dir)
+        elif args.db:
+            sources = [SQLSource(args.db, table=table) for table in args.tables or []]
+            datasets = open_streams(sources, stream_loader, filters=args.filters, schema_cache_dir=schema_cache_dir)
+        else:
+            paths = [Path(f) for f in args.files]
+            datasets = open_streams(paths, stream_loader, names=[strip_compression_suffix(p).stem for p in paths],
+                                    filters=args.filters, schema_cache_dir=schema_cache_dir)
+    
     elif args.dir:
         # Load from directory
         dir_path = Path(args.dir)
         if dir_path.exists():
-            datasets = load_datasets_from_directory(dir_path)
+            datasets = load_datasets_from_directory(dir_path, create_loader(args), filters=args.filters,
+                                                    partitioned=args.partitioned,
+                                                    schema_cache_dir=schema_cache_dir)
         else:
             print(f"❌ Directory not found: {dir_path}")
             sys.exit(1)
     
+    elif args.db:
+        # Load database tables
+        if not args.tables:
+            print("❌ --db needs at least one --table")
+            sys.exit(1)
+        datasets = load_datasets_from_database(args.db, args.tables, create_loader(args), filters=args.filters,
+                                               schema_cache_dir=schema_cache_dir)
+    
     elif args.files:
         # Load specific files
-        datasets = load_datasets_from_files(args.files)
+        datasets = load_datasets_from_files(args.files, create_loader(args), filters=args.filters,
+                                            schema_cache_dir=schema_cache_dir)
     
     else:
         # No input specified, use demo
         print("ℹ️ No input files specified, using demo data...")
         datasets = create_synthetic_datasets(args.rows, args.cols)
     
+    # Add baseline snapshots; the inputs are compared against their profiles
+    for snapshot in args.baselines or []:
+        profile = DatasetProfile.load(snapshot)
+        print(f"✅ Loaded baseline profile {profile.name} from {snapshot} ({len(profile):,} rows)")
+        datasets = {profile.name: profile, **datasets}
+    
     # Check if we have datasets
     if not datasets:
         print("❌ No datasets to compare!")
@@ -360,8 +581,19 @@ Examples:
     results, report_path = run_comparison(
         datasets, 
         output_dir, 
-        open_browser=not args.no_browser
+        open_browser=not args.no_browser,
+        schema_cache_dir=schema_cache_dir,
+        result_cache_dir=result_cache_dir,
+        analysis_workers=args.analysis_workers,
+        analysis_executor=args.analysis_executor,
+        stream=stream_loader is not None,
+        shard_loader=stream_loader if sharded else None,
+        save_profiles_dir=Path(args.save_profiles) if args.save_profiles else None,
+        shard_executor=(FileShardExecutor(args.shard_dir) if args.shard_dir
+                        else LocalShardExecutor(args.shards)) if sharded else None
     )
+    if stream_loader is not None:
+        stream_loader.close()
     
     print("\n" + "=" * 60)
     print("   ✅ Analysis Complete!")
@@ -0,0 +1,163 @@
+"""Tests for reading inputs with the DataLoader."""
+
+import json
+
+import numpy as np
+import pandas as pd
+
+from dataframe_comparison.data_loader import DataLoader
+from dataframe_comparison.statistics import StatisticalTester
+
+
+def test_chunked_load_reconciles_column_types(tmp_path):
+    # Codes look numeric in the first chunks and are text from the fourth
+    codes = [str(10 + i % 20) for i in range(3000)] + [f'A{i % 10}' for i in range(3000)]
+    path = tmp_path / 'codes.csv'
+    pd.DataFrame({'code': codes, 'value': np.arange(6000)}).to_csv(path, index=False)
+
+    df = DataLoader(chunksize=1000).load(path)
+
+    assert df['code'].map(type).eq(str).all()
+    assert df['code'].tolist() == codes
+    assert pd.api.types.is_integer_dtype(df['value'])
+    results = StatisticalTester().compare_categorical_distributions(df['code'][:4000], df['code'][2000:])
+    assert results
+
+
+def _fail_read_json(*args, **kwargs):
+    raise AssertionError("pd.read_json should not read this document")
+
+
+def test_nested_json_streamed_without_read_json(tmp_path, monkeypatch):
+    path = tmp_path / 'nested.json'
+    records = [{'id': i, 'user': {'name': f'u{i}', 'age': 20 + i}} for i in range(50)]
+    path.write_text(json.dumps(records))
+    monkeypatch.setattr(pd, 'read_json', _fail_read_json)
+
+    df = DataLoader(optimize_dtypes=False).load(path)
+
+    assert list(df.columns) == ['id', 'user_name', 'user_age']
+    assert df['user_age'].tolist() == [20 + i for i in range(50)]
+
+
+def test_large_json_array_streamed(tmp_path, monkeypatch):
+    path = tmp_path / 'flat.json'
+    path.write_text(json.dumps([{'id': i, 'name': f'n{i}'} for i in range(200)]))
+    loader = DataLoader(optimize_dtypes=False)
+
+    expected = loader.load(path)
+    loader.JSON_READ_MAX_BYTES = 1024
+    monkeypatch.setattr(pd, 'read_json', _fail_read_json)
+    streamed = loader.load(path)
+
+    pd.testing.assert_frame_equal(streamed, expected, check_dtype=False)
+
+
+def test_filter_values_cast_to_column_type(tmp_path):
+    from run_analysis import parse_filter
+
+    df = pd.DataFrame({'zip': ['007', '070', '7'], 'n': [1, 5, 10]})
+    df.to_csv(tmp_path / 'zips.csv', index=False)
+    df.to_parquet(tmp_path / 'zips.parquet')
+    loader = DataLoader()
+
+    assert parse_filter('zip==007') == ('zip', '==', '007')
+    for path, kwargs in ((tmp_path / 'zips.csv', {'dtype': {'zip': str}}), (tmp_path / 'zips.parquet', {})):
+        assert loader.load(path, filters=[parse_filter('zip==007')], **kwargs)['n'].tolist() == [1]
+        assert loader.load(path, filters=[parse_filter('n>=5')], **kwargs)['zip'].tolist() == ['070', '7']
+
+
+def _write_jsonl(path, records):
+    path.write_text(''.join(json.dumps(record) + '\n' for record in records))
+
+
+def test_jsonl_key_appearing_late_is_kept(tmp_path):
+    from dataframe_comparison.schema import SchemaMapper
+
+    _write_jsonl(tmp_path / 'a.jsonl', [{'id': i, 'amount': i * 2, **({'price': i / 2} if i >= 1500 else {})}
+                                        for i in range(2000)])
+    _write_jsonl(tmp_path / 'b.jsonl', [{'id': i, 'amount': i * 2, 'price': i / 2} for i in range(2000)])
+
+    datasets = DataLoader().load_multiple([tmp_path / 'a.jsonl', tmp_path / 'b.jsonl'], schema_mapper=SchemaMapper())
+
+    for df in datasets.values():
+        assert set(df.columns) == {'id', 'amount', 'price'}
+    assert datasets['a']['price'].notna().sum() == 500
+
+
+def test_projection_pushed_into_readers(tmp_path, monkeypatch):
+    df = pd.DataFrame({'id': range(100), 'amount': np.arange(100) * 1.5, 'note': ['x'] * 100})
+    df.to_csv(tmp_path / 'data.csv', index=False)
+    df.to_parquet(tmp_path / 'data.parquet')
+    _write_jsonl(tmp_path / 'data.jsonl', df.to_dict('records'))
+    calls = []
+
+    def spy(reader):
+        def wrapped(*args, **kwargs):
+            calls.append((reader.__name__, kwargs))
+            return reader(*args, **kwargs)
+        return wrapped
+
+    for reader in ('read_csv', 'read_parquet', 'read_json'):
+        monkeypatch.setattr(pd, reader, spy(getattr(pd, reader)))
+    loader = DataLoader(optimize_dtypes=False, json_batch_size=10)
+
+    for file_format in ('csv', 'parquet', 'jsonl'):
+        result = loader.load(tmp_path / f'data.{file_format}', columns=['id', 'amount'])
+        assert list(result.columns) == ['id', 'amount']
+        assert result['amount'].tolist() == df['amount'].tolist()
+
+    kwargs = {name: kw for name, kw in calls}
+    assert list(kwargs['read_csv']['usecols']) == ['id', 'amount']
+    assert list(kwargs['read_parquet']['columns']) == ['id', 'amount']
+    assert kwargs['read_json']['chunksize'] == 10
+
+
+def test_optimize_keeps_zero_padded_codes_outside_sample():
+    codes = pd.Series([str(100000 + i) for i in range(50000)], dtype=object)
+    codes[31337] = '012345'
+    loader = DataLoader()
+
+    optimized = loader._optimize_dtypes(pd.DataFrame({'code': codes}))
+
+    assert not pd.api.types.is_numeric_dtype(optimized['code'])
+    assert optimized['code'][31337] == '012345'
+    numbers = loader._optimize_dtypes(pd.DataFrame({'code': codes.drop(31337)}))
+    assert pd.api.types.is_integer_dtype(numbers['code'])
+
+
+def test_optimize_parses_iso_timestamps():
+    stamps = pd.Series(pd.date_range('2024-01-01', periods=20000, freq='min').strftime('%Y-%m-%dT%H:%M:%S'),
+                       dtype=object)
+    loader = DataLoader()
+
+    optimized = loader._optimize_dtypes(pd.DataFrame({'ts': stamps}))
+    assert pd.api.types.is_datetime64_any_dtype(optimized['ts'])
+    assert optimized['ts'].iloc[-1] == pd.Timestamp('2024-01-14T21:19:00')
+
+    # A value that is not a timestamp, outside the sample, keeps the column as text
+    stamps[12345] = 'not a date'
+    kept = loader._optimize_dtypes(pd.DataFrame({'ts': stamps}))
+    assert not pd.api.types.is_datetime64_any_dtype(kept['ts'])
+    assert kept['ts'][12345] == 'not a date'
+
+
+def test_ipc_load_is_zero_copy(tmp_path):
+    import pyarrow as pa
+
+    df = pd.DataFrame({'id': np.arange(1_000_000), 'value': np.random.default_rng(0).normal(size=1_000_000)})
+    df.to_feather(tmp_path / 'plain.feather', compression='uncompressed')
+    df.to_feather(tmp_path / 'zstd.feather', compression='zstd')
+    loader = DataLoader()
+
+    before = pa.total_allocated_bytes()
+    mapped = loader.load(tmp_path / 'plain.feather')
+    assert pa.total_allocated_bytes() - before < 1024 * 1024
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in mapped.dtypes)
+    assert mapped['value'].to_numpy().tolist() == df['value'].tolist()
+
+    # Compressed buffers are decompressed into memory
+    before = pa.total_allocated_bytes()
+    decompressed = loader.load(tmp_path / 'zstd.feather')
+    assert pa.total_allocated_bytes() - before >= df.memory_usage(index=False).sum()
+    del mapped, decompressed
@@ -0,0 +1,122 @@
+"""Tests for SQL pushdown of projections and filters."""
+
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from dataframe_comparison.data_loader import DataLoader
+from dataframe_comparison.database import SQLSource, build_query
+
+
+@pytest.fixture
+def connection():
+    conn = sqlite3.connect(':memory:')
+    conn.execute('CREATE TABLE sales (id INTEGER, region TEXT, amount REAL, "odd ""name""" TEXT)')
+    conn.executemany('INSERT INTO sales VALUES (?, ?, ?, ?)', [
+        (1, 'north', 10.0, 'a'),
+        (2, 'south', 20.0, 'b'),
+        (3, 'east', 30.0, 'c'),
+        (4, 'north', 40.0, 'd'),
+    ])
+    yield conn
+    conn.close()
+
+
+def test_projection_selects_only_requested_columns(connection):
+    source = SQLSource(connection, table='sales')
+
+    sql, params = build_query(source, columns=['amount', 'odd "name"'])
+    df = DataLoader(optimize_dtypes=False).load(source, columns=['amount', 'odd "name"'])
+
+    assert sql == 'SELECT "amount", "odd ""name""" FROM "sales"'
+    assert params == []
+    assert df.columns.tolist() == ['amount', 'odd "name"']
+    assert df['odd "name"'].tolist() == ['a', 'b', 'c', 'd']
+
+
+@pytest.mark.parametrize('filters, expected_ids', [
+    ([('region', '==', 'north')], [1, 4]),
+    ([('amount', '>', 15), ('amount', '<=', 30)], [2, 3]),
+    ([[('region', '==', 'east')], [('id', '==', 1)]], [1, 3]),
+    ([('region', 'in', ['south', 'east'])], [2, 3]),
+    ([('region', 'not in', ['north'])], [2, 3]),
+    ([('region', 'in', [])], []),
+    ([('region', 'not in', [])], [1, 2, 3, 4]),
+    ([[('region', 'in', [])], [('id', '!=', 2), ('amount', '>=', 30)]], [3, 4]),
+])
+def test_dnf_filters_match_rows_in_database(connection, filters, expected_ids):
+    source = SQLSource(connection, table='sales')
+
+    df = DataLoader(optimize_dtypes=False).load(source, columns=['id'], filters=filters)
+
+    assert sorted(df['id'].tolist()) == expected_ids
+
+
+def test_empty_in_filters_need_no_parameters():
+    source = SQLSource(None, table='sales')
+
+    sql, params = build_query(source, filters=[('region', 'in', []), ('id', 'not in', [])])
+
+    assert sql == 'SELECT * FROM "sales" WHERE (1 = 0 AND 1 = 1)'
+    assert params == []
+
+
+@pytest.mark.parametrize('paramstyle, where, params', [
+    ('qmark', '"id" > ? AND "region" IN (?, ?)', [1, 'north', 'east']),
+    ('numeric', '"id" > :1 AND "region" IN (:2, :3)', [1, 'north', 'east']),
+    ('named', '"id" > :p0 AND "region" IN (:p1, :p2)', {'p0': 1, 'p1': 'north', 'p2': 'east'}),
+    ('format', '"id" > %s AND "region" IN (%s, %s)', [1, 'north', 'east']),
+    ('pyformat', '"id" > %(p0)s AND "region" IN (%(p1)s, %(p2)s)',
+     {'p0': 1, 'p1': 'north', 'p2': 'east'}),
+])
+def test_placeholders_follow_paramstyle(paramstyle, where, params):
+    source = SQLSource(None, table='sales')
+    filters = [('id', '>', 1), ('region', 'in', ['north', 'east'])]
+
+    sql, values = build_query(source, filters=filters, paramstyle=paramstyle)
+
+    assert sql == f'SELECT * FROM "sales" WHERE ({where})'
+    assert values == params
+
+
+@pytest.mark.parametrize('paramstyle', ['qmark', 'numeric', 'named'])
+def test_rendered_placeholders_run_in_sqlite(connection, paramstyle):
+    source = SQLSource(connection, table='sales', paramstyle=paramstyle)
+
+    df = DataLoader(optimize_dtypes=False).load(
+        source, columns=['id'], filters=[('id', '>', 1), ('region', 'in', ['north', 'east'])]
+    )
+
+    assert sorted(df['id'].tolist()) == [3, 4]
+
+
+def test_unsupported_paramstyle_and_operator_are_rejected():
+    source = SQLSource(None, table='sales')
+
+    with pytest.raises(ValueError, match='paramstyle'):
+        build_query(source, filters=[('id', '>', 1)], paramstyle='dollar')
+    with pytest.raises(ValueError, match='operator'):
+        build_query(source, filters=[('id', 'like', 'x%')])
+
+
+def test_query_source_columns_and_pushdown(connection):
+    source = SQLSource(connection, query='SELECT id, amount * 2 AS doubled FROM sales')
+    loader = DataLoader(optimize_dtypes=False)
+
+    columns = loader.read_columns(source)
+    df = loader.load(source, columns=['doubled'], filters=[('doubled', '>=', 60)])
+
+    assert columns == ['id', 'doubled']
+    assert df.columns.tolist() == ['doubled']
+    assert sorted(df['doubled'].tolist()) == [60.0, 80.0]
+
+
+def test_table_source_columns_fetch_no_rows(connection):
+    executed = []
+    connection.set_trace_callback(executed.append)
+
+    columns = DataLoader().read_columns(SQLSource(connection, table='sales'))
+
+    assert columns == ['id', 'region', 'amount', 'odd "name"']
+    assert executed == ['SELECT * FROM "sales" WHERE 1 = 0']
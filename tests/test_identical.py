@@ -0,0 +1,79 @@
+"""Tests for detecting identical datasets and fields."""
+
+import numpy as np
+import pandas as pd
+
+from dataframe_comparison import DataFrameComparison
+from dataframe_comparison.columns import ColumnStore
+from dataframe_comparison.statistics import StatisticalTester
+
+
+def _frame(n_rows=5000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'value': rng.normal(size=n_rows),
+        'region': rng.choice(['North', 'South'], n_rows),
+    })
+
+
+def _near_copy(df):
+    # One value changed on a row the probe does not sample
+    changed = df.copy()
+    changed.loc[1, 'value'] += 1e-9
+    return changed
+
+
+def test_identical_datasets_grouped():
+    a = _frame()
+    datasets = {'a': a, 'b': a.copy(), 'near': _near_copy(a), 'c': _frame(seed=1), 'd': a.copy(),
+                'short': a.iloc[:-1]}
+
+    identical = DataFrameComparison()._identical_datasets(ColumnStore(datasets))
+
+    assert identical == [['a', 'b', 'd']]
+
+
+def test_only_candidate_datasets_fingerprinted(monkeypatch):
+    a = _frame()
+    datasets = {'a': a, 'short': a.iloc[:-1], 'float32': a.astype({'value': np.float32}), 'other': _frame(seed=1)}
+    store = ColumnStore(datasets)
+    hashed = []
+    content_hash = store.content_hash
+    monkeypatch.setattr(store, 'content_hash', lambda name, column: hashed.append(name) or content_hash(name, column))
+
+    assert DataFrameComparison()._identical_datasets(store) == []
+    assert hashed == []
+
+
+def test_identical_fields_exclude_near_identical_columns():
+    a = _frame()
+    store = ColumnStore({'a': a, 'near': _near_copy(a)})
+
+    identical = DataFrameComparison()._identical_fields(store, ['value', 'region'])
+
+    assert identical == ['region']
+
+
+def test_compare_identical_reports_one_result():
+    values = np.random.default_rng(0).normal(size=1000)
+
+    results = StatisticalTester().compare_identical(3, values)
+
+    assert results[0].test_name == 'Identical Columns'
+    assert not results[0].significant and results[0].metadata == {'identical': True}
+    assert len(results) == 4
+    assert all(r.test_name.startswith('Anderson-Darling') for r in results[1:])
+    assert len(StatisticalTester().compare_identical(2)) == 1
+
+
+def test_compare_datasets_skips_identical_fields(tmp_path):
+    a = _frame()
+    b = a.copy()
+    b['value'] = _frame(seed=1)['value']
+
+    results = DataFrameComparison().compare_datasets({'a': a, 'b': b}, output_path=str(tmp_path / 'report.html'))
+
+    tests = {r['field']: [t.test_name for t in r['tests']] for r in results['test_results']}
+    assert tests['region'] == ['Identical Columns']
+    assert 'Kolmogorov-Smirnov Test' in tests['value']
+    assert results['identical_datasets'] == []
@@ -0,0 +1,51 @@
+"""Tests for streaming dataset profiles."""
+
+import logging
+
+import numpy as np
+import pandas as pd
+
+from dataframe_comparison.profiling import DatasetProfile
+from dataframe_comparison.schema import DataType
+
+
+def _chunks():
+    # 'note' has no values in the first chunk, so it is read as float64
+    yield pd.DataFrame({'id': [1, 2, 3], 'note': [np.nan] * 3})
+    yield pd.DataFrame({'id': [4, 5, 6], 'note': ['a', 'b', None]})
+
+
+def test_field_typed_by_first_chunk_with_values():
+    profile = DatasetProfile.from_chunks('data', _chunks())
+
+    note = profile.fields['note']
+    assert note.data_type == DataType.CATEGORICAL
+    assert note.count == 2
+    assert note.null_count == 4
+    assert profile.dtypes['note'] != 'float64'
+    assert profile.columns == ['id', 'note']
+    assert list(profile.correlation_matrix().columns) == ['id']
+
+
+def test_merge_types_fields_without_values():
+    first, second = _chunks()
+    merged = DatasetProfile.from_chunks('data', [first]).merge(DatasetProfile.from_chunks('data', [second]))
+    reverse = DatasetProfile.from_chunks('data', [second]).merge(DatasetProfile.from_chunks('data', [first]))
+
+    for profile in (merged, reverse):
+        assert profile.fields['note'].data_type == DataType.CATEGORICAL
+        assert profile.fields['note'].count == 2
+        assert profile.fields['note'].null_count == 4
+
+
+def test_numeric_coercion_warns(caplog):
+    profile = DatasetProfile('data', {'value': DataType.NUMERIC})
+
+    with caplog.at_level(logging.WARNING):
+        profile.update(pd.DataFrame({'value': ['1.5', 'n/a', '3']}))
+        profile.update(pd.DataFrame({'value': ['x', '2']}))
+
+    field = profile.fields['value']
+    assert field.count == 3
+    assert field.ignored == 2
+    assert sum('non-numeric values are ignored' in r.message for r in caplog.records) == 1
@@ -0,0 +1,114 @@
+"""Tests for reusing cached test results across comparison runs."""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from dataframe_comparison import DataFrameComparison
+from dataframe_comparison import core
+from dataframe_comparison.cache import ResultCache
+
+
+def _frame(n_rows=2000, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'value': rng.normal(size=n_rows),
+        'amount': rng.exponential(size=n_rows),
+        'region': rng.choice(['North', 'South', 'East'], n_rows),
+    })
+
+
+def _spy(monkeypatch):
+    analyzed, heatmaps = [], []
+    analyze_field = core._analyze_field
+
+    def record_field(field, *args, **kwargs):
+        analyzed.append(field)
+        return analyze_field(field, *args, **kwargs)
+
+    heatmap = core.VisualizationEngine.create_correlation_heatmap
+
+    def record_heatmap(self, df, title):
+        heatmaps.append(title)
+        return heatmap(self, df, title)
+
+    monkeypatch.setattr(core, '_analyze_field', record_field)
+    monkeypatch.setattr(core.VisualizationEngine, 'create_correlation_heatmap', record_heatmap)
+    return analyzed, heatmaps
+
+
+def _tests(results):
+    return {r['field']: [(t.test_name, t.p_value) for t in r['tests']] for r in results['test_results']}
+
+
+def test_rerun_recomputes_only_changed_field(tmp_path, monkeypatch):
+    a, b = _frame(), _frame(seed=1)
+    cache_dir = str(tmp_path / 'results')
+    output = str(tmp_path / 'report.html')
+    analyzed, heatmaps = _spy(monkeypatch)
+
+    first = DataFrameComparison(result_cache_dir=cache_dir).compare_datasets({'a': a, 'b': b}, output_path=output)
+    assert sorted(analyzed) == ['amount', 'region', 'value']
+    assert heatmaps == ['Correlation Matrix: a', 'Correlation Matrix: b']
+
+    analyzed.clear()
+    heatmaps.clear()
+    changed = b.copy()
+    changed['amount'] = changed['amount'] * 2
+    second = DataFrameComparison(result_cache_dir=cache_dir).compare_datasets(
+        {'a': a, 'b': changed}, output_path=output
+    )
+
+    assert analyzed == ['amount']
+    assert heatmaps == ['Correlation Matrix: b']
+    first_tests, second_tests = _tests(first), _tests(second)
+    assert list(second_tests) == list(first_tests)
+    assert second_tests['value'] == first_tests['value']
+    assert second_tests['region'] == first_tests['region']
+    assert second_tests['amount'] != first_tests['amount']
+    assert len(second['distribution_plots']) == 3
+    assert len(second['correlation_plots']) == 2
+
+
+def test_unchanged_rerun_recomputes_nothing(tmp_path, monkeypatch):
+    datasets = {'a': _frame(), 'b': _frame(seed=1)}
+    cache_dir = str(tmp_path / 'results')
+    output = str(tmp_path / 'report.html')
+    analyzed, heatmaps = _spy(monkeypatch)
+
+    first = DataFrameComparison(result_cache_dir=cache_dir).compare_datasets(datasets, output_path=output)
+    analyzed.clear()
+    heatmaps.clear()
+    second = DataFrameComparison(result_cache_dir=cache_dir).compare_datasets(datasets, output_path=output)
+
+    assert analyzed == [] and heatmaps == []
+    assert _tests(second) == _tests(first)
+    assert [p.to_plotly_json() for p in second['correlation_plots']] == \
+        [p.to_plotly_json() for p in first['correlation_plots']]
+
+
+def test_unreadable_entry_is_a_miss(tmp_path):
+    cache = ResultCache(tmp_path)
+    key = cache.key('field', 'value')
+    cache.put(key, {'outcome': None})
+    (tmp_path / f"{key}{ResultCache.SUFFIX}").write_bytes(b'not a pickle')
+
+    assert cache.get(key) is None
+    assert not (tmp_path / f"{key}{ResultCache.SUFFIX}").exists()
+
+
+def test_least_recently_used_entries_evicted(tmp_path):
+    cache = ResultCache(tmp_path, max_bytes=2500)
+    keys = [cache.key('entry', i) for i in range(3)]
+    for i, key in enumerate(keys[:2]):
+        cache.put(key, b'x' * 1000)
+        os.utime(tmp_path / f"{key}{ResultCache.SUFFIX}", (i, i))
+    # Reading the oldest entry makes the other one least recently used
+    assert cache.get(keys[0]) is not None
+
+    cache.put(keys[2], b'x' * 1000)
+
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
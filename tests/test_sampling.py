@@ -0,0 +1,88 @@
+"""Tests for load-time sampling."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dataframe_comparison.data_loader import DataLoader, SamplingConfig
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    n = 2000
+    # Stratum 'rare' has fewer rows than the per-stratum size
+    segments = np.where(np.arange(n) % 100 == 0, 'rare', np.where(np.arange(n) % 3 == 0, 'a', 'b'))
+    path = tmp_path / 'rows.csv'
+    pd.DataFrame({'row': np.arange(n), 'segment': segments}).to_csv(path, index=False)
+    return path
+
+
+@pytest.mark.parametrize('sampling', [
+    SamplingConfig(size=150, seed=7),
+    SamplingConfig(fraction=0.1, seed=7),
+    SamplingConfig(size=40, stratify_by='segment', seed=7),
+], ids=lambda sampling: sampling.method)
+def test_same_seed_gives_same_rows_for_any_chunksize(csv_path, sampling):
+    samples = [
+        DataLoader(chunksize=chunksize).load(csv_path, sampling=sampling)['row'].tolist()
+        for chunksize in (97, 500, 5000)
+    ]
+
+    assert samples[0] == samples[1] == samples[2]
+    assert samples[0] == sorted(samples[0])
+    other_seed = SamplingConfig(size=sampling.size, fraction=sampling.fraction,
+                                stratify_by=sampling.stratify_by, seed=8)
+    assert DataLoader(chunksize=500).load(csv_path, sampling=other_seed)['row'].tolist() != samples[0]
+
+
+def test_reservoir_keeps_size_rows(csv_path):
+    df = DataLoader(chunksize=300).load(csv_path, sampling=SamplingConfig(size=150))
+
+    assert len(df) == 150
+    assert df['row'].is_unique
+    # Rows come from the whole file, not only the first chunks
+    assert df['row'].max() > 1500
+
+
+def test_reservoir_larger_than_input_keeps_every_row(csv_path):
+    df = DataLoader(chunksize=300).load(csv_path, sampling=SamplingConfig(size=5000))
+
+    assert df['row'].tolist() == list(range(2000))
+
+
+def test_stratified_sample_caps_each_stratum(csv_path):
+    df = DataLoader(chunksize=300).load(
+        csv_path, columns=['row'], sampling=SamplingConfig(size=40, stratify_by='segment')
+    )
+    segments = pd.read_csv(csv_path).set_index('row')['segment']
+
+    counts = segments[df['row']].value_counts()
+    assert df.columns.tolist() == ['row']
+    assert counts.to_dict() == {'a': 40, 'b': 40, 'rare': 20}
+
+
+def test_sampling_attrs_describe_the_sample(csv_path):
+    sampling = SamplingConfig(fraction=0.25, seed=3)
+
+    df = DataLoader(chunksize=300).load(csv_path, sampling=sampling)
+
+    assert df.attrs['sampling'] == {
+        'method': 'bernoulli',
+        'rows_read': 2000,
+        'sample_size': len(df),
+        'size': None,
+        'fraction': 0.25,
+        'stratify_by': None,
+        'seed': 3
+    }
+    assert 400 < len(df) < 600
+
+
+def test_filters_apply_before_sampling(csv_path):
+    df = DataLoader(chunksize=300).load(
+        csv_path, filters=[('segment', '==', 'a')], sampling=SamplingConfig(size=50)
+    )
+
+    assert len(df) == 50
+    assert set(df['segment']) == {'a'}
+    assert df.attrs['sampling']['rows_read'] == (pd.read_csv(csv_path)['segment'] == 'a').sum()
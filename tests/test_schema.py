@@ -0,0 +1,146 @@
+"""Tests for column name standardization."""
+
+import random
+import string
+from difflib import SequenceMatcher
+
+import pandas as pd
+
+from dataframe_comparison.schema import DataType, FieldMapping, SchemaMapper, _FuzzyIndex
+
+
+def _mapper():
+    return SchemaMapper([FieldMapping('customer_id', ['cust_id', 'customerid'])])
+
+
+def test_standardize_dataframe_returns_independent_copy():
+    df = pd.DataFrame({'cust_id': [1, 2, 3], 'amount': [1.0, 2.0, 3.0]})
+
+    standardized = _mapper().standardize_dataframe(df)
+    standardized.loc[0, 'amount'] = 100.0
+    standardized.loc[0, 'customer_id'] = 100
+
+    assert list(standardized.columns) == ['customer_id', 'amount']
+    assert df['amount'].tolist() == [1.0, 2.0, 3.0]
+    assert df['cust_id'].tolist() == [1, 2, 3]
+    assert list(df.columns) == ['cust_id', 'amount']
+
+
+def test_standardize_with_mapping_relabels_only():
+    df = pd.DataFrame({'cust_id': [1, 2, 3], 'amount': [1.0, 2.0, 3.0]})
+
+    standardized, rename_map = _mapper().standardize_with_mapping(df)
+
+    assert rename_map == {'cust_id': 'customer_id'}
+    assert list(standardized.columns) == ['customer_id', 'amount']
+    assert list(df.columns) == ['cust_id', 'amount']
+    pd.testing.assert_frame_equal(standardized.set_axis(df.columns, axis=1), df)
+
+
+def _scan(mapper, column_name, threshold):
+    """Best match by scoring every candidate, as SchemaMapper did before indexing them"""
+    best_score, best_match = 0, None
+    candidates = [(name.lower(), name) for name in mapper.standard_fields] + list(mapper.mapping_dict.items())
+    for candidate, standard_name in candidates:
+        score = SequenceMatcher(None, column_name, candidate).ratio()
+        if score > best_score and score >= threshold:
+            best_score, best_match = score, standard_name
+    return best_match
+
+
+def test_fuzzy_index_matches_full_scan():
+    from run_analysis import create_schema_mappings
+
+    mapper = SchemaMapper(create_schema_mappings())
+    rng = random.Random(0)
+    names = list(mapper.mapping_dict) + [n.lower() for n in mapper.standard_fields]
+    perturbed = []
+    for _ in range(200):
+        name = list(rng.choice(names))
+        for _ in range(rng.randint(0, 3)):
+            i = rng.randrange(len(name) + 1)
+            op = rng.choice('ids')
+            if op == 'i':
+                name.insert(i, rng.choice(string.ascii_lowercase + '_'))
+            elif name and i < len(name):
+                if op == 'd':
+                    del name[i]
+                else:
+                    name[i] = rng.choice(string.ascii_lowercase + '_')
+        perturbed.append(''.join(name))
+
+    for name in perturbed:
+        for threshold in (0.6, 0.8):
+            assert mapper._find_best_match(name, threshold) == _scan(mapper, name, threshold), (name, threshold)
+
+
+def test_fuzzy_index_ties_and_threshold_edges():
+    # 'amountx' scores 12/14 against both 'amounty' and 'amounts'; the first listed wins
+    for first, second in (('total', 'sum'), ('sum', 'total')):
+        mapper = SchemaMapper([FieldMapping(first, ['amounty']), FieldMapping(second, ['amounts'])])
+        assert mapper._find_best_match('amountx', 0.8) == _scan(mapper, 'amountx', 0.8) == first
+
+    # 'abcd' vs 'abce' scores exactly 0.75: matched at the threshold, not above it
+    mapper = SchemaMapper([FieldMapping('letters', ['abce'])])
+    assert mapper._find_best_match('abcd', 0.75) == _scan(mapper, 'abcd', 0.75) == 'letters'
+    assert mapper._find_best_match('abcd', 0.76) is _scan(mapper, 'abcd', 0.76) is None
+
+
+def test_fuzzy_index_memo_is_bounded(monkeypatch):
+    monkeypatch.setattr(_FuzzyIndex, 'MEMO_SIZE', 10)
+    mapper = SchemaMapper([FieldMapping('customer_id', ['cust_id'])])
+
+    for i in range(50):
+        mapper._find_best_match(f'column_{i}', 0.8)
+
+    assert len(mapper._fuzzy_index.memo) == 10
+    assert ('column_49', 0.8) in mapper._fuzzy_index.memo
+
+
+def _cached_mapper(cache_dir, aliases=('cust_id', 'customerid'), data_type='unknown'):
+    return SchemaMapper([FieldMapping('customer_id', list(aliases), data_type)], cache_dir=cache_dir)
+
+
+def test_mapping_cache_entries_record_fuzzy_renames(tmp_path):
+    mapper = _cached_mapper(tmp_path)
+
+    rename_map = mapper.resolve_columns(['cust_idx', 'customerid', 'amount'])
+
+    entries = list(mapper.mapping_cache.entries())
+    assert rename_map == {'cust_idx': 'customer_id', 'customerid': 'customer_id'}
+    assert len(entries) == 1
+    assert entries[0]['columns'] == ['cust_idx', 'customerid', 'amount']
+    assert entries[0]['rename_map'] == rename_map
+    assert entries[0]['fuzzy_matches'] == {'cust_idx': 'customer_id'}
+    assert entries[0]['config_fingerprint'] == mapper.config_fingerprint
+
+
+def test_editing_field_mapping_invalidates_cached_mappings(tmp_path, monkeypatch):
+    columns = ['cust_idx', 'amount']
+    _cached_mapper(tmp_path).resolve_columns(columns)
+    _cached_mapper(tmp_path).record_data_types(columns, {'amount': DataType.NUMERIC})
+
+    # An unchanged config is served from the cache without fuzzy matching
+    reloaded = _cached_mapper(tmp_path)
+    monkeypatch.setattr(reloaded, '_find_best_match', _fail_find_best_match)
+    assert reloaded.resolve_columns(columns) == {'cust_idx': 'customer_id'}
+    assert reloaded.cached_data_types(columns) == {'amount': DataType.NUMERIC}
+
+    fingerprints = {reloaded.config_fingerprint}
+    for edited in (_cached_mapper(tmp_path, aliases=('cust_id', 'customerid', 'cust_idx')),
+                   _cached_mapper(tmp_path, aliases=('cust_id',)),
+                   _cached_mapper(tmp_path, data_type='numeric')):
+        assert edited.config_fingerprint not in fingerprints
+        fingerprints.add(edited.config_fingerprint)
+        assert edited.cached_data_types(columns) == {}
+        assert edited.resolve_columns(columns) == {'cust_idx': 'customer_id'}
+
+    entries = {entry['config_fingerprint']: entry for entry in reloaded.mapping_cache.entries()}
+    assert set(entries) == fingerprints
+    # The new alias turned the fuzzy rename into an exact one
+    assert entries[reloaded.config_fingerprint]['fuzzy_matches'] == {'cust_idx': 'customer_id'}
+    assert [entry['fuzzy_matches'] for entry in entries.values()].count({}) == 1
+
+
+def _fail_find_best_match(*args, **kwargs):
+    raise AssertionError("cached mapping should not be fuzzy matched again")
@@ -0,0 +1,162 @@
+"""Tests for splitting inputs into shards."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dataframe_comparison import DataFrameComparison
+from dataframe_comparison.data_loader import DataLoader
+from dataframe_comparison.profiling import DatasetProfile
+from dataframe_comparison.sharding import (FileShardExecutor, LocalShardExecutor, ShardExecutor, ShardTask,
+                                           merge_profiles)
+
+
+def _read_shards(loader, path, n_shards, **kwargs):
+    shards = loader.plan_shards(path, n_shards, chunksize=500, **kwargs)
+    chunks = [chunk for shard in shards for chunk in loader.iter_shard(shard, optimize_dtypes=False)]
+    return shards, pd.concat(chunks, ignore_index=True)
+
+
+def test_csv_shards_skip_quoted_line_breaks(tmp_path):
+    rng = np.random.default_rng(0)
+    n_rows = 5000
+    df = pd.DataFrame({
+        'id': np.arange(n_rows),
+        'note': [f'line one\nline "two"\n{i}' if i % 3 else f'plain {i}' for i in range(n_rows)],
+        'value': rng.normal(size=n_rows),
+    })
+    path = tmp_path / 'quoted.csv'
+    df.to_csv(path, index=False)
+
+    shards, result = _read_shards(DataLoader(), path, 8)
+
+    assert len(shards) == 8
+    pd.testing.assert_frame_equal(result, df)
+
+
+def test_csv_shards_without_quotes(tmp_path):
+    df = pd.DataFrame({'id': np.arange(3000), 'name': [f'n{i}' for i in range(3000)]})
+    path = tmp_path / 'plain.csv'
+    df.to_csv(path, index=False)
+
+    shards, result = _read_shards(DataLoader(), path, 4)
+
+    assert len(shards) == 4
+    pd.testing.assert_frame_equal(result, df)
+
+
+def _dataset(n_rows=20000):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'id': np.arange(n_rows),
+        'value': rng.normal(size=n_rows) * 100,
+        'score': np.where(rng.random(n_rows) < 0.1, np.nan, rng.exponential(size=n_rows)),
+        'region': rng.choice(['North', 'South', 'East', 'West'], n_rows),
+    })
+
+
+def _assert_same_profile(merged, single):
+    assert merged.row_count == single.row_count
+    assert merged.columns == single.columns
+    for col in single.columns:
+        a, b = merged.fields[col], single.fields[col]
+        assert (a.data_type, a.count, a.null_count) == (b.data_type, b.count, b.null_count), col
+        if b.moments is not None:
+            assert a.moments.n == b.moments.n
+            assert (a.moments.min, a.moments.max) == (b.moments.min, b.moments.max)
+            assert a.moments.mean == pytest.approx(b.moments.mean, rel=1e-9, abs=1e-12)
+            assert a.moments.variance == pytest.approx(b.moments.variance, rel=1e-9)
+            assert (a.histogram.exponent, a.histogram.offset) == (b.histogram.exponent, b.histogram.offset)
+            np.testing.assert_array_equal(a.histogram.counts, b.histogram.counts)
+            assert (a.sketch.n, a.sketch.min, a.sketch.max) == (b.sketch.n, b.sketch.min, b.sketch.max)
+        if b.categories is not None:
+            assert a.categories.counts == b.categories.counts
+    pd.testing.assert_frame_equal(merged.correlation_matrix(), single.correlation_matrix(), rtol=1e-9)
+
+
+@pytest.mark.parametrize('file_format', ['csv', 'parquet', 'feather'])
+@pytest.mark.parametrize('executor', ['serial', 'processes', 'directory'])
+def test_merged_shard_profiles_match_single_pass(tmp_path, file_format, executor):
+    df = _dataset()
+    path = tmp_path / f'data.{file_format}'
+    if file_format == 'csv':
+        df.to_csv(path, index=False)
+    elif file_format == 'feather':
+        df.to_feather(path, chunksize=1500)
+    else:
+        df.to_parquet(path, row_group_size=1500)
+    loader = DataLoader()
+
+    single = DatasetProfile.from_chunks('data', loader.iter_chunks(path, 1000))
+    shards = loader.plan_shards(path, 4, chunksize=1000)
+    tasks = [ShardTask('data', shard, loader, field_types=single.typed_fields()) for shard in shards]
+    shard_executor = {
+        'serial': LocalShardExecutor(1),
+        'processes': LocalShardExecutor(2),
+        'directory': FileShardExecutor(tmp_path / 'shards', poll_interval=0.01),
+    }[executor]
+    merged = merge_profiles(shard_executor.map(tasks))
+
+    assert len(shards) == 4
+    _assert_same_profile(merged, single)
+
+
+def test_compare_shards_matches_compare_streams(tmp_path):
+    # As run_analysis a.csv b.parquet --stream --shards 4 versus --stream
+    df = _dataset()
+    df.to_csv(tmp_path / 'a.csv', index=False)
+    df.assign(value=df['value'] + 1).to_parquet(tmp_path / 'b.parquet', row_group_size=1500)
+    paths = [tmp_path / 'a.csv', tmp_path / 'b.parquet']
+    loader = DataLoader(chunksize=1000)
+    comparison = DataFrameComparison()
+
+    streamed = comparison.compare_streams(loader.iter_multiple(paths, names=['a', 'b']),
+                                          output_path=str(tmp_path / 'streamed.html'))
+    sharded = comparison.compare_shards(loader.plan_multiple(paths, 4, names=['a', 'b']), loader,
+                                        output_path=str(tmp_path / 'sharded.html'),
+                                        shard_executor=LocalShardExecutor(2))
+
+    for name in ('a', 'b'):
+        _assert_same_profile(sharded['datasets'][name], streamed['datasets'][name])
+    assert sharded['common_fields'] == streamed['common_fields']
+
+
+def test_shard_executor_is_abstract():
+    with pytest.raises(TypeError):
+        ShardExecutor()
+
+
+class _RecordingReader:
+    """IPC file reader wrapper recording which batches are read"""
+
+    def __init__(self, reader):
+        self.reader = reader
+        self.schema = reader.schema
+        self.read = []
+
+    def get_batch(self, i):
+        self.read.append(i)
+        return self.reader.get_batch(i)
+
+    def read_all(self):
+        raise AssertionError("a shard should not read the whole file")
+
+
+def test_compressed_feather_shards_read_only_their_batches(tmp_path, monkeypatch):
+    df = _dataset()
+    path = tmp_path / 'data.feather'
+    df.to_feather(path, compression='zstd', chunksize=1000)
+    loader = DataLoader()
+    shards = loader.plan_shards(path, 4, chunksize=700)
+
+    readers = []
+    open_reader = loader._ipc_reader
+    monkeypatch.setattr(loader, '_ipc_reader', lambda file_path: readers.append(_RecordingReader(open_reader(file_path)))
+                        or readers[-1])
+    parts = [pd.concat(list(loader.iter_shard(shard))) for shard in shards]
+
+    assert [shard.batches for shard in shards] == [list(range(0, 5)), list(range(5, 10)), list(range(10, 15)),
+                                                   list(range(15, 20))]
+    assert [reader.read for reader in readers] == [shard.batches for shard in shards]
+    result = pd.concat(parts, ignore_index=True)
+    assert result['id'].tolist() == df['id'].tolist()
@@ -0,0 +1,56 @@
+"""Tests for the mergeable sketches."""
+
+import numpy as np
+
+from dataframe_comparison.sketches import Histogram
+
+
+def test_histogram_merge_disjoint_ranges():
+    a = Histogram(256)
+    a.update(np.arange(0, 20000, dtype=float))
+    b = Histogram(256)
+    b.update(np.arange(1e6, 1e6 + 20000))
+
+    a.merge(b)
+
+    assert a.counts.sum() == 40000
+    assert len(a.counts) <= 256
+    edges = a.edges()
+    assert edges[0] <= 0 and edges[-1] > 1e6 + 20000
+
+
+def test_histogram_merge_into_wider_range():
+    a = Histogram(256)
+    a.update(np.arange(1e6, 1e6 + 20000))
+    b = Histogram(256)
+    b.update(np.arange(-5, 5, dtype=float))
+
+    a.merge(b)
+
+    assert a.counts.sum() == 20010
+    assert len(a.counts) <= 256
+
+
+def test_histogram_merge_matches_single_pass():
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=10000) * 1000
+    whole = Histogram(64)
+    whole.update(values)
+    merged = Histogram(64)
+    for part in np.array_split(values, 7):
+        partial = Histogram(64)
+        partial.update(part)
+        merged.merge(partial)
+
+    assert merged.exponent == whole.exponent
+    assert merged.offset == whole.offset
+    np.testing.assert_array_equal(merged.counts, whole.counts)
+
+
+def test_histogram_outlier_does_not_allocate_fine_bins():
+    h = Histogram(256)
+    h.update(np.linspace(0, 1, 1000))
+    h.update(np.array([1e9]))
+
+    assert h.counts.sum() == 1001
+    assert len(h.counts) <= 256
@@ -0,0 +1,45 @@
+"""Tests for comparing datasets against saved profile snapshots."""
+
+import numpy as np
+import pandas as pd
+
+from dataframe_comparison import DataFrameComparison
+from dataframe_comparison.profiling import DatasetProfile
+
+
+def _frame(rng, n_rows):
+    return pd.DataFrame({
+        'value': rng.normal(size=n_rows),
+        'region': rng.choice(['North', 'South', 'East', 'West'], n_rows),
+    })
+
+
+def test_snapshot_same_distribution_not_flagged(tmp_path):
+    rng = np.random.default_rng(0)
+    comparison = DataFrameComparison()
+    comparison.create_profile('baseline', _frame(rng, 3_000_000)).save(tmp_path / 'baseline.profile')
+
+    baseline = DatasetProfile.load(tmp_path / 'baseline.profile')
+    results = comparison.compare_datasets({'baseline': baseline, 'batch': _frame(rng, 300_000)},
+                                          output_path=str(tmp_path / 'report.html'))
+
+    tests = {r['field']: r['tests'] for r in results['test_results']}
+    assert set(tests) == {'value', 'region'}
+    for test in tests['value'] + tests['region']:
+        if not test.test_name.startswith('Anderson-Darling'):
+            assert not test.significant, (test.test_name, test.p_value)
+
+
+def test_snapshot_shift_flagged(tmp_path):
+    rng = np.random.default_rng(1)
+    comparison = DataFrameComparison()
+    baseline = comparison.create_profile('baseline', _frame(rng, 1_000_000))
+    batch = _frame(rng, 100_000)
+    batch['value'] += 0.5
+
+    results = comparison.compare_datasets({'baseline': baseline, 'batch': batch},
+                                          output_path=str(tmp_path / 'report.html'))
+
+    value_tests = next(r['tests'] for r in results['test_results'] if r['field'] == 'value')
+    ks = next(t for t in value_tests if t.test_name == 'Kolmogorov-Smirnov Test')
+    assert ks.significant
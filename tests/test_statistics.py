@@ -0,0 +1,46 @@
+"""Tests for the statistical tests run on profiles."""
+
+import numpy as np
+import pandas as pd
+
+from dataframe_comparison.profiling import FieldProfile, ProfileConfig
+from dataframe_comparison.schema import DataType
+from dataframe_comparison.statistics import StatisticalTester
+
+
+def _numeric_profile(rng, n_rows, seed, chunk_rows=100_000):
+    profile = FieldProfile.create('x', DataType.NUMERIC, ProfileConfig(seed=seed))
+    for start in range(0, n_rows, chunk_rows):
+        profile.update(pd.Series(rng.normal(size=min(chunk_rows, n_rows - start))))
+    return profile
+
+
+def test_profile_tests_calibrated_on_iid_data():
+    rng = np.random.default_rng(0)
+    tester = StatisticalTester()
+    p_values = {'Kolmogorov-Smirnov Test': [], 'Kruskal-Wallis Test': []}
+    for trial in range(20):
+        a = _numeric_profile(rng, 1_000_000, seed=2 * trial)
+        b = _numeric_profile(rng, 1_000_000, seed=2 * trial + 1)
+        for result in tester.compare_numeric_profiles(a, b):
+            if result.test_name in p_values:
+                p_values[result.test_name].append(result.p_value)
+
+    for name, values in p_values.items():
+        assert len(values) == 20
+        # Same distribution: p-values are uniform, so at most a few of 20
+        # fall below 0.05 and none is extreme
+        assert sum(p < 0.05 for p in values) <= 4, name
+        assert min(values) > 1e-4, name
+
+
+def test_profile_tests_detect_shift():
+    rng = np.random.default_rng(1)
+    a = _numeric_profile(rng, 200_000, seed=0)
+    b = FieldProfile.create('x', DataType.NUMERIC, ProfileConfig(seed=1))
+    b.update(pd.Series(rng.normal(loc=0.5, size=200_000)))
+
+    results = StatisticalTester().compare_numeric_profiles(a, b)
+
+    ks = next(r for r in results if r.test_name == 'Kolmogorov-Smirnov Test')
+    assert ks.significant